@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Бенчмарки горячих путей FA_dict.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_fa_dict.py [--transitions 100000] [--length 1000]
+
+accept_FA сравнивается с прежней реализацией, искавшей номер
+сработавшего перехода через _order.index (O(T) на символ), is_complete -
+с вариантом без кэша замыканий _all_states/_all_inputs, доступ к
+transitionList по индексу - с построением нового списка при каждом обращении,
+from_arrays - с загрузкой тех же переходов через сеттер transitionList.
+"""
+
+from __future__ import annotations
+
+import argparse
+from array import array
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.FA_dict import FA_dict  # noqa: E402
+
+
+def build_dfa(transitions: int, inputs: int = 4, seed: int = 0) -> FA_dict:
+    """
+    Строит случайный полный DFA с заданным числом переходов.
+    """
+    rng = random.Random(seed)
+    states = max(1, transitions // inputs)
+    fa = FA_dict()
+    fa.initialState = 0
+    for state in range(states):
+        for symbol in range(inputs):
+            fa._add_transition(state, symbol, rng.randrange(states))
+    fa.finalStates = set(range(0, states, 3))
+    fa._sync_declared_sizes()
+    return fa
+
+
+def accept_with_index_scan(fa: FA_dict, word) -> tuple[bool, list[int]]:
+    """
+    Прежний вариант accept_FA: номер перехода ищется линейно в _order.
+    """
+    state = fa.initialState
+    fired = []
+    for symbol in word:
+        key = fa._lookup_key(state, symbol)
+        fired.append(fa._order.index(key))
+        state = fa.transitions[key]
+    return fa._is_final_uncached(state), fired
+
+
+class UncachedFA(FA_dict):
+    """
+    FA_dict, пересчитывающий замыкания Q и Sigma при каждом вызове.
+    """
+
+    def _cached_closure(self, name, source, declared, build):
+        """
+        Всегда строит замыкание заново.
+        """
+        return frozenset(build())
+
+
+def index_cached(fa: FA_dict, count: int) -> None:
+    """
+    Обращается к transitionList[i] через кэшируемое представление.
+    """
+    for i in range(count):
+        fa.transitionList[i]
+
+
+def index_rebuilt(fa: FA_dict, count: int) -> None:
+    """
+    Обращается к transitionList[i], каждый раз строя список заново.
+    """
+    for i in range(count):
+        list(fa.iter_transitions())[i]
+
+
+def load_rows(rows) -> FA_dict:
+    """
+    Загружает переходы построчно через сеттер transitionList.
+    """
+    fa = FA_dict()
+    fa.transitionList = rows
+    return fa
+
+
+def measure(function, *args, repeat: int = 3) -> float:
+    """
+    Возвращает лучшее время выполнения из repeat запусков, в секундах.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Выполняет замеры и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transitions", type=int, default=100_000)
+    parser.add_argument("--length", type=int, default=1_000)
+    args = parser.parse_args()
+
+    fa = build_dfa(args.transitions)
+    rng = random.Random(1)
+    word = [rng.randrange(4) for _ in range(args.length)]
+    assert fa.accept_FA(word) == accept_with_index_scan(fa, word)
+
+    print(f"FA_dict: {len(fa.transitions)} transitions, word length {len(word)}")
+    print(f"{'accept_FA (ordinal map)':<32}{measure(fa.accept_FA, word):>12.6f} s")
+    print(f"{'accept_FA (_order.index)':<32}{measure(accept_with_index_scan, fa, word):>12.6f} s")
+
+    uncached = UncachedFA()
+    uncached.initialState = fa.initialState
+    uncached.transitionList = fa.transitionList
+    assert fa.is_complete() and uncached.is_complete()
+    print(f"{'is_complete (cached closures)':<32}{measure(fa.is_complete):>12.6f} s")
+    print(f"{'is_complete (recomputed)':<32}{measure(uncached.is_complete):>12.6f} s")
+
+    print(f"{'transitionList[i] x100 (view)':<32}{measure(index_cached, fa, 100):>12.6f} s")
+    print(f"{'transitionList[i] x100 (rebuilt)':<32}{measure(index_rebuilt, fa, 100):>12.6f} s")
+
+    rows = list(fa.transitionList)
+    columns = [array("l", column) for column in zip(*rows)]
+    assert FA_dict.from_arrays(*columns, final_states=fa.finalStates) == fa
+    print(f"{'from_arrays (columns)':<32}{measure(FA_dict.from_arrays, *columns):>12.6f} s")
+    print(f"{'transitionList setter (rows)':<32}{measure(load_rows, rows):>12.6f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Матрица бенчмарков хранилищ переходов FA_dict.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_fa_storage.py [--transitions 100000] [--lookups 200000] [--word 10000]
+
+Для нескольких форм автомата (плотный целочисленный DFA, разреженный
+автомат с именованными состояниями, автомат с большой степенью состояний)
+и каждого хранилища из src.fa_storage печатаются время построения,
+время поиска переходов, время accept_FA на слове из --word символов
+и память хранилища (tracemalloc), а также хранилище, которое выбирает
+choose_storage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.FA_dict import FA_dict  # noqa: E402
+from src.fa_storage import STORAGES, choose_storage, make_storage  # noqa: E402
+
+
+def dense_shape(transitions: int, rng: random.Random) -> list[tuple]:
+    """
+    Полный DFA с целочисленными состояниями и четырьмя входами.
+    """
+    states = max(1, transitions // 4)
+    return [(s, a, rng.randrange(states)) for s in range(states) for a in range(4)]
+
+
+def sparse_shape(transitions: int, rng: random.Random) -> list[tuple]:
+    """
+    Частичный автомат с именованными состояниями и большим алфавитом.
+
+    У каждого состояния есть хотя бы один переход, поэтому слова
+    для accept_FA не обрываются в тупике.
+    """
+    states = max(1, transitions // 2)
+    seen = {(s, 0) for s in range(states)}
+    result = [(f"q{s}", "x0", f"q{rng.randrange(states)}") for s in range(states)]
+    while len(result) < transitions:
+        s, a = rng.randrange(states), rng.randrange(64)
+        if (s, a) not in seen:
+            seen.add((s, a))
+            result.append((f"q{s}", f"x{a}", f"q{rng.randrange(states)}"))
+    return result
+
+
+def wide_shape(transitions: int, rng: random.Random) -> list[tuple]:
+    """
+    Полный автомат с 32 именованными входами на состояние.
+    """
+    states = max(1, transitions // 32)
+    return [
+        (f"q{s}", f"x{a}", f"q{rng.randrange(states)}")
+        for s in range(states)
+        for a in range(32)
+    ]
+
+
+SHAPES = {"dense": dense_shape, "sparse": sparse_shape, "wide": wide_shape}
+
+
+def measure(function, *args, repeat: int = 3) -> float:
+    """
+    Возвращает лучшее время выполнения из repeat запусков, в секундах.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def storage_memory(name: str, items: dict) -> int:
+    """
+    Возвращает объем памяти, выделенной при построении хранилища, в байтах.
+    """
+    tracemalloc.start()
+    storage = make_storage(name, items)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del storage
+    return size
+
+
+def probe(storage, keys) -> None:
+    """
+    Ищет переходы по списку ключей.
+    """
+    lookup = storage.lookup
+    for state, symbol in keys:
+        lookup(state, symbol)
+
+
+def walk(transitions: list[tuple], start, length: int, rng: random.Random) -> list:
+    """
+    Строит слово длины length, выбирая на каждом шаге вход, определенный в текущем состоянии.
+    """
+    moves: dict = {}
+    for state, symbol, next_state in transitions:
+        moves.setdefault(state, []).append((symbol, next_state))
+    state, word = start, []
+    for _ in range(length):
+        if state not in moves:
+            break
+        symbol, state = rng.choice(moves[state])
+        word.append(symbol)
+    return word
+
+
+def main() -> None:
+    """
+    Выполняет замеры и печатает матрицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transitions", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--word", type=int, default=10_000)
+    args = parser.parse_args()
+
+    header = f"{'shape':<8}{'storage':<9}{'build s':>10}{'lookup s':>10}{'accept s':>10}{'memory MB':>11}"
+    print(header)
+    print("-" * len(header))
+    for shape, build in SHAPES.items():
+        rng = random.Random(0)
+        transitions = build(args.transitions, rng)
+        items = {(s, a): d for s, a, d in transitions}
+        keys = [rng.choice(transitions)[:2] for _ in range(args.lookups)]
+        word = walk(transitions, transitions[0][0], args.word, random.Random(1))
+        assert len(word) == args.word, f"{shape}: walk stopped after {len(word)} symbols"
+
+        for name in sorted(STORAGES):
+            fa = FA_dict(storage=name)
+            fa.initialState = transitions[0][0]
+            try:
+                build_time = measure(setattr, fa, "transitionList", transitions, repeat=1)
+            except TypeError:
+                print(f"{shape:<8}{name:<9}{'n/a (non-integer keys)':>41}")
+                continue
+            print(
+                f"{shape:<8}{name:<9}{build_time:>10.4f}"
+                f"{measure(probe, fa.transitions, keys):>10.4f}"
+                f"{measure(fa.accept_FA, word):>10.4f}"
+                f"{storage_memory(name, items) / 2 ** 20:>11.2f}"
+            )
+        print(f"{shape:<8}{'auto':<9}-> {choose_storage(items)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,32 +4,258 @@ FA_dict независим от legacy-реализации FA_simple и мод
 
     Q, Sigma, delta, q0, F
 
-Функция переходов хранится как словарь с ключом (состояние, вход).
+Функция переходов по умолчанию хранится как словарь с ключом
+(состояние, вход); другие хранилища (вложенные словари, плотная таблица,
+CSR) подключаются через src.fa_storage.
 Публичные методы сохраняют минимальную совместимость с тестовой
 инфраструктурой, но основное поведение задается DFA-семантикой.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from copy import deepcopy
-from pathlib import Path
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
+from src.fa_compress import open_text
+from src.fa_storage import (
+    STORAGES,
+    TransitionStorage,
+    TupleKeyStorage,
+    choose_storage,
+    make_storage,
+)
+
+
+_WRITE_CHUNK = 8192
+
+
+class _TrackedSet(set):
+    """
+    Множество, считающее свои изменения: version растет при каждой модификации.
+    """
+
+    def __init__(self, *args):
+        """
+        Создает множество с нулевой версией.
+        """
+        super().__init__(*args)
+        self.version = 0
+
+    def _changed(self):
+        """
+        Отмечает изменение содержимого.
+        """
+        self.version += 1
+
+    def add(self, item):
+        """
+        Добавляет элемент.
+        """
+        super().add(item)
+        self._changed()
+
+    def discard(self, item):
+        """
+        Удаляет элемент, если он есть.
+        """
+        super().discard(item)
+        self._changed()
+
+    def remove(self, item):
+        """
+        Удаляет элемент или бросает KeyError.
+        """
+        super().remove(item)
+        self._changed()
+
+    def pop(self):
+        """
+        Удаляет и возвращает произвольный элемент.
+        """
+        item = super().pop()
+        self._changed()
+        return item
+
+    def clear(self):
+        """
+        Удаляет все элементы.
+        """
+        super().clear()
+        self._changed()
+
+    def update(self, *others):
+        """
+        Добавляет элементы других множеств.
+        """
+        super().update(*others)
+        self._changed()
+
+    def difference_update(self, *others):
+        """
+        Удаляет элементы других множеств.
+        """
+        super().difference_update(*others)
+        self._changed()
+
+    def intersection_update(self, *others):
+        """
+        Оставляет только общие элементы.
+        """
+        super().intersection_update(*others)
+        self._changed()
+
+    def symmetric_difference_update(self, other):
+        """
+        Оставляет элементы, входящие ровно в одно из множеств.
+        """
+        super().symmetric_difference_update(other)
+        self._changed()
+
+    def __ior__(self, other):
+        """
+        Добавляет элементы оператором |= и увеличивает версию.
+        """
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        """
+        Оставляет общие элементы оператором &= и увеличивает версию.
+        """
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        """
+        Удаляет элементы оператором -= и увеличивает версию.
+        """
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        """
+        Оставляет элементы ровно одного множества оператором ^= и увеличивает версию.
+        """
+        self.symmetric_difference_update(other)
+        return self
+
+
+def _column(values):
+    """
+    Возвращает колонку как список Python-значений (для NumPy - через tolist).
+    """
+    tolist = getattr(values, "tolist", None)
+    return tolist() if tolist is not None else list(values)
+
+
+def _first_rows(keys, dst, out):
+    """
+    Возвращает номера первых вхождений ключей; конфликтующий повтор - ValueError.
+    """
+    first: dict[tuple[Any, Any], int] = {}
+    for row, key in enumerate(keys):
+        previous = first.setdefault(key, row)
+        if previous == row:
+            continue
+        same_next = dst[previous] == dst[row]
+        same_output = out is None or out[previous] == out[row]
+        if not (same_next and same_output):
+            raise ValueError(f"Nondeterministic transition for {key}")
+    return list(first.values())
+
+
+class TransitionListView(Sequence):
+    """
+    Неизменяемый снимок переходов в legacy-формате, общий для повторных обращений.
+
+    Запись по индексу (например, random.shuffle) не затрагивает автомат:
+    представление переключается на собственную копию, как раньше список,
+    создаваемый при каждом обращении к transitionList.
+    """
+
+    __slots__ = ("_items", "_detached")
+
+    def __init__(self, items) -> None:
+        """
+        Сохраняет кортеж переходов.
+        """
+        self._items = tuple(items)
+        self._detached = False
+
+    def __len__(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return len(self._items)
+
+    def __getitem__(self, index):
+        """
+        Возвращает переход по индексу; срез возвращает список.
+        """
+        if isinstance(index, slice):
+            return list(self._items[index])
+        return self._items[index]
+
+    def __iter__(self):
+        """
+        Перебирает переходы без копирования.
+        """
+        return iter(self._items)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Изменяет собственную копию переходов, отсоединяясь от автомата.
+        """
+        if not self._detached:
+            self._items = list(self._items)
+            self._detached = True
+        self._items[index] = value
+
+    def __eq__(self, other) -> bool:
+        """
+        Сравнивает поэлементно со списком, кортежем или другим представлением.
+        """
+        if isinstance(other, (list, tuple, TransitionListView)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Показывает переходы как список.
+        """
+        return repr(list(self._items))
+
 
 class FA_dict:
     """
     Детерминированный конечный автомат с хранением переходов в словаре.
     """
-    def __init__(self):
+    def __init__(self, storage: str = "tuple"):
         """
         Инициализирует пустой автомат и служебные поля совместимости.
+
+        storage - хранилище переходов из src.fa_storage ("tuple", "nested",
+        "dense", "csr") или "auto" для выбора после загрузки переходов.
         """
+        if storage != "auto" and storage not in STORAGES:
+            raise ValueError(f"Unknown transition storage: {storage!r}")
+        self._storage = storage
         self.states: set[Any] = set()
         self.inputs: set[Any] = set()
-        self.transitions: dict[tuple[Any, Any], Any] = {}
-        self.outputs: dict[tuple[Any, Any], Any] = {}
+        self.transitions: TransitionStorage = self._new_storage()
+        self.outputs: TransitionStorage = self._new_storage()
         self._order: list[tuple[Any, Any]] = []
+        self._ordinal: dict[tuple[Any, Any], int] = {}
         self._malformed_transitions: list[tuple[Any, ...]] = []
+        self._revision = 0
+        self._final_memo: tuple[Any, int, dict[Any, bool]] = (None, -1, {})
+        self._closures: dict[str, tuple[tuple[Any, ...], frozenset]] = {}
+        self._list_view: tuple[tuple[Any, ...], TransitionListView] | None = None
 
         self.initialState: Any = 0
         self.finalStates: set[Any] = set()
@@ -59,6 +285,23 @@ class FA_dict:
         fa._sync_declared_sizes()
         return fa
 
+    @classmethod
+    def from_arrays(cls, src, inp, dst, out=None, initial_state=0, final_states=(), storage="tuple"):
+        """
+        Создает автомат из колонок переходов (list, array, NumPy и т.п.).
+
+        Строка i задает переход src[i] --inp[i]/out[i]--> dst[i]; выход None
+        означает переход без выхода, как в legacy-списке. Хранилища, порядок
+        и Q/Sigma строятся целиком по колонкам, а не вызовом _add_transition
+        на каждую строку. Повторы пары (состояние, вход) с тем же переходом
+        пропускаются, с другим - ValueError, как у сеттера transitionList.
+        """
+        fa = cls(storage=storage)
+        fa.initialState = initial_state
+        fa.finalStates = set(final_states)
+        fa._load_columns(src, inp, dst, out)
+        return fa
+
     @classmethod
     def from_efa(cls, efa):
         """
@@ -86,6 +329,74 @@ class FA_dict:
         fa.transitionList = list(getattr(other, "transitionList", []))
         return fa
 
+    def __getstate__(self):
+        """
+        Возвращает компактное состояние pickle: таблицу символов и колонки переходов.
+        """
+        from src.fa_pickle import fa_dict_state
+
+        return fa_dict_state(self)
+
+    def __setstate__(self, state):
+        """
+        Восстанавливает автомат из состояния __getstate__.
+        """
+        from src.fa_pickle import restore_fa_dict
+
+        restore_fa_dict(self, state)
+
+    # ---------------------------------------------------------
+    # Отслеживаемые множества Q, Sigma и F
+    # ---------------------------------------------------------
+
+    @property
+    def states(self):
+        """
+        Возвращает множество состояний, встреченных в переходах или заданных явно.
+        """
+        return self._states
+
+    @states.setter
+    def states(self, states):
+        """
+        Заменяет множество состояний; изменения отслеживаются для кэша _all_states.
+        """
+        if not isinstance(states, _TrackedSet):
+            states = _TrackedSet(states)
+        self._states = states
+
+    @property
+    def inputs(self):
+        """
+        Возвращает множество входных символов.
+        """
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, inputs):
+        """
+        Заменяет множество входов; изменения отслеживаются для кэша _all_inputs.
+        """
+        if not isinstance(inputs, _TrackedSet):
+            inputs = _TrackedSet(inputs)
+        self._inputs = inputs
+
+    @property
+    def finalStates(self):
+        """
+        Возвращает множество допускающих состояний F.
+        """
+        return self._final_states
+
+    @finalStates.setter
+    def finalStates(self, states):
+        """
+        Заменяет F; изменения множества отслеживаются для кэша _is_final.
+        """
+        if not isinstance(states, _TrackedSet):
+            states = _TrackedSet(states)
+        self._final_states = states
+
     # ---------------------------------------------------------
     # Совместимое представление переходов
     # ---------------------------------------------------------
@@ -93,28 +404,62 @@ class FA_dict:
     @property
     def transitionList(self):
         """
-        Возвращает переходы в legacy-формате списка.
+        Возвращает переходы в legacy-формате как неизменяемое представление.
+
+        Представление строится один раз и переиспользуется до изменения
+        автомата, поэтому len(), индексация и обход не копируют переходы.
+        Прямая запись в fa.transitions / fa.outputs увеличивает счетчик
+        version хранилища и тоже сбрасывает представление.
         """
-        result = []
-        result.extend(self._malformed_transitions)
+        key = (
+            self._revision,
+            self.isFSM,
+            self.transitions,
+            self.outputs,
+            self.transitions.version,
+            self.outputs.version,
+        )
+        cached = self._list_view
+        if cached is not None:
+            old, view = cached
+            if (
+                not view._detached
+                and old[2] is key[2]
+                and old[3] is key[3]
+                and old[:2] == key[:2]
+                and old[4:] == key[4:]
+            ):
+                return view
+        view = TransitionListView(self.iter_transitions())
+        self._list_view = (key, view)
+        return view
+
+    def iter_transitions(self):
+        """
+        Выдает переходы в legacy-формате по одному, не строя список.
+        """
+        yield from self._malformed_transitions
+        outputs = self.outputs
         for key in self._order:
             state, symbol = key
             next_state = self.transitions[key]
-            if self.isFSM or key in self.outputs:
-                result.append((state, symbol, next_state, self.outputs.get(key, 0)))
+            if self.isFSM or key in outputs:
+                yield (state, symbol, next_state, outputs.get(key, 0))
             else:
-                result.append((state, symbol, next_state))
-        return result
+                yield (state, symbol, next_state)
 
     @transitionList.setter
     def transitionList(self, transitions):
         """
         Загружает переходы из legacy-списка в словарную модель DFA.
         """
-        self.transitions = {}
-        self.outputs = {}
-        self._order = []
+        self._reset_transitions()
         self._malformed_transitions = []
+        if self.transitions.name != TupleKeyStorage.name:
+            # построчная вставка в dense/csr медленная: строки собираются
+            # в словарь и переносятся в выбранное хранилище одним проходом
+            self.transitions = make_storage(TupleKeyStorage.name)
+            self.outputs = make_storage(TupleKeyStorage.name)
 
         for tr in transitions or []:
             if len(tr) < 3:
@@ -124,6 +469,7 @@ class FA_dict:
             output = tr[3] if len(tr) >= 4 else None
             self._add_transition(state, symbol, next_state, output)
 
+        self.use_storage(self._storage)
         self._sync_declared_sizes()
 
     def _add_transition(self, state, symbol, next_state, output=None):
@@ -142,43 +488,179 @@ class FA_dict:
         if output is not None:
             self.outputs[key] = output
             self.isFSM = 1
+        self._ordinal[key] = len(self._order)
         self._order.append(key)
+        self._revision += 1
         self.states.update([state, next_state])
         self.inputs.add(symbol)
 
+    def _load_columns(self, src, inp, dst, out=None, malformed=()):
+        """
+        Заменяет функцию переходов колонками, как сеттер transitionList - строками.
+
+        malformed - строки короче трех элементов, которые сохраняются
+        в начале transitionList без изменений.
+        """
+        src, inp, dst = _column(src), _column(inp), _column(dst)
+        out = None if out is None else _column(out)
+        count = len(src)
+        if len(inp) != count or len(dst) != count or (out is not None and len(out) != count):
+            raise ValueError("Transition columns must have equal length")
+
+        keys = list(zip(src, inp))
+        ordinal = dict(zip(keys, range(count)))
+        if len(ordinal) != count:
+            rows = _first_rows(keys, dst, out)
+            keys = [keys[row] for row in rows]
+            dst = [dst[row] for row in rows]
+            out = None if out is None else [out[row] for row in rows]
+            ordinal = dict(zip(keys, range(len(keys))))
+
+        self._reset_transitions()
+        self._malformed_transitions = [tuple(tr) for tr in malformed]
+        name = TupleKeyStorage.name if self._storage == "auto" else self._storage
+        self._bulk_load(keys, dst, out, ordinal, name)
+
+        if self._storage == "auto":
+            self.use_storage("auto")
+        self._sync_declared_sizes()
+
+    def _bulk_load(self, keys, dst, out, ordinal, name):
+        """
+        Заполняет хранилище name, порядок, Q и Sigma по колонкам без повторов ключей.
+        """
+        self.transitions = make_storage(name, zip(keys, dst))
+        if out is None:
+            self.outputs = make_storage(name)
+        elif None in out:
+            self.outputs = make_storage(
+                name, ((key, value) for key, value in zip(keys, out) if value is not None)
+            )
+        else:
+            self.outputs = make_storage(name, zip(keys, out))
+        if self.outputs:
+            self.isFSM = 1
+        self._order = keys
+        self._ordinal = ordinal
+        self._revision += 1
+        self.states.update(map(itemgetter(0), keys))
+        self.states.update(dst)
+        self.inputs.update(map(itemgetter(1), keys))
+
+    def _reset_transitions(self):
+        """
+        Очищает функцию переходов вместе с порядком и индексом порядковых номеров.
+        """
+        self.transitions = self._new_storage()
+        self.outputs = self._new_storage()
+        self._order = []
+        self._ordinal = {}
+        self._revision += 1
+
+    def _new_storage(self, items=()):
+        """
+        Создает пустое хранилище переходов выбранного вида.
+        """
+        name = TupleKeyStorage.name if self._storage == "auto" else self._storage
+        return make_storage(name, items)
+
+    @property
+    def storage(self) -> str:
+        """
+        Возвращает имя текущего хранилища переходов.
+        """
+        return self.transitions.name
+
+    def use_storage(self, name: str):
+        """
+        Переносит переходы и выходы в хранилище name ("auto" - выбор по choose_storage).
+        """
+        if name != "auto" and name not in STORAGES:
+            raise ValueError(f"Unknown transition storage: {name!r}")
+        self._storage = name
+        chosen = choose_storage(self.transitions) if name == "auto" else name
+        if self.transitions.name != chosen:
+            self.transitions = make_storage(chosen, self.transitions)
+            self.outputs = make_storage(chosen, self.outputs)
+            self._revision += 1
+        return self
+
+    def _reindex_order(self):
+        """
+        Перестраивает отображение ключ -> позиция в _order после его перестановки.
+        """
+        self._ordinal = {key: index for index, key in enumerate(self._order)}
+        self._revision += 1
+
     def _sync_declared_sizes(self):
         """
         Синхронизирует объявленные размеры с фактическими множествами автомата.
         """
         self.numberOfStates = max(self.numberOfStates, len(self.states))
         self.numberOfInputs = max(self.numberOfInputs, len(self.inputs))
-        self.numberOfOutputs = max(self.numberOfOutputs, len(set(self.outputs.values())))
+        self.numberOfOutputs = max(self.numberOfOutputs, len(self._all_outputs()))
 
     # ---------------------------------------------------------
     # Формальные вспомогательные методы DFA
     # ---------------------------------------------------------
 
+    def _cached_closure(self, name, source, declared, build):
+        """
+        Возвращает замыкание множества, пересчитывая его только после изменений.
+
+        Ключ кэша - объект множества, его версия и объявленный размер,
+        поэтому проверка актуальности выполняется за O(1).
+        """
+        key = (source, source.version, declared)
+        cached = self._closures.get(name)
+        if cached is not None and cached[0][0] is source and cached[0][1:] == key[1:]:
+            return cached[1]
+        result = frozenset(build())
+        self._closures[name] = (key, result)
+        return result
+
     def _all_states(self):
         """
         Возвращает множество состояний Q с учетом явно заданного размера.
         """
-        states = set(self.states)
-        if (
-            self.numberOfStates
-            and self._states_are_integer_like()
-            and (not states or states.issubset(set(range(self.numberOfStates))))
-        ):
-            states.update(range(self.numberOfStates))
-        return states
+        def build():
+            states = set(self.states)
+            if (
+                self.numberOfStates
+                and self._states_are_integer_like()
+                and (not states or states.issubset(range(self.numberOfStates)))
+            ):
+                states.update(range(self.numberOfStates))
+            return states
+
+        return self._cached_closure("states", self.states, self.numberOfStates, build)
 
     def _all_inputs(self):
         """
         Возвращает входной алфавит Sigma с учетом явно заданного размера.
         """
-        inputs = set(self.inputs)
-        if self.numberOfInputs and (not inputs or all(isinstance(i, int) for i in inputs)):
-            inputs.update(range(self.numberOfInputs))
-        return inputs
+        def build():
+            inputs = set(self.inputs)
+            if self.numberOfInputs and (not inputs or all(isinstance(i, int) for i in inputs)):
+                inputs.update(range(self.numberOfInputs))
+            return inputs
+
+        return self._cached_closure("inputs", self.inputs, self.numberOfInputs, build)
+
+    def _all_outputs(self):
+        """
+        Возвращает множество выходов переходов, пересчитывая его только после изменений.
+
+        Ключ кэша - объект хранилища выходов, счетчик _revision и версия
+        хранилища, как у представления transitionList.
+        """
+        key = (self.outputs, self._revision, self.outputs.version)
+        cached = self._closures.get("outputs")
+        if cached is not None and cached[0][0] is key[0] and cached[0][1:] == key[1:]:
+            return cached[1]
+        result = frozenset(self.outputs.values())
+        self._closures["outputs"] = (key, result)
+        return result
 
     def _states_are_integer_like(self):
         """
@@ -200,6 +682,26 @@ class FA_dict:
     def _is_final(self, state):
         """
         Проверяет, принадлежит ли состояние множеству допускающих состояний F.
+
+        Результаты с приведениями int()/str() запоминаются до изменения F.
+        """
+        final_states = self.finalStates
+        source, version, memo = self._final_memo
+        if source is not final_states or version != final_states.version:
+            memo = {}
+            self._final_memo = (final_states, final_states.version, memo)
+        try:
+            return memo[state]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._is_final_uncached(state)
+        memo[state] = result = self._is_final_uncached(state)
+        return result
+
+    def _is_final_uncached(self, state):
+        """
+        Проверяет принадлежность F с приведениями int() и str().
         """
         if state in self.finalStates:
             return True
@@ -239,7 +741,7 @@ class FA_dict:
             if key is None:
                 print(f"accept_FA: Error! no such transition: {state} {symbol}")
                 return None
-            fired.append(self._order.index(key))
+            fired.append(self._ordinal[key])
             state = self.transitions[key]
 
         return self._is_final(state), fired
@@ -298,6 +800,106 @@ class FA_dict:
         self._sync_declared_sizes()
         return reaction
 
+    def minimize(self):
+        """
+        Возвращает минимальный эквивалентный автомат и отображение старых состояний в новые.
+        """
+        from src.fa_minimize import minimize
+
+        return minimize(self)
+
+    def trim(self):
+        """
+        Удаляет недостижимые и некодостижимые состояния и возвращает их список.
+        """
+        from src.fa_graph import trim
+
+        return trim(self)
+
+    def access_sequences(self):
+        """
+        Возвращает кэшируемое дерево кратчайших слов доступа к состояниям.
+        """
+        from src.fa_graph import access_sequences
+
+        return access_sequences(self)
+
+    def scc(self):
+        """
+        Возвращает компоненты сильной связности графа переходов.
+        """
+        from src.fa_graph import scc
+
+        return scc(self)
+
+    def condensation(self):
+        """
+        Возвращает ациклический граф компонент сильной связности.
+        """
+        from src.fa_graph import condensation
+
+        return condensation(self)
+
+    def to_csr(self):
+        """
+        Возвращает компактное CSR-представление функции переходов.
+        """
+        from src.fa_csr import CSRAutomaton
+
+        return CSRAutomaton.from_fa(self)
+
+    def freeze(self):
+        """
+        Возвращает неизменяемый хешируемый снимок автомата.
+        """
+        from src.fa_frozen import FrozenAutomaton
+
+        return FrozenAutomaton.from_fa(self)
+
+    # ---------------------------------------------------------
+    # Размер языка
+    # ---------------------------------------------------------
+
+    def count_accepted(self, n):
+        """
+        Возвращает точное число допускаемых слов длины n.
+        """
+        from src.fa_language import count_accepted
+
+        return count_accepted(self, n)
+
+    def count_accepted_upto(self, n):
+        """
+        Возвращает точное число допускаемых слов длины не больше n.
+        """
+        from src.fa_language import count_accepted_upto
+
+        return count_accepted_upto(self, n)
+
+    def sample_accepted(self, n, k, rng=None):
+        """
+        Выбирает k равномерно распределенных допускаемых слов длины n.
+        """
+        from src.fa_language import sample_accepted
+
+        return sample_accepted(self, n, k, rng)
+
+    def rank(self, word):
+        """
+        Возвращает номер допускаемого слова среди допускаемых слов той же длины.
+        """
+        from src.fa_language import rank_accepted
+
+        return rank_accepted(self, word)
+
+    def unrank(self, index, n):
+        """
+        Возвращает допускаемое слово длины n с заданным лексикографическим номером.
+        """
+        from src.fa_language import unrank_accepted
+
+        return unrank_accepted(self, index, n)
+
     # ---------------------------------------------------------
     # Кодирование и структурные запросы
     # ---------------------------------------------------------
@@ -323,9 +925,7 @@ class FA_dict:
         old_transition_items = [(key, self.transitions[key]) for key in self._order]
         old_outputs = dict(self.outputs)
 
-        self.transitions = {}
-        self.outputs = {}
-        self._order = []
+        self._reset_transitions()
         for (state, symbol), next_state in old_transition_items:
             output = old_outputs.get((state, symbol))
             self._add_transition(mapping[state], symbol, mapping[next_state], output)
@@ -462,9 +1062,7 @@ class FA_dict:
 
         old_items = [(key, target.transitions[key]) for key in target._order]
         old_outputs = dict(target.outputs)
-        target.transitions = {}
-        target.outputs = {}
-        target._order = []
+        target._reset_transitions()
         target.inputs = set(input_mapping.values())
         target.numberOfInputs = len(target.inputs)
         target.numberOfOutputs = len(output_mapping)
@@ -497,6 +1095,7 @@ class FA_dict:
         Сортирует порядок совместимого списка переходов без изменения семантики.
         """
         self._order.sort(key=lambda key: (repr(key[0]), repr(key[1])))
+        self._reindex_order()
 
     def print_transition_table(self):
         """
@@ -520,75 +1119,122 @@ class FA_dict:
             return value
 
     @staticmethod
-    def read_FA(filename):
+    def _atom_parser():
         """
-        Читает автомат из простого FA-файла.
+        Возвращает _parse_atom с памятью разобранных строк для одного файла.
         """
-        path = Path(filename)
-        lines = path.read_text().splitlines()
-        info = {}
-        for line in lines[:4]:
-            parts = line.strip().split()
-            values = [FA_dict._parse_atom(part) for part in parts[1:]]
-            info[parts[0]] = values[0] if len(values) == 1 else values
+        memo: dict[str, Any] = {}
+        get = memo.get
 
-        fa = FA_dict()
-        fa.isFSM = 0
-        fa.numberOfStates = int(info.get("states_number", 0))
-        fa.numberOfInputs = int(info.get("actions_number", 0))
-        fa.initialState = info.get("start_state", 0)
-        final_state = info.get("final_state", [])
-        fa.finalStates = set(final_state if isinstance(final_state, list) else [final_state])
-        fa.states.update(range(fa.numberOfStates))
-        fa.inputs.update(range(fa.numberOfInputs))
+        def parse(value):
+            atom = get(value, memo)
+            if atom is memo:
+                atom = memo[value] = FA_dict._parse_atom(value)
+            return atom
 
-        transitions = []
-        for line in lines[4:]:
-            parts = [FA_dict._parse_atom(part) for part in line.strip().split()]
-            if parts:
-                transitions.append(tuple(parts))
-        fa.transitionList = transitions
+        return parse
+
+    @staticmethod
+    def _read_rows(lines, parse, columns, malformed):
+        """
+        Разбирает строки переходов в колонки src/inp/dst/out и короткие строки.
+
+        Возвращает наблюдаемые множества состояний, входов и выходов.
+        """
+        src, inp, dst, out = columns
+        states: set[Any] = set()
+        inputs: set[Any] = set()
+        outputs: set[Any] = set()
+        for parts in lines:
+            if len(parts) < 3:
+                malformed.append(tuple(map(parse, parts)))
+                continue
+            state, symbol, next_state = parse(parts[0]), parse(parts[1]), parse(parts[2])
+            src.append(state)
+            inp.append(symbol)
+            dst.append(next_state)
+            states.add(state)
+            states.add(next_state)
+            inputs.add(symbol)
+            if len(parts) >= 4:
+                output = parse(parts[3])
+                out.append(output)
+                outputs.add(output)
+            else:
+                out.append(None)
+        return states, inputs, outputs
+
+    @staticmethod
+    def read_FA(filename):
+        """
+        Читает автомат из простого FA-файла построчно, без загрузки файла целиком.
+
+        Сжатые gzip, bz2 и lzma файлы распаковываются потоково (см. src/fa_compress.py).
+        """
+        parse = FA_dict._atom_parser()
+        fa = FA_dict()
+        columns: tuple[list[Any], ...] = ([], [], [], [])
+        malformed: list[tuple[Any, ...]] = []
+        with open_text(filename) as lines:
+            info = {}
+            for line in islice(lines, 4):
+                parts = line.strip().split()
+                values = [FA_dict._parse_atom(part) for part in parts[1:]]
+                info[parts[0]] = values[0] if len(values) == 1 else values
+
+            fa.isFSM = 0
+            fa.numberOfStates = int(info.get("states_number", 0))
+            fa.numberOfInputs = int(info.get("actions_number", 0))
+            fa.initialState = info.get("start_state", 0)
+            final_state = info.get("final_state", [])
+            fa.finalStates = set(final_state if isinstance(final_state, list) else [final_state])
+            fa.states.update(range(fa.numberOfStates))
+            fa.inputs.update(range(fa.numberOfInputs))
+
+            rows = (parts for parts in map(str.split, lines) if parts)
+            FA_dict._read_rows(rows, parse, columns, malformed)
+        fa._load_columns(*columns, malformed=malformed)
         return fa
 
     @staticmethod
     def read_FSM(filename):
         """
-        Читает FSM-файл и строит совместимый объект автомата.
+        Читает FSM-файл построчно и строит автомат пакетно по колонкам.
+
+        Наблюдаемые состояния, входы и выходы для проверки согласованности
+        с заголовком собираются во время чтения. Сжатые gzip, bz2 и lzma
+        файлы распаковываются потоково.
         """
-        path = Path(filename)
-        lines = path.read_text().splitlines()
+        parse = FA_dict._atom_parser()
         fa = FA_dict()
         fa.isFSM = 1
-
-        transitions = []
-        observed_states = set()
-        observed_inputs = set()
-        observed_outputs = set()
-        for line in lines:
-            parts = line.strip().split()
-            if not parts:
-                continue
-            key = parts[0]
-            if key == "s":
-                fa.numberOfStates = int(parts[1])
-                fa.states.update(range(fa.numberOfStates))
-            elif key == "i":
-                fa.numberOfInputs = int(parts[1])
-                fa.inputs.update(range(fa.numberOfInputs))
-            elif key == "o":
-                fa.numberOfOutputs = int(parts[1])
-            elif key == "n0":
-                fa.initialState = FA_dict._parse_atom(parts[1])
-            elif key[0].isdigit() or key[0] == "-":
-                tr = tuple(FA_dict._parse_atom(part) for part in parts)
-                transitions.append(tr)
-                if len(tr) >= 3:
-                    observed_states.update([tr[0], tr[2]])
-                    observed_inputs.add(tr[1])
-                if len(tr) >= 4:
-                    observed_outputs.add(tr[3])
-
-        fa.transitionList = transitions
+        columns: tuple[list[Any], ...] = ([], [], [], [])
+        malformed: list[tuple[Any, ...]] = []
+
+        def rows(lines):
+            for line in lines:
+                parts = line.split()
+                if not parts:
+                    continue
+                key = parts[0]
+                if key == "s":
+                    fa.numberOfStates = int(parts[1])
+                    fa.states.update(range(fa.numberOfStates))
+                elif key == "i":
+                    fa.numberOfInputs = int(parts[1])
+                    fa.inputs.update(range(fa.numberOfInputs))
+                elif key == "o":
+                    fa.numberOfOutputs = int(parts[1])
+                elif key == "n0":
+                    fa.initialState = FA_dict._parse_atom(parts[1])
+                elif key[0].isdigit() or key[0] == "-":
+                    yield parts
+
+        with open_text(filename) as lines:
+            observed_states, observed_inputs, observed_outputs = FA_dict._read_rows(
+                rows(lines), parse, columns, malformed
+            )
+        fa._load_columns(*columns, malformed=malformed)
         if (
             len(observed_inputs) != fa.numberOfInputs
             or len(observed_outputs) != fa.numberOfOutputs
@@ -597,39 +1243,73 @@ class FA_dict:
             print("Error: fsm file is not consistent")
         return fa
 
-    def write_FSM(self, filename):
+    def _fsm_header(self, transitions_count, initial):
         """
-        Записывает автомат в FSM-совместимый текстовый формат.
+        Возвращает заголовок FSM-файла; размеры Q, Sigma и множества выходов берутся из кэша.
         """
-        path = Path(filename)
-        lines = [
-            "F 0",
-            f"s {max(self.numberOfStates, len(self._all_states()))}",
-            f"i {max(self.numberOfInputs, len(self._all_inputs()))}",
-            f"o {max(self.numberOfOutputs, len(set(self.outputs.values())))}",
-            f"n0 {self.initialState}",
-            f"p {len(self.transitionList)}",
-        ]
-        lines.extend(" ".join(str(part) for part in tr) for tr in self.transitionList)
-        path.write_text("\n".join(lines) + "\n")
+        return (
+            "F 0\n"
+            f"s {max(self.numberOfStates, len(self._all_states()))}\n"
+            f"i {max(self.numberOfInputs, len(self._all_inputs()))}\n"
+            f"o {max(self.numberOfOutputs, len(self._all_outputs()))}\n"
+            f"n0 {initial}\n"
+            f"p {transitions_count}\n"
+        )
+
+    @staticmethod
+    def _write_rows(file, transitions):
+        """
+        Пишет переходы в файл пакетами по _WRITE_CHUNK строк.
+        """
+        for start in range(0, len(transitions), _WRITE_CHUNK):
+            file.write(
+                "".join(
+                    " ".join(map(str, tr)) + "\n"
+                    for tr in transitions[start:start + _WRITE_CHUNK]
+                )
+            )
+
+    def write_FSM(self, filename, compresslevel=None):
+        """
+        Записывает автомат в FSM-совместимый текстовый формат пакетами строк.
 
-    def write_FSM_init(self, filename, states_excluded=None):
+        Переходы берутся из кэшируемого представления transitionList,
+        текст файла целиком в памяти не собирается. Файл с расширением
+        .gz, .bz2, .xz или .lzma сжимается с уровнем compresslevel.
+        """
+        transitions = self.transitionList
+        with open_text(filename, "w", compresslevel) as file:
+            file.write(self._fsm_header(len(transitions), self.initialState))
+            self._write_rows(file, transitions)
+
+    def write_FSM_init(self, filename, states_excluded=None, compresslevel=None):
         """
         Записывает FSM, исключая выбранные начальные состояния из переходов.
         """
         states_excluded = set(states_excluded or [])
-        path = Path(filename)
-        transitions = [tr for tr in self.transitionList if tr[0] not in states_excluded]
-        lines = [
-            "F 0",
-            f"s {max(self.numberOfStates, len(self._all_states()))}",
-            f"i {max(self.numberOfInputs, len(self._all_inputs()))}",
-            f"o {max(self.numberOfOutputs, len(set(self.outputs.values())))}",
-            f"n0 {self.initialState}",
-            f"p {len(transitions)}",
-        ]
-        lines.extend(" ".join(str(part) for part in tr) for tr in transitions)
-        path.write_text("\n".join(lines) + "\n")
+        transitions = self.transitionList
+        if states_excluded:
+            transitions = [tr for tr in transitions if tr[0] not in states_excluded]
+        with open_text(filename, "w", compresslevel) as file:
+            file.write(self._fsm_header(len(transitions), self.initialState))
+            self._write_rows(file, transitions)
+
+    def write_FSMB(self, filename):
+        """
+        Записывает автомат в двоичный формат .fsmb (см. src/fa_binary.py).
+        """
+        from src.fa_binary import write_fsmb
+
+        write_fsmb(self, filename)
+
+    @staticmethod
+    def read_FSMB(filename):
+        """
+        Читает автомат из двоичного файла .fsmb.
+        """
+        from src.fa_binary import read_fsmb
+
+        return read_fsmb(filename, FA_dict)
 
     # ---------------------------------------------------------
     # Сравнение автоматов
@@ -4,6 +4,8 @@ import copy
 import re
 from collections.abc import Sequence
 from copy import deepcopy
+from itertools import islice
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,10 +18,14 @@ from typing import (
     TypeVar,
 )
 
+from src.fa_compress import open_text
+
 if TYPE_CHECKING:
     from .FA import FA
     from .MYEFA import MYEFA
 
+_WRITE_CHUNK = 8192  # строк переходов на одну запись в файл
+
 
 class FA_simple(object):
     """
@@ -47,6 +53,27 @@ class FA_simple(object):
                 return False
         return True
 
+    def __getstate__(self):
+        """Возвращает компактное состояние pickle: таблицу символов и колонку
+        номеров ячеек переходов вместо списка мелких кортежей.
+
+        Returns:
+                tuple: формат и словарь колонок (см. src/fa_pickle.py).
+        """
+        from src.fa_pickle import fa_simple_state
+
+        return fa_simple_state(self)
+
+    def __setstate__(self, state):
+        """Восстанавливает автомат из состояния __getstate__ (или обычного словаря атрибутов).
+
+        Args:
+                state: результат __getstate__.
+        """
+        from src.fa_pickle import restore_fa_simple
+
+        restore_fa_simple(self, state)
+
     ###################################################
     # ВВОД-ВЫВОД
     def print_transition_table(self):
@@ -96,7 +123,8 @@ class FA_simple(object):
         """
         res = FA_simple()
         res.initialState = fa.initialState
-        res.transitionList = fa.transitionList
+        # копия: у FA_dict transitionList - неизменяемое представление, а не list
+        res.transitionList = list(fa.transitionList)
         res.isFSM = fa.isFSM
         res.numberOfStates = len(res.get_states_list())
         res.numberOfInputs = len(res.get_actions_list())
@@ -107,35 +135,81 @@ class FA_simple(object):
             res.finalStates = fa.finalStates
         return res
 
-    def write_FSM(self, filename):
+    def _fsm_header_counts(self) -> tuple[int, int, int]:
+        """Считает число состояний, входов и выходов на переходах за один проход
+        (вместо трех вызовов get_*_list с сортировкой результатов).
+
+        Returns:
+                Tuple[int, int, int]: число состояний, входов, выходов.
+        """
+        states, actions, outputs = set(), set(), set()
+        for tr in self.transitionList:
+            states.add(tr[0])
+            states.add(tr[2])
+            actions.add(tr[1])
+            outputs.add(tr[3])
+        return len(states), len(actions), len(outputs)
+
+    def _sorted_transitions(self):
+        """Возвращает переходы, упорядоченные по (состояние, вход, следующее состояние).
+        Если transitionList уже упорядочен, возвращается он сам, без копии и сортировки.
+
+        Returns:
+                list: переходы в порядке записи в файл.
+        """
+        key = itemgetter(0, 1, 2)
+        transitions = self.transitionList
+        previous = None
+        for tr in transitions:
+            current = key(tr)
+            if previous is not None and current < previous:
+                return sorted(transitions, key=key)
+            previous = current
+        return transitions
+
+    @staticmethod
+    def _write_transitions(file, transitions) -> None:
+        """Записывает строки переходов в файл пакетами по _WRITE_CHUNK строк.
+
+        Args:
+                file: открытый текстовый файл.
+
+                transitions (list): переходы из четырех элементов.
+        """
+        for start in range(0, len(transitions), _WRITE_CHUNK):
+            file.write(
+                "".join(
+                    f"{tr[0]} {tr[1]} {tr[2]} {tr[3]}\n"
+                    for tr in transitions[start:start + _WRITE_CHUNK]
+                )
+            )
+
+    def write_FSM(self, filename, compresslevel=None):
         """Выводит описание автомата в текстовый формат "fsm".
+        Строки переходов пишутся в файл пакетами, без сборки всего текста в памяти.
+        Файл с расширением .gz, .bz2, .xz или .lzma сжимается (см. src/fa_compress.py).
 
         Args:
                 self(FA_simple).
 
                 filename (str): Имя файла, куда будет записан автомат.
-        """
-        from operator import itemgetter
 
-        states = sorted(self.get_states_list())
-        actions = sorted(self.get_actions_list())
-        outputs = sorted(self.get_outputs_list())
+                compresslevel (int | None): уровень сжатия; None - по умолчанию для кодека.
+        """
+        states, actions, outputs = self._fsm_header_counts()
+        transitions = self._sorted_transitions()
 
-        fsmtext = f"F 0\ns {len(states)}\ni {len(actions)}\no {len(outputs)}\nn0 {self.initialState}\np {len(self.transitionList)}\n"
         # заменим сложные имена состояний на их индексы в массиве состояний
         # fsmtext += f"start_state {states.index(self.initialState)}\n"
         # c = " ".join(sorted([str(states.index(x)) for x in self.finalStates]))
         # fsmtext += f"final_state {c}\n"
-        sortedtranslist = sorted(
-            [x for x in self.transitionList], key=itemgetter(0, 1, 2)
-        )
-        for tr in sortedtranslist:
-            fsmtext += f"{tr[0]} {tr[1]} {tr[2]} {tr[3]}\n"
-
-        with open(filename, "w") as file:
-            file.write(fsmtext)
+        with open_text(filename, "w", compresslevel) as file:
+            file.write(
+                f"F 0\ns {states}\ni {actions}\no {outputs}\nn0 {self.initialState}\np {len(self.transitionList)}\n"
+            )
+            self._write_transitions(file, transitions)
 
-    def write_FSM_init(self, filename, states_excluded=[]):
+    def write_FSM_init(self, filename, states_excluded=[], compresslevel=None):
         """Вывод в файл слабо инициального (неинициального) автомата в формате "fsm".
                 т.е. в преамбуле в формате "fsm" в строке n0 пречисляются несколько состояний
 
@@ -144,39 +218,33 @@ class FA_simple(object):
         Args:
                 states_excluded(list):  список состояний, которые не добавляются в множество начальных.
 
-        """
-        from operator import itemgetter
-
-        states = sorted(self.get_states_list())
-        actions = sorted(self.get_actions_list())
-        outputs = sorted(self.get_outputs_list())
+                compresslevel (int | None): уровень сжатия файла .gz, .bz2, .xz или .lzma.
 
-        states_list_len = len(states)
+        """
+        states, actions, outputs = self._fsm_header_counts()
+        transitions = self._sorted_transitions()
 
-        states_excluded = [str(x) for x in states_excluded]
+        states_excluded = {str(x) for x in states_excluded}
 
         init_states = [
-            str(x) for x in range(states_list_len) if str(x) not in states_excluded
+            str(x) for x in range(states) if str(x) not in states_excluded
         ]
-        fsmtext = f"F 0\ns {len(states)}\ni {len(actions)}\no {len(outputs)}\nn0 {' '.join(x for x in init_states)}\np {len(self.transitionList)}\n"
 
         # заменим сложные имена состояний на их индексы в массиве состояний
         # fsmtext += f"start_state {states.index(self.initialState)}\n"
         # c = " ".join(sorted([str(states.index(x)) for x in self.finalStates]))
         # fsmtext += f"final_state {c}\n"
-        sortedtranslist = sorted(
-            [x for x in self.transitionList], key=itemgetter(0, 1, 2)
-        )
-        for tr in sortedtranslist:
-            fsmtext += f"{tr[0]} {tr[1]} {tr[2]} {tr[3]}\n"
-
-        with open(filename, "w") as file:
-            file.write(fsmtext)
+        with open_text(filename, "w", compresslevel) as file:
+            file.write(
+                f"F 0\ns {states}\ni {actions}\no {outputs}\nn0 {' '.join(x for x in init_states)}\np {len(self.transitionList)}\n"
+            )
+            self._write_transitions(file, transitions)
 
     @staticmethod
     def read_FSM(filename):
         """Считывает автомат из файла в формате "fsm".
         Также, проверяет корректность преамбулы.
+        Сжатые gzip, bz2 и lzma файлы распаковываются потоково.
 
         # TODO Добавить вызов consistency_check
 
@@ -189,26 +257,32 @@ class FA_simple(object):
         """
         fsm = FA_simple()
         fsm.isFSM = 1
-        fsm_file = open(filename, "r")
-        fsm_list = list(fsm_file)
-        fsm_file.close()
-        info: dict[str, int] = dict()
-        for line in fsm_list[:6]:
-            splitted = line.strip().split(" ")
-            info[splitted[0]] = int(splitted[1]) if len(splitted) == 2 else [int(x) for x in splitted[1:]]  # type: ignore
-
-        fsm.numberOfStates = info["s"]
-        fsm.numberOfInputs = info["i"]
-        fsm.numberOfOutputs = info["o"]
-        fsm.initialState = info["n0"]
-
-        for line in fsm_list[6:]:
-            elems = [s.strip() for s in line.split(" ")]
-            fsm.transitionList.append(elems)
-
-        inp_num_check = len(fsm.get_actions_list())  # inputs
-        out_num_check = len(fsm.get_outputs_list())
-        sts_num_check = len(fsm.get_states_list())
+        with open_text(filename) as fsm_file:
+            info: dict[str, int] = dict()
+            for line in islice(fsm_file, 6):
+                splitted = line.strip().split(" ")
+                info[splitted[0]] = int(splitted[1]) if len(splitted) == 2 else [int(x) for x in splitted[1:]]  # type: ignore
+
+            fsm.numberOfStates = info["s"]
+            fsm.numberOfInputs = info["i"]
+            fsm.numberOfOutputs = info["o"]
+            fsm.initialState = info["n0"]
+
+            # файл читается построчно; множества для проверки преамбулы
+            # собираются по ходу чтения, а не тремя проходами get_*_list
+            states, actions, outputs = set(), set(), set()
+            append = fsm.transitionList.append
+            for line in fsm_file:
+                elems = [s.strip() for s in line.split(" ")]
+                append(elems)
+                actions.add(elems[1])
+                outputs.add(elems[3])
+                states.add(elems[0])
+                states.add(elems[2])
+
+        inp_num_check = len(actions)  # inputs
+        out_num_check = len(outputs)
+        sts_num_check = len(states)
 
         if (
             inp_num_check != fsm.numberOfInputs
@@ -222,6 +296,7 @@ class FA_simple(object):
     @staticmethod
     def read_FA(filename):
         """Считывает полуавтомат из файла в формате "fa".
+        Сжатые gzip, bz2 и lzma файлы распаковываются потоково.
         TODO: проверка корректности преамбулы.
 
         Args:
@@ -233,35 +308,59 @@ class FA_simple(object):
         """
         fsm = FA_simple()
         fsm.isFSM = 0
-        fsm_file = open(filename, "r")
-        fsm_list = list(fsm_file)
-        fsm_file.close()
-        info: dict[str, Any] = dict()  #
-        for line in fsm_list[:4]:
-            splitted = line.strip().split(" ")
-            info[splitted[0]] = (
-                int(splitted[1])
-                if len(splitted) == 2
-                else [int(x) for x in splitted[1:]]
-            )
+        with open_text(filename) as fsm_file:
+            info: dict[str, Any] = dict()  #
+            for line in islice(fsm_file, 4):
+                splitted = line.strip().split(" ")
+                info[splitted[0]] = (
+                    int(splitted[1])
+                    if len(splitted) == 2
+                    else [int(x) for x in splitted[1:]]
+                )
 
-        fsm.numberOfStates = info["states_number"]
-        fsm.numberOfInputs = info["actions_number"]
-        fsm.initialState = info["start_state"]
-        if fsm.isFSM == 0:
-            if type(info["final_state"]) == list:
-                fsm.finalStates = set(info["final_state"])
+            fsm.numberOfStates = info["states_number"]
+            fsm.numberOfInputs = info["actions_number"]
+            fsm.initialState = info["start_state"]
+            if fsm.isFSM == 0:
+                if type(info["final_state"]) == list:
+                    fsm.finalStates = set(info["final_state"])
+                else:
+                    fsm.finalStates = set([info["final_state"]])
             else:
-                fsm.finalStates = set([info["final_state"]])
-        else:
-            fsm.finalStates = set()
+                fsm.finalStates = set()
 
-        for line in fsm_list[4:]:
-            elems = [s.strip() for s in line.split(" ")]
-            fsm.transitionList.append(elems)
+            append = fsm.transitionList.append
+            for line in fsm_file:
+                append([s.strip() for s in line.split(" ")])
 
         return fsm
 
+    def write_FSMB(self, filename):
+        """Записывает автомат в двоичный формат "fsmb": JSON-таблицы имен и колонки int32
+        (см. src/fa_binary.py). Строки переходов должны быть длины 3 или 4.
+
+        Args:
+                filename (str): Имя файла, куда будет записан автомат.
+        """
+        from src.fa_binary import write_fsmb
+
+        write_fsmb(self, filename)
+
+    @staticmethod
+    def read_FSMB(filename):
+        """Считывает автомат из двоичного файла "fsmb".
+        Для загрузки без копирования (mmap) используйте src.fa_binary.load.
+
+        Args:
+                filename(str): имя файла в формате "fsmb".
+
+        Returns:
+                FA_simple
+        """
+        from src.fa_binary import read_fsmb
+
+        return read_fsmb(filename, FA_simple)
+
     #######################################
     # GET INFO
 
@@ -697,6 +796,88 @@ class FA_simple(object):
 
         return reaction
 
+    def minimize(self) -> tuple["FA_simple", dict[int | str, int]]:
+        """Строит минимальный автомат, эквивалентный self (для FSM - с учетом выходов).
+        Начальное разбиение состояний - по выходной сигнатуре, уточнение - по классам преемников.
+        self не изменяется.
+
+        Returns:
+                Tuple:
+                        FA_simple: приведенный автомат, состояния закодированы целыми числами, начальное - 0.
+                        dict[int | str, int]: отображение old_state -> new_state для достижимых классов.
+        """
+        from src.fa_minimize import minimize
+
+        return minimize(self)
+
+    def trim(self) -> list[int | str]:
+        """Удаляет состояния, недостижимые из initialState, а для полуавтомата (isFSM == 0) также
+        состояния, из которых недостижимо ни одно финальное состояние, вместе с их переходами
+        (в т.ч. добавленными complete() в недостижимую часть).
+
+        Returns:
+                list: удаленные состояния.
+        """
+        from src.fa_graph import trim
+
+        return trim(self)
+
+    def access_sequences(self):
+        """Возвращает дерево кратчайших слов доступа к состояниям (обход в ширину от initialState).
+        Дерево не кэшируется: transitionList меняется на месте, поэтому оно
+        строится заново при каждом вызове.
+
+        Returns:
+                AccessTree: tree.word(state) - кратчайшее слово или None, если состояние недостижимо.
+        """
+        from src.fa_graph import access_sequences
+
+        return access_sequences(self)
+
+    def scc(self):
+        """Разбивает состояния на компоненты сильной связности (итеративный алгоритм Тарьяна).
+
+        Returns:
+                Components: labels[i] - номер компоненты i-го закодированного состояния;
+                        переходы между компонентами ведут от больших номеров к меньшим.
+        """
+        from src.fa_graph import scc
+
+        return scc(self)
+
+    def condensation(self):
+        """Строит граф конденсации: компоненты сильной связности и переходы между ними.
+
+        Returns:
+                Condensation: компоненты и CSR-смежность (offsets, targets) между ними.
+        """
+        from src.fa_graph import condensation
+
+        return condensation(self)
+
+    def to_csr(self):
+        """Экспортирует переходы в CSR-колонки (offsets по состояниям, отсортированные входы,
+        преемники и выходы) с поиском перехода двоичным поиском.
+
+        Returns:
+                CSRAutomaton: состояния и входы сопоставляются через str(), как в accept_FA.
+        """
+        from src.fa_csr import CSRAutomaton
+
+        return CSRAutomaton.from_fa(self)
+
+    def freeze(self):
+        """Снимает неизменяемую копию автомата: кортежи переходов, frozenset финальных
+        состояний и заранее вычисленный хеш. Снимок можно без блокировок передавать
+        потокам и процессам и использовать как ключ кэша; thaw() возвращает новый FA_simple.
+
+        Returns:
+                FrozenAutomaton.
+        """
+        from src.fa_frozen import FrozenAutomaton
+
+        return FrozenAutomaton.from_fa(self)
+
     #######################################
     # SIMULATION
 
@@ -0,0 +1,327 @@
+"""Двоичный формат автоматов .fsmb с загрузкой без копирования.
+
+Файл состоит из заголовка фиксированного размера, JSON-метаданных
+(таблицы имен состояний, входов и выходов, начальное состояние,
+объявленные размеры) и выровненных колонок int32 в порядке
+transitionList:
+
+    src[T] | inp[T] | dst[T] | out[T] | final bitmap[ceil(S / 8)]
+
+Выход -1 означает переход без выхода. Таблица имен, совпадающая с
+range(n), хранится одним числом и при загрузке остается range.
+
+load(..., mmap=True) отображает файл в память и возвращает
+MappedAutomaton, колонки которого - memoryview на страницы файла:
+загрузка не читает переходы, а несколько процессов делят одни и те же
+страницы. NumPy не является зависимостью проекта, поэтому колонки -
+memoryview формата "i", а не массивы NumPy; np.frombuffer принимает
+их без копирования. to_fa() строит обычный FA_dict или FA_simple.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap as _mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+from src.fa_pickle import _SymbolTable
+
+MAGIC = b"FSMB"
+VERSION = 1
+ALIGNMENT = 8
+
+_HEADER = struct.Struct("<4sHHqqqI")
+_FLAG_FSM = 1
+_FLAG_FINAL = 2
+_KINDS = {"FA_simple": FA_simple, "FA_dict": FA_dict}
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def _aligned(offset: int) -> int:
+    """
+    Округляет смещение вверх до ALIGNMENT.
+    """
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _table_meta(values: list[Any]):
+    """
+    Возвращает таблицу имен для JSON; range(n) из int сворачивается в {"range": n}.
+    """
+    if all(type(value) is int and value == index for index, value in enumerate(values)):
+        return {"range": len(values)}
+    for value in values:
+        if type(value) not in _JSON_TYPES:
+            raise ValueError(f"Symbol {value!r} cannot be stored in .fsmb")
+    return values
+
+
+def _table(meta) -> Any:
+    """
+    Восстанавливает таблицу имен из JSON.
+    """
+    if isinstance(meta, dict):
+        return range(meta["range"])
+    return meta
+
+
+def _int32(values: list[int]) -> array:
+    """
+    Упаковывает номера в array int32 с порядком байтов little-endian.
+    """
+    column = array("i", values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _rows_of(fa):
+    """
+    Возвращает (kind, строки переходов, Q, Sigma, короткие строки, тип строк).
+    """
+    if isinstance(fa, FA_dict):
+        outputs = fa.outputs
+        rows = [
+            (state, symbol, fa.transitions[(state, symbol)], outputs.get((state, symbol)))
+            for state, symbol in fa._order
+        ]
+        return "FA_dict", rows, fa.states, fa.inputs, fa._malformed_transitions, "tuple"
+    if isinstance(fa, FA_simple):
+        rows = []
+        kinds = set()
+        for tr in fa.transitionList:
+            if len(tr) not in (3, 4):
+                raise ValueError(f"Transition {tr!r} cannot be stored in .fsmb")
+            kinds.add(type(tr).__name__)
+            rows.append((tr[0], tr[1], tr[2], tr[3] if len(tr) == 4 else None))
+        if len(kinds) > 1 or not kinds <= {"list", "tuple"}:
+            raise ValueError("FA_simple rows must all be lists or all be tuples for .fsmb")
+        return "FA_simple", rows, (), (), (), kinds.pop() if kinds else "list"
+    raise TypeError(f"Cannot write {type(fa).__name__} as .fsmb")
+
+
+def write_fsmb(fa, filename) -> None:
+    """
+    Записывает FA_dict или FA_simple в двоичный формат .fsmb.
+    """
+    kind, rows, declared_states, declared_inputs, malformed, row_type = _rows_of(fa)
+    states, inputs, outputs = _SymbolTable(), _SymbolTable(), _SymbolTable()
+    states.ids(declared_states)
+    inputs.ids(declared_inputs)
+    q_count, sigma_count = len(states.values), len(inputs.values)
+
+    src = states.ids([row[0] for row in rows])
+    inp = inputs.ids([row[1] for row in rows])
+    dst = states.ids([row[2] for row in rows])
+    out = [-1 if row[3] is None else outputs.id(row[3]) for row in rows]
+    initial = states.id(fa.initialState)
+
+    final_states = getattr(fa, "finalStates", None)
+    bitmap = bytearray((len(states.values) + 7) // 8)
+    final_extra = []
+    for state in final_states or ():
+        index = states._index.get(state)
+        if index is not None and states.values[index].__class__ is state.__class__:
+            bitmap[index >> 3] |= 1 << (index & 7)
+        else:
+            final_extra.append(state)
+
+    meta = {
+        "kind": kind,
+        "rows": row_type,
+        "storage": getattr(fa, "_storage", None),
+        "states": _table_meta(states.values),
+        "inputs": _table_meta(inputs.values),
+        "outputs": _table_meta(outputs.values),
+        "q_count": q_count,
+        "sigma_count": sigma_count,
+        "initial": initial,
+        "final_extra": final_extra,
+        "declared": [fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs],
+        "malformed": [list(tr) for tr in malformed],
+    }
+    try:
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode()
+    except TypeError as exc:
+        raise ValueError(f"Automaton symbols cannot be stored in .fsmb: {exc}") from None
+
+    flags = (_FLAG_FSM if fa.isFSM else 0) | (_FLAG_FINAL if final_states is not None else 0)
+    header = _HEADER.pack(
+        MAGIC, VERSION, flags, len(states.values), len(inputs.values), len(rows), len(meta_bytes)
+    )
+    with open(filename, "wb") as stream:
+        stream.write(header)
+        stream.write(meta_bytes)
+        stream.write(b"\0" * (_aligned(stream.tell()) - stream.tell()))
+        for column in (src, inp, dst, out):
+            _int32(column).tofile(stream)
+        stream.write(bitmap)
+
+
+class MappedAutomaton:
+    """
+    Автомат, колонки которого - memoryview int32 на содержимое файла .fsmb.
+    """
+
+    def __init__(self, buffer, close=None) -> None:
+        """
+        Разбирает заголовок и создает представления колонок без копирования.
+        """
+        view = memoryview(buffer)
+        magic, version, flags, n_states, _, n_transitions, meta_size = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not an .fsmb file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported .fsmb version: {version}")
+        start = _HEADER.size
+        meta = json.loads(bytes(view[start:start + meta_size]))
+        offset = _aligned(start + meta_size)
+
+        columns = []
+        for _ in range(4):
+            end = offset + 4 * n_transitions
+            columns.append(view[offset:end].cast("i"))
+            offset = end
+        if sys.byteorder != "little":
+            columns = [_int32(column) for column in columns]
+
+        self.kind: str = meta["kind"]
+        self.is_fsm: int = 1 if flags & _FLAG_FSM else 0
+        self.states = _table(meta["states"])
+        self.inputs = _table(meta["inputs"])
+        self.outputs = _table(meta["outputs"])
+        self.src, self.inp, self.dst, self.out = columns
+        self.final = view[offset:offset + (n_states + 7) // 8]
+        self.initial: int = meta["initial"]
+        self._meta = meta
+        self._has_final = bool(flags & _FLAG_FINAL)
+        self._view = view
+        self._close = close
+
+    @property
+    def number_of_states(self) -> int:
+        """
+        Возвращает размер таблицы состояний.
+        """
+        return len(self.states)
+
+    @property
+    def number_of_transitions(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return len(self.src)
+
+    def is_final(self, s: int) -> bool:
+        """
+        Проверяет бит состояния s в битовой карте финальных состояний.
+        """
+        return bool(self.final[s >> 3] >> (s & 7) & 1)
+
+    def transition(self, t: int) -> tuple[Any, ...]:
+        """
+        Возвращает t-й переход в legacy-формате.
+        """
+        row = (self.states[self.src[t]], self.inputs[self.inp[t]], self.states[self.dst[t]])
+        o = self.out[t]
+        return row + (self.outputs[o],) if o >= 0 else row
+
+    def __len__(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return self.number_of_transitions
+
+    def __iter__(self):
+        """
+        Выдает переходы в legacy-формате по порядку.
+        """
+        for t in range(self.number_of_transitions):
+            yield self.transition(t)
+
+    def to_fa(self, cls=None):
+        """
+        Строит изменяемый автомат класса cls (по умолчанию - записанного в файле).
+        """
+        cls = cls or _KINDS[self.kind]
+        meta = self._meta
+        states = self.states
+        final_states = {states[s] for s in range(len(states)) if self.is_final(s)}
+        final_states.update(meta["final_extra"])
+
+        if cls is FA_dict:
+            fa = FA_dict(storage=meta["storage"] or "tuple")
+            fa.states.update(states[s] for s in range(meta["q_count"]))
+            fa.inputs.update(self.inputs[a] for a in range(meta["sigma_count"]))
+        else:
+            fa = cls()
+        fa.initialState = states[self.initial]
+        if self._has_final:
+            fa.finalStates = final_states
+        fa.isFSM = self.is_fsm
+        fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs = meta["declared"]
+
+        if cls is FA_dict:
+            outputs = self.outputs
+            out = [outputs[o] if o >= 0 else None for o in self.out]
+            fa._load_columns(
+                list(map(states.__getitem__, self.src)),
+                list(map(self.inputs.__getitem__, self.inp)),
+                list(map(states.__getitem__, self.dst)),
+                out if any(o >= 0 for o in self.out) else None,
+                malformed=meta["malformed"],
+            )
+        else:
+            row_type = list if meta["rows"] == "list" else tuple
+            fa.transitionList = [row_type(row) for row in self]
+        return fa
+
+    def close(self) -> None:
+        """
+        Освобождает представления и закрывает отображение файла.
+        """
+        for name in ("src", "inp", "dst", "out", "final"):
+            column = getattr(self, name)
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "MappedAutomaton":
+        """
+        Возвращает сам автомат для блока with.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Закрывает отображение файла при выходе из блока with.
+        """
+        self.close()
+
+
+def load(filename, mmap: bool = True) -> MappedAutomaton:
+    """
+    Открывает .fsmb: при mmap=True - отображением файла в память, иначе читает его целиком.
+    """
+    if not mmap:
+        return MappedAutomaton(Path(filename).read_bytes())
+    with open(filename, "rb") as stream:
+        mapped = _mmap.mmap(stream.fileno(), 0, access=_mmap.ACCESS_READ)
+    return MappedAutomaton(mapped, mapped.close)
+
+
+def read_fsmb(filename, cls=None):
+    """
+    Читает .fsmb и возвращает автомат класса cls (по умолчанию - записанного в файле).
+    """
+    with load(filename, mmap=False) as mapped:
+        return mapped.to_fa(cls)
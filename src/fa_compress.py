@@ -0,0 +1,100 @@
+"""Прозрачное сжатие текстовых файлов автоматов и корпусов слов.
+
+Файлы fsm/fa и корпуса слов - текст, который сжимается в 10-20 раз,
+поэтому при медленном диске или сетевой ФС выгоднее хранить их
+сжатыми. open_text открывает файл как обычный текстовый поток:
+
+- при чтении кодек определяется по сигнатуре в начале файла (gzip,
+  bz2, xz); у формата .lzma (LZMA_Alone) сигнатуры нет, поэтому для
+  него используется расширение;
+- при записи кодек выбирается по расширению (.gz, .bz2, .xz, .lzma),
+  уровень сжатия задается параметром compresslevel.
+
+Распаковка идет потоково: строки читаются из буфера кодека по мере
+итерации, файл целиком в одну строку не распаковывается. Используются
+только модули стандартной библиотеки gzip, bz2 и lzma.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+
+_MAGIC = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+_OPENERS = {
+    "gzip": (gzip.open, "compresslevel"),
+    "bz2": (bz2.open, "compresslevel"),
+    "lzma": (lzma.open, "preset"),
+}
+
+
+def codec_for_name(filename) -> str | None:
+    """
+    Возвращает кодек по расширению файла или None для несжатого файла.
+    """
+    return EXTENSIONS.get(Path(filename).suffix.lower())
+
+
+def detect_codec(filename) -> str | None:
+    """
+    Определяет кодек существующего файла по сигнатуре, для .lzma - по расширению.
+    """
+    with open(filename, "rb") as stream:
+        head = stream.read(6)
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    if Path(filename).suffix.lower() == ".lzma":
+        return "lzma"
+    return None
+
+
+def open_text(
+    filename, mode: str = "r", compresslevel: int | None = None, encoding: str | None = None
+) -> IO[str]:
+    """
+    Открывает текстовый файл, при необходимости через gzip, bz2 или lzma.
+
+    mode - "r", "w", "a" или "x" (допускается суффикс "t"). compresslevel
+    учитывается только при записи сжатого файла: для gzip и bz2 это
+    compresslevel, для lzma - preset; None - значение кодека по умолчанию.
+    """
+    kind = mode.rstrip("t")
+    if kind not in ("r", "w", "a", "x"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+    writing = kind != "r"
+    codec = codec_for_name(filename) if writing else detect_codec(filename)
+    if codec is None:
+        return open(filename, mode, encoding=encoding)
+
+    opener, level_name = _OPENERS[codec]
+    options: dict[str, Any] = {"encoding": encoding}
+    if writing and compresslevel is not None:
+        options[level_name] = compresslevel
+    if codec == "lzma" and writing and Path(filename).suffix.lower() == ".lzma":
+        options["format"] = lzma.FORMAT_ALONE
+    return opener(filename, kind + "t", **options)
+
+
+def read_words(filename) -> Iterator[list[str]]:
+    """
+    Потоково читает корпус слов: одно слово на строку, символы через пробел.
+
+    Символы возвращаются строками; пустая строка файла - пустое слово.
+    """
+    with open_text(filename) as lines:
+        yield from map(str.split, lines)
+
+
+def write_words(filename, words: Iterable[Iterable[Any]], compresslevel: int | None = None) -> None:
+    """
+    Записывает корпус слов в формате read_words, сжимая его по расширению файла.
+    """
+    with open_text(filename, "w", compresslevel) as file:
+        for word in words:
+            file.write(" ".join(map(str, word)) + "\n")
@@ -0,0 +1,235 @@
+"""Компактное CSR-представление функции переходов автомата.
+
+Переходы группируются по исходному состоянию: переходы состояния s
+лежат в позициях offsets[s]..offsets[s + 1] - 1 колонок inp/dst/out,
+внутри строки входы отсортированы, поэтому поиск перехода - двоичный
+поиск. Колонки - array('l') с индексами состояний, входов и выходов,
+имена хранятся один раз в таблицах states/inputs/outputs.
+
+Построение - две устойчивые сортировки подсчетом (по входу, затем по
+состоянию), то есть O(S + I + T). Смежность (offsets, dst) напрямую
+подходит для обхода в ширину и поиска компонент из fa_graph.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any
+
+from src.fa_graph import (
+    EncodedAutomaton,
+    _key_function,
+    bfs_visit,
+    encode_automaton,
+    scc_labels,
+)
+from src.fa_minimize import equivalence_classes
+
+
+def _counting_order(keys: array, size: int, order: array) -> array:
+    """
+    Устойчиво переупорядочивает позиции order по ключам keys[0..size).
+    """
+    starts = array("l", [0]) * (size + 1)
+    for t in order:
+        starts[keys[t] + 1] += 1
+    for k in range(size):
+        starts[k + 1] += starts[k]
+    result = array("l", [0]) * len(order)
+    for t in order:
+        k = keys[t]
+        result[starts[k]] = t
+        starts[k] += 1
+    return result
+
+
+class CSRAutomaton:
+    """
+    Автомат с переходами в CSR-колонках.
+    """
+
+    __slots__ = (
+        "states",
+        "inputs",
+        "outputs",
+        "initial",
+        "final",
+        "offsets",
+        "inp",
+        "dst",
+        "out",
+        "is_fsm",
+        "_key",
+        "_state_index",
+        "_input_index",
+    )
+
+    def __init__(self, encoded: EncodedAutomaton, key=str) -> None:
+        """
+        Строит CSR-колонки из закодированного автомата.
+        """
+        n, k = encoded.number_of_states, encoded.number_of_inputs
+        order = array("l", range(len(encoded.src)))
+        order = _counting_order(encoded.inp, k, order)
+        order = _counting_order(encoded.src, n, order)
+
+        offsets = array("l", [0]) * (n + 1)
+        for s in encoded.src:
+            offsets[s + 1] += 1
+        for s in range(n):
+            offsets[s + 1] += offsets[s]
+
+        outputs: list[Any] = []
+        output_index: dict[Any, int] = {}
+        inp, dst, out = array("l"), array("l"), array("l")
+        for t in order:
+            inp.append(encoded.inp[t])
+            dst.append(encoded.dst[t])
+            value = encoded.out[t]
+            if value is None:
+                out.append(-1)
+                continue
+            if value not in output_index:
+                output_index[value] = len(outputs)
+                outputs.append(value)
+            out.append(output_index[value])
+
+        self.states: list[Any] = encoded.states
+        self.inputs: list[Any] = encoded.inputs
+        self.outputs: list[Any] = outputs
+        self.initial: int = encoded.initial
+        self.final: bytearray = encoded.final
+        self.offsets: array = offsets
+        self.inp: array = inp
+        self.dst: array = dst
+        self.out: array = out
+        self.is_fsm: int = encoded.is_fsm
+        self._key = key
+        self._state_index: dict[Any, int] | None = None
+        self._input_index: dict[Any, int] | None = None
+
+    @classmethod
+    def from_fa(cls, fa) -> "CSRAutomaton":
+        """
+        Строит CSR-представление FA_simple или FA_dict с их семантикой сопоставления.
+        """
+        return cls(encode_automaton(fa), _key_function(fa))
+
+    @property
+    def number_of_states(self) -> int:
+        """
+        Возвращает число состояний.
+        """
+        return len(self.states)
+
+    @property
+    def number_of_transitions(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return len(self.dst)
+
+    # ---------------------------------------------------------
+    # Поиск переходов
+    # ---------------------------------------------------------
+
+    def state_id(self, state) -> int:
+        """
+        Возвращает индекс состояния или -1.
+        """
+        if self._state_index is None:
+            self._state_index = {self._key(name): s for s, name in enumerate(self.states)}
+        return self._state_index.get(self._key(state), -1)
+
+    def input_id(self, symbol) -> int:
+        """
+        Возвращает индекс входного символа или -1.
+        """
+        if self._input_index is None:
+            self._input_index = {self._key(name): a for a, name in enumerate(self.inputs)}
+        return self._input_index.get(self._key(symbol), -1)
+
+    def find(self, s: int, a: int) -> int:
+        """
+        Возвращает позицию перехода (s, a) в колонках или -1 (двоичный поиск по строке).
+        """
+        lo, hi = self.offsets[s], self.offsets[s + 1]
+        t = bisect_left(self.inp, a, lo, hi)
+        if t < hi and self.inp[t] == a:
+            return t
+        return -1
+
+    def step(self, s: int, a: int) -> int:
+        """
+        Возвращает индекс следующего состояния или -1, если переход не определен.
+        """
+        t = self.find(s, a)
+        return self.dst[t] if t >= 0 else -1
+
+    def lookup(self, state, symbol) -> tuple[Any, Any] | None:
+        """
+        Возвращает (следующее состояние, выход) по именам или None.
+        """
+        s, a = self.state_id(state), self.input_id(symbol)
+        if s < 0 or a < 0:
+            return None
+        t = self.find(s, a)
+        if t < 0:
+            return None
+        o = self.out[t]
+        return self.states[self.dst[t]], self.outputs[o] if o >= 0 else None
+
+    def accept(self, word) -> bool | None:
+        """
+        Проверяет допуск слова; None, если переход не определен.
+        """
+        s = self.initial
+        for symbol in word:
+            a = self.input_id(symbol)
+            s = self.step(s, a) if a >= 0 else -1
+            if s < 0:
+                return None
+        return bool(self.final[s])
+
+    # ---------------------------------------------------------
+    # Графовые алгоритмы
+    # ---------------------------------------------------------
+
+    def adjacency(self) -> tuple[array, array]:
+        """
+        Возвращает CSR-смежность (offsets, targets) без копирования колонок.
+        """
+        return self.offsets, self.dst
+
+    def reachable(self) -> bytearray:
+        """
+        Возвращает маску состояний, достижимых из начального.
+        """
+        return bfs_visit(self.offsets, self.dst, [self.initial])
+
+    def scc(self) -> tuple[array, int]:
+        """
+        Возвращает метки компонент сильной связности и их число.
+        """
+        return scc_labels(self.offsets, self.dst)
+
+    def encoded(self) -> EncodedAutomaton:
+        """
+        Возвращает колоночное представление для алгоритмов fa_graph/fa_minimize.
+        """
+        src = array("l", [0]) * len(self.dst)
+        for s in range(self.number_of_states):
+            for t in range(self.offsets[s], self.offsets[s + 1]):
+                src[t] = s
+        out = [self.outputs[o] if o >= 0 else None for o in self.out]
+        return EncodedAutomaton(
+            self.states, self.inputs, self.initial, self.final,
+            src, self.inp, self.dst, out, self.is_fsm,
+        )
+
+    def equivalence_classes(self) -> tuple[list[int], int]:
+        """
+        Возвращает классы эквивалентности состояний (для минимизации).
+        """
+        return equivalence_classes(self.encoded())
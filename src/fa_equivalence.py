@@ -0,0 +1,260 @@
+"""Проверка эквивалентности автоматов (алгоритм Хопкрофта-Карпа).
+
+Пары состояний (p, q) двух автоматов исследуются лениво, обходом в
+ширину от пары начальных состояний; полное произведение Q1 x Q2 не
+строится. Система непересекающихся множеств объединяет состояния,
+эквивалентность которых уже предположена, поэтому каждая новая пара
+либо сливает два класса, либо пропускается - всего O((n1 + n2) * |Sigma|)
+шагов почти линейного времени.
+
+Частичные автоматы дополняются неявным sink-состоянием: для DFA
+неопределенный переход означает отклонение слова, для FSM - отдельную
+реакцию "переход не определен", отличную от любого выхода. Переход
+FSM без выхода, как в FA_dict.move_seq_FSM, выдает выход 0.
+
+distinguishing_sequences использует то же ленивое произведение без
+слияния классов и потоково выдает кратчайшие различающие слова,
+например для генерации тестов, убивающих мутантов.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from src.FA_dict import FA_dict
+from src.fa_graph import encode_automaton
+
+_UNDEFINED = object()
+
+
+class _DisjointSets:
+    """
+    Система непересекающихся множеств с объединением по размеру.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Создает size одноэлементных множеств.
+        """
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, x: int) -> int:
+        """
+        Возвращает представителя множества, сокращая пути вдвое.
+        """
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """
+        Объединяет множества x и y; возвращает False, если они уже совпадали.
+        """
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        return True
+
+
+class PairExplorer:
+    """
+    Общий алфавит и функции переходов двух автоматов с неявными sink-состояниями.
+
+    Состояния каждого автомата закодированы индексами 0..n-1, индекс n
+    обозначает sink. Символы общего алфавита сопоставляются точно для
+    двух FA_dict и через str() в остальных случаях (как в FA_simple).
+    Определенный переход без выхода считается выдающим 0, как в
+    FA_dict.move_seq_FSM; неопределенный переход дает отдельную реакцию.
+    """
+
+    def __init__(self, a, b) -> None:
+        """
+        Кодирует оба автомата и строит таблицы переходов над общим алфавитом.
+        """
+        if bool(a.isFSM) != bool(b.isFSM):
+            raise ValueError("Cannot compare FSM with acceptor")
+        self.is_fsm = bool(a.isFSM)
+        exact = isinstance(a, FA_dict) and isinstance(b, FA_dict)
+        self._key = (lambda value: value) if exact else str
+
+        self.a = encode_automaton(a)
+        self.b = encode_automaton(b)
+
+        self.symbols: list[Any] = []
+        index: dict[Any, int] = {}
+        for encoded in (self.a, self.b):
+            for symbol in encoded.inputs:
+                if self._key(symbol) not in index:
+                    index[self._key(symbol)] = len(self.symbols)
+                    self.symbols.append(symbol)
+
+        self.delta_a, self.out_a, self.final_a = self._tables(self.a, index)
+        self.delta_b, self.out_b, self.final_b = self._tables(self.b, index)
+        self.initial = (self.a.initial, self.b.initial)
+
+    def _tables(self, encoded, index):
+        """
+        Переводит закодированный автомат на общий алфавит и добавляет sink.
+        """
+        n, k = encoded.number_of_states, len(self.symbols)
+        delta = [[n] * k for _ in range(n + 1)]
+        output: list[list[Any]] = [[_UNDEFINED] * k for _ in range(n + 1)]
+        local_to_common = [index[self._key(symbol)] for symbol in encoded.inputs]
+        for t in range(len(encoded.src)):
+            s, c = encoded.src[t], local_to_common[encoded.inp[t]]
+            delta[s][c] = encoded.dst[t]
+            out = encoded.out[t]
+            output[s][c] = self._key(out if out is not None else 0)
+        final = bytes(encoded.final) + b"\x00"
+        return delta, output, final
+
+    def differs_now(self, pair) -> bool:
+        """
+        Проверяет, различает ли пустое слово пару состояний DFA.
+        """
+        return not self.is_fsm and self.final_a[pair[0]] != self.final_b[pair[1]]
+
+    def differs_on(self, pair, c: int) -> bool:
+        """
+        Проверяет, различаются ли реакции FSM пары состояний на символ c.
+        """
+        return self.is_fsm and self.out_a[pair[0]][c] != self.out_b[pair[1]][c]
+
+    def successor(self, pair, c: int) -> tuple[int, int]:
+        """
+        Возвращает пару преемников по символу c общего алфавита.
+        """
+        return self.delta_a[pair[0]][c], self.delta_b[pair[1]][c]
+
+
+def _word(parents, pair) -> list[Any]:
+    """
+    Восстанавливает слово по родительским указателям.
+    """
+    word = []
+    while parents[pair] is not None:
+        pair, symbol = parents[pair]
+        word.append(symbol)
+    word.reverse()
+    return word
+
+
+def equivalent(a, b) -> tuple[bool, list[Any] | None]:
+    """
+    Проверяет эквивалентность двух автоматов FA_simple/FA_dict.
+
+    Для DFA сравниваются языки, для FSM - выходные последовательности
+    на всех входных словах. Пары исследуются в порядке обхода в
+    ширину, поэтому найденное различающее слово имеет минимальную длину.
+
+    Returns:
+        (True, None), если автоматы эквивалентны, иначе
+        (False, word) с кратчайшим различающим словом.
+    """
+    explorer = PairExplorer(a, b)
+    offset = explorer.a.number_of_states + 1
+    sets = _DisjointSets(offset + explorer.b.number_of_states + 1)
+
+    start = explorer.initial
+    parents: dict[tuple[int, int], Any] = {start: None}
+    if explorer.differs_now(start):
+        return False, []
+    sets.union(start[0], offset + start[1])
+
+    queue = deque([start])
+    while queue:
+        pair = queue.popleft()
+        for c, symbol in enumerate(explorer.symbols):
+            if explorer.differs_on(pair, c):
+                return False, _word(parents, pair) + [symbol]
+            successor = explorer.successor(pair, c)
+            if not sets.union(successor[0], offset + successor[1]):
+                continue
+            parents.setdefault(successor, (pair, symbol))
+            if explorer.differs_now(successor):
+                return False, _word(parents, successor)
+            queue.append(successor)
+    return True, None
+
+
+def distinguishing_sequences(a, b, k: int | None = None, max_length: int | None = None):
+    """
+    Генерирует кратчайшие входные слова, на которых автоматы ведут себя по-разному.
+
+    Обход в ширину по лениво строящемуся произведению; каждая пара
+    состояний посещается один раз (посещенные пары хранятся как целые
+    числа p * (n2 + 1) + q), поэтому объем работы ограничен размером
+    достижимой части графа пар. Слова выдаются в порядке неубывания
+    длины: для DFA - при различии принятия, для FSM - при первом
+    различии выходных последовательностей move_seq_FSM (продолжения
+    такого слова не выдаются).
+
+    Args:
+        k: максимальное число слов (None - без ограничения).
+        max_length: максимальная длина слова (None - без ограничения).
+    """
+    explorer = PairExplorer(a, b)
+    if k is not None and k <= 0:
+        return
+    width = explorer.b.number_of_states + 1
+    sinks = (explorer.a.number_of_states, explorer.b.number_of_states)
+    symbols = explorer.symbols
+    alphabet_size = len(symbols)
+
+    start = explorer.initial
+    start_code = start[0] * width + start[1]
+    parents = {start_code: -1}
+
+    def word_of(code):
+        word = []
+        step = parents[code]
+        while step >= 0:
+            code, c = divmod(step, alphabet_size)
+            word.append(symbols[c])
+            step = parents[code]
+        word.reverse()
+        return word
+
+    produced = 0
+    if explorer.differs_now(start):
+        yield []
+        produced += 1
+        if k is not None and produced >= k:
+            return
+
+    frontier = [start_code]
+    length = 0
+    while frontier and (max_length is None or length < max_length):
+        next_frontier = []
+        for code in frontier:
+            pair = divmod(code, width)
+            for c in range(alphabet_size):
+                if explorer.differs_on(pair, c):
+                    yield word_of(code) + [symbols[c]]
+                    produced += 1
+                    if k is not None and produced >= k:
+                        return
+                    continue
+                successor = explorer.successor(pair, c)
+                if successor == sinks:
+                    continue
+                successor_code = successor[0] * width + successor[1]
+                if successor_code in parents:
+                    continue
+                parents[successor_code] = code * alphabet_size + c
+                if explorer.differs_now(successor):
+                    yield word_of(successor_code)
+                    produced += 1
+                    if k is not None and produced >= k:
+                        return
+                next_frontier.append(successor_code)
+        frontier = next_frontier
+        length += 1
@@ -0,0 +1,256 @@
+"""Неизменяемые снимки автоматов FA_simple и FA_dict.
+
+Снимок хранит компоненты автомата в кортежах и frozenset, вычисляет
+хеш один раз при создании и не допускает изменения атрибутов. Поэтому
+его можно без блокировок читать из нескольких потоков, передавать
+рабочим процессам вместо глубокой копии и использовать как ключ
+кэшей (результаты минимизации, проверки эквивалентности и т.п.).
+
+Изменяемый автомат исходного класса восстанавливается методом thaw().
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+
+_KINDS = {"FA_simple": FA_simple, "FA_dict": FA_dict}
+
+
+def _row_types(transitions):
+    """
+    Возвращает общий тип строк переходов или имена типов по строкам.
+
+    Строка, не являющаяся списком, считается кортежем; пустая таблица
+    получает тип "list", как transitionList нового FA_simple.
+    """
+    names = tuple("list" if isinstance(tr, list) else "tuple" for tr in transitions)
+    if not names:
+        return "list"
+    if all(name == names[0] for name in names):
+        return names[0]
+    return names
+
+
+class FrozenAutomaton:
+    """
+    Неизменяемый хешируемый снимок автомата.
+    """
+
+    __slots__ = (
+        "kind",
+        "initialState",
+        "finalStates",
+        "isFSM",
+        "numberOfStates",
+        "numberOfInputs",
+        "numberOfOutputs",
+        "transitionList",
+        "states",
+        "inputs",
+        "storage",
+        "rows",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        initialState,
+        finalStates,
+        isFSM: int,
+        numberOfStates: int,
+        numberOfInputs: int,
+        numberOfOutputs: int,
+        transitionList,
+        states=None,
+        inputs=None,
+        storage: str | None = None,
+        rows=None,
+    ) -> None:
+        """
+        Сохраняет компоненты автомата в неизменяемых контейнерах.
+
+        finalStates равно None, если у исходного FA_simple множество F
+        не задавалось; states, inputs и storage задаются только для FA_dict.
+        rows - тип строк transitionList у FA_simple: "list", "tuple" или,
+        если типы строк различаются, кортеж таких имен по строкам.
+        """
+        if kind not in _KINDS:
+            raise ValueError(f"Unknown automaton kind: {kind!r}")
+        values = {
+            "kind": kind,
+            "initialState": initialState,
+            "finalStates": None if finalStates is None else frozenset(finalStates),
+            "isFSM": int(isFSM),
+            "numberOfStates": int(numberOfStates),
+            "numberOfInputs": int(numberOfInputs),
+            "numberOfOutputs": int(numberOfOutputs),
+            "transitionList": tuple(tuple(tr) for tr in transitionList),
+            "states": None if states is None else frozenset(states),
+            "inputs": None if inputs is None else frozenset(inputs),
+            "storage": storage,
+            "rows": rows if rows is None or isinstance(rows, str) else tuple(rows),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(self._key()))
+
+    @classmethod
+    def from_fa(cls, fa) -> "FrozenAutomaton":
+        """
+        Снимает неизменяемую копию с FA_simple или FA_dict.
+        """
+        if isinstance(fa, FA_dict):
+            return cls(
+                "FA_dict",
+                fa.initialState,
+                fa.finalStates,
+                fa.isFSM,
+                fa.numberOfStates,
+                fa.numberOfInputs,
+                fa.numberOfOutputs,
+                fa.iter_transitions(),
+                fa.states,
+                fa.inputs,
+                fa._storage,
+            )
+        if isinstance(fa, FA_simple):
+            return cls(
+                "FA_simple",
+                fa.initialState,
+                getattr(fa, "finalStates", None),
+                fa.isFSM,
+                fa.numberOfStates,
+                fa.numberOfInputs,
+                fa.numberOfOutputs,
+                fa.transitionList,
+                rows=_row_types(fa.transitionList),
+            )
+        raise TypeError(f"Cannot freeze {type(fa).__name__}")
+
+    def thaw(self):
+        """
+        Создает новый изменяемый автомат исходного класса с теми же компонентами.
+        """
+        if self.kind == "FA_dict":
+            fa = FA_dict(storage=self.storage)
+            fa.states.update(self.states)
+            fa.inputs.update(self.inputs)
+        else:
+            fa = FA_simple()
+        fa.initialState = self.initialState
+        if self.finalStates is not None:
+            fa.finalStates = set(self.finalStates)
+        fa.isFSM = self.isFSM
+        fa.numberOfStates = self.numberOfStates
+        fa.numberOfInputs = self.numberOfInputs
+        fa.numberOfOutputs = self.numberOfOutputs
+        if self.rows is None or self.rows == "tuple":
+            fa.transitionList = list(self.transitionList)
+        elif self.rows == "list":
+            fa.transitionList = [list(tr) for tr in self.transitionList]
+        else:
+            fa.transitionList = [
+                list(tr) if row == "list" else tr
+                for tr, row in zip(self.transitionList, self.rows)
+            ]
+        return fa
+
+    def _key(self) -> tuple[Any, ...]:
+        """
+        Возвращает кортеж компонентов, определяющий равенство и хеш.
+        """
+        return (
+            self.kind,
+            self.initialState,
+            self.finalStates,
+            self.isFSM,
+            self.numberOfStates,
+            self.numberOfInputs,
+            self.numberOfOutputs,
+            self.transitionList,
+            self.states,
+            self.inputs,
+            self.rows,
+        )
+
+    def __setattr__(self, name, value) -> None:
+        """
+        Запрещает изменение атрибутов снимка.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name) -> None:
+        """
+        Запрещает удаление атрибутов снимка.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self) -> int:
+        """
+        Возвращает хеш, вычисленный при создании снимка.
+        """
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """
+        Сравнивает снимки по хешу, затем по компонентам.
+        """
+        if not isinstance(other, FrozenAutomaton):
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self._key() == other._key())
+
+    def __reduce__(self):
+        """
+        Передает в pickle только компоненты; хеш пересчитывается при загрузке.
+        """
+        return (
+            FrozenAutomaton,
+            (
+                self.kind,
+                self.initialState,
+                self.finalStates,
+                self.isFSM,
+                self.numberOfStates,
+                self.numberOfInputs,
+                self.numberOfOutputs,
+                self.transitionList,
+                self.states,
+                self.inputs,
+                self.storage,
+                self.rows,
+            ),
+        )
+
+    def __copy__(self) -> "FrozenAutomaton":
+        """
+        Возвращает сам снимок: неизменяемый объект копировать не нужно.
+        """
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenAutomaton":
+        """
+        Возвращает сам снимок: неизменяемый объект копировать не нужно.
+        """
+        return self
+
+    def __repr__(self) -> str:
+        """
+        Возвращает краткое текстовое представление снимка.
+        """
+        return (
+            f"FrozenAutomaton({self.kind}, initial={self.initialState!r}, "
+            f"transitions={len(self.transitionList)})"
+        )
+
+
+def freeze(fa) -> FrozenAutomaton:
+    """
+    Возвращает неизменяемый снимок автомата; снимок возвращается как есть.
+    """
+    if isinstance(fa, FrozenAutomaton):
+        return fa
+    return FrozenAutomaton.from_fa(fa)
@@ -0,0 +1,612 @@
+"""Целочисленное представление автомата для графовых алгоритмов.
+
+Модуль переводит FA_simple и FA_dict в общее индексированное
+представление: состояния и входы нумеруются целыми числами, переходы
+хранятся колонками. Алгоритмы (минимизация, достижимость и т.д.)
+работают поверх этого представления и не зависят от реализации.
+
+Семантика сопоставления переходов повторяет исходные реализации:
+FA_simple сравнивает состояния и входы через str() и берет первый
+подходящий переход, FA_dict использует точные ключи словаря.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from src.FA_dict import FA_dict
+
+
+class EncodedAutomaton:
+    """
+    Автомат с состояниями и входами, закодированными индексами 0..n-1.
+    """
+
+    __slots__ = (
+        "states",
+        "inputs",
+        "initial",
+        "final",
+        "src",
+        "inp",
+        "dst",
+        "out",
+        "is_fsm",
+    )
+
+    def __init__(self, states, inputs, initial, final, src, inp, dst, out, is_fsm):
+        """
+        Сохраняет таблицы имен и колонки переходов.
+        """
+        self.states: list[Any] = states
+        self.inputs: list[Any] = inputs
+        self.initial: int = initial
+        self.final: bytearray = final
+        self.src: array = src
+        self.inp: array = inp
+        self.dst: array = dst
+        self.out: list[Any] = out
+        self.is_fsm: int = is_fsm
+
+    @property
+    def number_of_states(self) -> int:
+        """
+        Возвращает число закодированных состояний.
+        """
+        return len(self.states)
+
+    @property
+    def number_of_inputs(self) -> int:
+        """
+        Возвращает число закодированных входных символов.
+        """
+        return len(self.inputs)
+
+    def table(self) -> tuple[list[array], list[list[Any]]]:
+        """
+        Строит плотные таблицы delta[s][a] (-1 - переход не определен) и выходов.
+        """
+        n, k = self.number_of_states, self.number_of_inputs
+        delta = [array("l", [-1]) * k for _ in range(n)]
+        output: list[list[Any]] = [[None] * k for _ in range(n)]
+        for t in range(len(self.src)):
+            s, a = self.src[t], self.inp[t]
+            delta[s][a] = self.dst[t]
+            output[s][a] = self.out[t]
+        return delta, output
+
+
+def _key_function(fa):
+    """
+    Возвращает функцию нормализации имен, совместимую с семантикой реализации.
+    """
+    if isinstance(fa, FA_dict):
+        return lambda value: value
+    return str
+
+
+def is_final_state(fa, state) -> bool:
+    """
+    Проверяет принадлежность состояния F так же, как это делает accept_FA.
+    """
+    if isinstance(fa, FA_dict):
+        return fa._is_final(state)
+    final_states = getattr(fa, "finalStates", set())
+    try:
+        return int(state) in final_states
+    except (TypeError, ValueError):
+        return state in final_states
+
+
+def encode_automaton(fa) -> EncodedAutomaton:
+    """
+    Кодирует состояния и входы автомата целыми числами.
+
+    Состояния нумеруются начиная с initialState в порядке появления
+    на переходах, входы - в порядке появления. Переходы короче трех
+    элементов пропускаются, повторные пары (состояние, вход) не
+    заменяют первый найденный переход.
+    """
+    key = _key_function(fa)
+    states: list[Any] = []
+    state_index: dict[Any, int] = {}
+    inputs: list[Any] = []
+    input_index: dict[Any, int] = {}
+
+    def state_id(value):
+        k = key(value)
+        if k not in state_index:
+            state_index[k] = len(states)
+            states.append(value)
+        return state_index[k]
+
+    def input_id(value):
+        k = key(value)
+        if k not in input_index:
+            input_index[k] = len(inputs)
+            inputs.append(value)
+        return input_index[k]
+
+    initial = state_id(fa.initialState)
+    src, inp, dst = array("l"), array("l"), array("l")
+    out: list[Any] = []
+    seen: set[tuple[int, int]] = set()
+    for tr in fa.transitionList:
+        if len(tr) < 3:
+            continue
+        s, a = state_id(tr[0]), input_id(tr[1])
+        d = state_id(tr[2])
+        if (s, a) in seen:
+            continue
+        seen.add((s, a))
+        src.append(s)
+        inp.append(a)
+        dst.append(d)
+        out.append(tr[3] if len(tr) >= 4 else None)
+
+    if isinstance(fa, FA_dict):
+        for state in fa._all_states():
+            state_id(state)
+
+    final = bytearray(len(states))
+    for index, state in enumerate(states):
+        if is_final_state(fa, state):
+            final[index] = 1
+
+    return EncodedAutomaton(
+        states, inputs, initial, final, src, inp, dst, out, int(bool(fa.isFSM))
+    )
+
+
+def build_like(fa, transitions, initial, final_states, number_of_states):
+    """
+    Создает автомат того же класса, что и fa, из списка переходов.
+    """
+    res = type(fa)()
+    res.isFSM = fa.isFSM
+    res.initialState = initial
+    res.transitionList = list(transitions)
+    res.finalStates = set(final_states)
+    if isinstance(res, FA_dict):
+        res.states.update(range(number_of_states))
+    res.numberOfStates = number_of_states
+    res.numberOfInputs = len({tr[1] for tr in transitions})
+    res.numberOfOutputs = len({tr[3] for tr in transitions if len(tr) >= 4})
+    return res
+
+
+# ---------------------------------------------------------
+# CSR-смежность и достижимость
+# ---------------------------------------------------------
+
+
+def csr_adjacency(n: int, src: array, dst: array) -> tuple[array, array]:
+    """
+    Строит CSR-смежность (offsets, targets) подсчетом за O(n + T).
+
+    Преемники состояния s лежат в targets[offsets[s]:offsets[s + 1]].
+    """
+    offsets = array("l", [0]) * (n + 1)
+    for s in src:
+        offsets[s + 1] += 1
+    for s in range(n):
+        offsets[s + 1] += offsets[s]
+    position = array("l", offsets[:n])
+    targets = array("l", [0]) * len(src)
+    for t in range(len(src)):
+        s = src[t]
+        targets[position[s]] = dst[t]
+        position[s] += 1
+    return offsets, targets
+
+
+def bfs_visit(offsets: array, targets: array, sources) -> bytearray:
+    """
+    Отмечает вершины, достижимые из sources, обходом в ширину по фронтам.
+    """
+    visited = bytearray(len(offsets) - 1)
+    frontier = []
+    for s in sources:
+        if not visited[s]:
+            visited[s] = 1
+            frontier.append(s)
+    while frontier:
+        next_frontier = []
+        for s in frontier:
+            for d in targets[offsets[s]:offsets[s + 1]]:
+                if not visited[d]:
+                    visited[d] = 1
+                    next_frontier.append(d)
+        frontier = next_frontier
+    return visited
+
+
+def reachable_mask(encoded: EncodedAutomaton) -> bytearray:
+    """
+    Возвращает маску состояний, достижимых из начального.
+    """
+    offsets, targets = csr_adjacency(encoded.number_of_states, encoded.src, encoded.dst)
+    return bfs_visit(offsets, targets, [encoded.initial])
+
+
+def coreachable_mask(encoded: EncodedAutomaton) -> bytearray:
+    """
+    Возвращает маску состояний, из которых достижимо допускающее состояние.
+    """
+    offsets, targets = csr_adjacency(encoded.number_of_states, encoded.dst, encoded.src)
+    finals = [s for s in range(encoded.number_of_states) if encoded.final[s]]
+    return bfs_visit(offsets, targets, finals)
+
+
+def trim(fa) -> list[Any]:
+    """
+    Удаляет из fa недостижимые и (для DFA) некодостижимые состояния.
+
+    Для FSM допускающих состояний нет, поэтому удаляются только
+    недостижимые состояния. Начальное состояние сохраняется всегда,
+    даже если язык автомата пуст. Переходы, ведущие в удаленные
+    состояния, удаляются, поэтому полный DFA может стать частичным.
+    Возвращает список удаленных состояний.
+    """
+    encoded = encode_automaton(fa)
+    keep = reachable_mask(encoded)
+    if not encoded.is_fsm:
+        coreachable = coreachable_mask(encoded)
+        for s in range(encoded.number_of_states):
+            keep[s] &= coreachable[s]
+    keep[encoded.initial] = 1
+
+    removed = [state for s, state in enumerate(encoded.states) if not keep[s]]
+    if not removed:
+        return removed
+
+    key = _key_function(fa)
+    kept = {key(state) for s, state in enumerate(encoded.states) if keep[s]}
+
+    if isinstance(fa, FA_dict):
+        for tr_key in list(fa._order):
+            if tr_key[0] not in kept or fa.transitions[tr_key] not in kept:
+                del fa.transitions[tr_key]
+                fa.outputs.pop(tr_key, None)
+        fa._order = [tr_key for tr_key in fa._order if tr_key in fa.transitions]
+        fa._reindex_order()
+        fa.states = {state for state in encoded.states if key(state) in kept}
+    else:
+        fa.transitionList = [
+            tr
+            for tr in fa.transitionList
+            if len(tr) < 3 or (key(tr[0]) in kept and key(tr[2]) in kept)
+        ]
+
+    if getattr(fa, "finalStates", None):
+        removed_keys = {key(state) for state in removed}
+        fa.finalStates = {
+            state for state in fa.finalStates if key(state) not in removed_keys
+        }
+    fa.numberOfStates = len(kept)
+    return removed
+
+
+# ---------------------------------------------------------
+# Слова доступа (дерево кратчайших путей)
+# ---------------------------------------------------------
+
+
+class AccessTree:
+    """
+    Дерево обхода в ширину: кратчайшее слово доступа для каждого достижимого состояния.
+
+    Хранятся только колонки parent/symbol/depth по индексам состояний,
+    слова восстанавливаются по родительским ссылкам при запросе.
+    """
+
+    __slots__ = ("states", "inputs", "parent", "symbol", "depth", "order", "_key", "_index")
+
+    def __init__(self, encoded: EncodedAutomaton, key) -> None:
+        """
+        Строит дерево обходом в ширину от начального состояния.
+        """
+        n = encoded.number_of_states
+        offsets, edges = csr_adjacency(n, encoded.src, array("l", range(len(encoded.src))))
+        parent = array("l", [-1]) * n
+        symbol = array("l", [-1]) * n
+        depth = array("l", [-1]) * n
+        order = array("l", [encoded.initial])
+        depth[encoded.initial] = 0
+        dst, inp = encoded.dst, encoded.inp
+        head = 0
+        while head < len(order):
+            s = order[head]
+            head += 1
+            for t in edges[offsets[s]:offsets[s + 1]]:
+                d = dst[t]
+                if depth[d] < 0:
+                    depth[d] = depth[s] + 1
+                    parent[d] = s
+                    symbol[d] = inp[t]
+                    order.append(d)
+
+        self.states: list[Any] = encoded.states
+        self.inputs: list[Any] = encoded.inputs
+        self.parent: array = parent
+        self.symbol: array = symbol
+        self.depth: array = depth
+        self.order: array = order
+        self._key = key
+        self._index: dict[Any, int] | None = None
+
+    def _state_id(self, state) -> int:
+        """
+        Возвращает индекс состояния или -1, если состояние неизвестно.
+        """
+        if self._index is None:
+            key = self._key
+            self._index = {key(name): s for s, name in enumerate(self.states)}
+        return self._index.get(self._key(state), -1)
+
+    def word(self, state) -> list[Any] | None:
+        """
+        Восстанавливает кратчайшее слово доступа; None для недостижимого состояния.
+        """
+        s = self._state_id(state)
+        if s < 0 or self.depth[s] < 0:
+            return None
+        word = []
+        while self.parent[s] >= 0:
+            word.append(self.inputs[self.symbol[s]])
+            s = self.parent[s]
+        word.reverse()
+        return word
+
+    def distance(self, state) -> int:
+        """
+        Возвращает длину кратчайшего слова доступа или -1.
+        """
+        s = self._state_id(state)
+        return self.depth[s] if s >= 0 else -1
+
+    def __len__(self) -> int:
+        """
+        Возвращает число достижимых состояний.
+        """
+        return len(self.order)
+
+    def __iter__(self):
+        """
+        Перечисляет достижимые состояния в порядке обхода в ширину.
+        """
+        for s in self.order:
+            yield self.states[s]
+
+    def __contains__(self, state) -> bool:
+        """
+        Проверяет достижимость состояния.
+        """
+        return self.distance(state) >= 0
+
+    def __getitem__(self, state) -> list[Any]:
+        """
+        Возвращает слово доступа; KeyError для недостижимого состояния.
+        """
+        word = self.word(state)
+        if word is None:
+            raise KeyError(state)
+        return word
+
+    def items(self):
+        """
+        Выдает пары (состояние, слово доступа) в порядке обхода в ширину.
+        """
+        for state in self:
+            yield state, self.word(state)
+
+
+def _fingerprint(fa) -> tuple[Any, ...]:
+    """
+    Возвращает признаки структуры FA_dict, меняющиеся при его изменении.
+
+    FA_dict увеличивает счетчик _revision в изменяющих методах, а
+    хранилище переходов - свой счетчик version при любой записи, поэтому
+    сравнение признаков стоит O(1).
+    """
+    return (
+        fa.transitions,
+        fa._revision,
+        fa.transitions.version,
+        len(fa.states),
+        fa.initialState,
+    )
+
+
+def access_sequences(fa) -> AccessTree:
+    """
+    Возвращает дерево кратчайших слов доступа.
+
+    Для FA_dict дерево кэшируется на автомате и сбрасывается при изменении
+    его структуры (см. _fingerprint). FA_simple не кэшируется: его
+    transitionList меняется на месте без счетчика изменений, а сверка
+    строк стоила бы столько же, сколько обход.
+    """
+    if not isinstance(fa, FA_dict):
+        return AccessTree(encode_automaton(fa), _key_function(fa))
+    fingerprint = _fingerprint(fa)
+    cached = getattr(fa, "_access_cache", None)
+    if cached is not None:
+        old, tree = cached
+        if old[0] is fingerprint[0] and old[1:] == fingerprint[1:]:
+            return tree
+    tree = AccessTree(encode_automaton(fa), _key_function(fa))
+    fa._access_cache = (fingerprint, tree)
+    return tree
+
+
+# ---------------------------------------------------------
+# Компоненты сильной связности
+# ---------------------------------------------------------
+
+
+def scc_labels(offsets: array, targets: array) -> tuple[array, int]:
+    """
+    Размечает компоненты сильной связности итеративным алгоритмом Тарьяна.
+
+    Компоненты нумеруются в обратном топологическом порядке: переход
+    между разными компонентами всегда ведет из компоненты с большим
+    номером в компоненту с меньшим. Возвращает (labels, count).
+    """
+    n = len(offsets) - 1
+    index = array("l", [-1]) * n
+    low = array("l", [0]) * n
+    labels = array("l", [-1]) * n
+    position = array("l", offsets[:n]) if n else array("l")
+    on_stack = bytearray(n)
+    stack = array("l")
+    counter = count = 0
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call = [root]
+        while call:
+            v = call[-1]
+            p = position[v]
+            if p < offsets[v + 1]:
+                position[v] = p + 1
+                w = targets[p]
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call.append(w)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            call.pop()
+            if call and low[v] < low[call[-1]]:
+                low[call[-1]] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    labels[w] = count
+                    if w == v:
+                        break
+                count += 1
+    return labels, count
+
+
+class Components:
+    """
+    Разбиение состояний автомата на компоненты сильной связности.
+    """
+
+    __slots__ = ("states", "labels", "count", "_key", "_index")
+
+    def __init__(self, states: list[Any], labels: array, count: int, key) -> None:
+        """
+        Сохраняет имена состояний и метки компонент по их индексам.
+        """
+        self.states: list[Any] = states
+        self.labels: array = labels
+        self.count: int = count
+        self._key = key
+        self._index: dict[Any, int] | None = None
+
+    def component(self, state) -> int:
+        """
+        Возвращает номер компоненты состояния.
+        """
+        if self._index is None:
+            key = self._key
+            self._index = {key(name): s for s, name in enumerate(self.states)}
+        return self.labels[self._index[self._key(state)]]
+
+    def sizes(self) -> array:
+        """
+        Возвращает размеры компонент по их номерам.
+        """
+        result = array("l", [0]) * self.count
+        for label in self.labels:
+            result[label] += 1
+        return result
+
+    def members(self) -> list[list[Any]]:
+        """
+        Возвращает списки состояний каждой компоненты.
+        """
+        result: list[list[Any]] = [[] for _ in range(self.count)]
+        for s, label in enumerate(self.labels):
+            result[label].append(self.states[s])
+        return result
+
+
+class Condensation(Components):
+    """
+    Компоненты сильной связности и ациклический граф переходов между ними (CSR).
+    """
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, components: Components, src: array, dst: array) -> None:
+        """
+        Строит ребра между компонентами без повторов.
+        """
+        super().__init__(components.states, components.labels, components.count, components._key)
+        labels = self.labels
+        edge_src, edge_dst = array("l"), array("l")
+        for t in range(len(src)):
+            a, b = labels[src[t]], labels[dst[t]]
+            if a != b:
+                edge_src.append(a)
+                edge_dst.append(b)
+        offsets, targets = csr_adjacency(self.count, edge_src, edge_dst)
+
+        unique_offsets = array("l", [0]) * (self.count + 1)
+        unique = array("l")
+        mark = array("l", [-1]) * self.count
+        for c in range(self.count):
+            for d in targets[offsets[c]:offsets[c + 1]]:
+                if mark[d] != c:
+                    mark[d] = c
+                    unique.append(d)
+            unique_offsets[c + 1] = len(unique)
+        self.offsets: array = unique_offsets
+        self.targets: array = unique
+
+    def successors(self, label: int) -> array:
+        """
+        Возвращает компоненты, в которые ведут переходы из данной.
+        """
+        return self.targets[self.offsets[label]:self.offsets[label + 1]]
+
+    def terminal(self) -> list[int]:
+        """
+        Возвращает номера компонент-ловушек, из которых нет переходов в другие компоненты.
+        """
+        return [c for c in range(self.count) if self.offsets[c] == self.offsets[c + 1]]
+
+
+def scc(fa) -> Components:
+    """
+    Возвращает компоненты сильной связности графа переходов автомата.
+    """
+    encoded = encode_automaton(fa)
+    offsets, targets = csr_adjacency(encoded.number_of_states, encoded.src, encoded.dst)
+    labels, count = scc_labels(offsets, targets)
+    return Components(encoded.states, labels, count, _key_function(fa))
+
+
+def condensation(fa) -> Condensation:
+    """
+    Возвращает граф конденсации: компоненты и переходы между ними.
+    """
+    encoded = encode_automaton(fa)
+    offsets, targets = csr_adjacency(encoded.number_of_states, encoded.src, encoded.dst)
+    labels, count = scc_labels(offsets, targets)
+    components = Components(encoded.states, labels, count, _key_function(fa))
+    return Condensation(components, encoded.src, encoded.dst)
@@ -0,0 +1,311 @@
+"""Подсчет слов языка DFA по длинам.
+
+Число допускаемых слов длины n из состояния s удовлетворяет
+рекуррентности c_0 = [s in F], c_{k+1}(s) = sum_a c_k(delta(s, a)).
+Для небольших n она вычисляется динамикой по переходам за O(n * T),
+для больших - возведением матрицы счетчиков переходов в степень
+двоичным методом за O(S^3 log n). Вычисления точные (Python int).
+
+Рассматриваются только полезные состояния (достижимые и
+кодостижимые): остальные не влияют на число допускаемых слов.
+Отсутствующий переход означает отвержение слова.
+
+Таблица счетчиков суффиксов по длинам дает также равномерную выборку
+допускаемых слов и их ранжирование: слова фиксированной длины
+упорядочены лексикографически по порядку входных символов.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from src.fa_graph import _key_function, coreachable_mask, encode_automaton, reachable_mask
+
+
+def _symbol_order(symbols) -> list[int]:
+    """
+    Возвращает позиции символов в порядке сортировки (по repr, если значения несравнимы).
+    """
+    ids = range(len(symbols))
+    try:
+        ordered = sorted(ids, key=lambda a: symbols[a])
+    except TypeError:
+        ordered = sorted(ids, key=lambda a: repr(symbols[a]))
+    position = [0] * len(symbols)
+    for rank, a in enumerate(ordered):
+        position[a] = rank
+    return position
+
+
+class CountingSystem:
+    """
+    Переходы полезной части автомата в виде списков ребер по состояниям.
+    """
+
+    __slots__ = ("encoded", "key", "states", "initial", "edges", "final")
+
+    def __init__(self, fa) -> None:
+        """
+        Кодирует автомат и оставляет только полезные состояния.
+        """
+        encoded = encode_automaton(fa)
+        useful = reachable_mask(encoded)
+        coreachable = coreachable_mask(encoded)
+        for s in range(encoded.number_of_states):
+            useful[s] &= coreachable[s]
+
+        index = [-1] * encoded.number_of_states
+        states = []
+        for s in range(encoded.number_of_states):
+            if useful[s]:
+                index[s] = len(states)
+                states.append(s)
+
+        edges: list[list[tuple[int, int]]] = [[] for _ in states]
+        for t in range(len(encoded.src)):
+            s, d = index[encoded.src[t]], index[encoded.dst[t]]
+            if s >= 0 and d >= 0:
+                edges[s].append((encoded.inp[t], d))
+        position = _symbol_order(encoded.inputs)
+        for row in edges:
+            row.sort(key=lambda edge: position[edge[0]])
+
+        self.encoded = encoded
+        self.key = _key_function(fa)
+        self.states: list[int] = states
+        self.initial: int = index[encoded.initial]
+        self.edges: list[list[tuple[int, int]]] = edges
+        self.final: list[int] = [encoded.final[s] for s in states]
+
+    def symbol_ids(self) -> dict[Any, int]:
+        """
+        Возвращает отображение нормализованных входных символов в их индексы.
+        """
+        return {self.key(symbol): a for a, symbol in enumerate(self.encoded.inputs)}
+
+    def step(self, counts: list[int]) -> list[int]:
+        """
+        Переходит от счетчиков слов длины k к счетчикам длины k + 1.
+        """
+        return [sum(counts[d] for _, d in row) for row in self.edges]
+
+    def suffix_counts(self, n: int) -> list[list[int]]:
+        """
+        Возвращает таблицу counts[k][s] допускаемых суффиксов длины k для k = 0..n.
+        """
+        counts = [list(self.final)]
+        for _ in range(n):
+            counts.append(self.step(counts[-1]))
+        return counts
+
+    def matrix(self) -> list[list[int]]:
+        """
+        Строит плотную матрицу M[s][d] - число символов, ведущих из s в d.
+        """
+        size = len(self.states)
+        result = [[0] * size for _ in range(size)]
+        for s, row in enumerate(self.edges):
+            for _, d in row:
+                result[s][d] += 1
+        return result
+
+
+def _multiply(a: list[list[int]], b: list[list[int]]) -> list[list[int]]:
+    """
+    Перемножает квадратные матрицы, пропуская нулевые элементы.
+    """
+    size = len(b[0]) if b else 0
+    result = []
+    for row in a:
+        acc = [0] * size
+        for k, value in enumerate(row):
+            if value:
+                other = b[k]
+                for j in range(size):
+                    if other[j]:
+                        acc[j] += value * other[j]
+        result.append(acc)
+    return result
+
+
+def _apply(a: list[list[int]], vector: list[int]) -> list[int]:
+    """
+    Умножает матрицу на вектор.
+    """
+    return [sum(value * vector[k] for k, value in enumerate(row) if value) for row in a]
+
+
+def _power_apply(a: list[list[int]], vector: list[int], n: int) -> list[int]:
+    """
+    Вычисляет a^n * vector возведением в степень двоичным методом.
+    """
+    while n:
+        if n & 1:
+            vector = _apply(a, vector)
+        n >>= 1
+        if n:
+            a = _multiply(a, a)
+    return vector
+
+
+def _prefer_dynamic(system: CountingSystem, n: int) -> bool:
+    """
+    Сравнивает оценки стоимости динамики O(n * T) и возведения в степень O(S^3 log n).
+    """
+    transitions = sum(len(row) for row in system.edges)
+    return n * max(transitions, 1) <= len(system.states) ** 3 * n.bit_length()
+
+
+def count_accepted(fa, n: int) -> int:
+    """
+    Возвращает точное число допускаемых слов длины n.
+    """
+    if n < 0:
+        raise ValueError("Word length must be non-negative")
+    system = CountingSystem(fa)
+    if system.initial < 0:
+        return 0
+    if _prefer_dynamic(system, n):
+        counts = system.final
+        for _ in range(n):
+            counts = system.step(counts)
+        return counts[system.initial]
+    return _power_apply(system.matrix(), system.final, n)[system.initial]
+
+
+def count_accepted_upto(fa, n: int) -> int:
+    """
+    Возвращает точное число допускаемых слов длины от 0 до n.
+
+    Для возведения в степень к автомату добавляется состояние z с
+    петлей и переходами в z из всех допускающих состояний: каждое
+    допускаемое слово длины k <= n однозначно дополняется до длины n,
+    поэтому ответ - число слов длины n расширенного автомата.
+    """
+    if n < 0:
+        raise ValueError("Word length must be non-negative")
+    system = CountingSystem(fa)
+    if system.initial < 0:
+        return 0
+    if _prefer_dynamic(system, n):
+        counts = system.final
+        total = counts[system.initial]
+        for _ in range(n):
+            counts = system.step(counts)
+            total += counts[system.initial]
+        return total
+    size = len(system.states)
+    matrix = system.matrix()
+    for s in range(size):
+        matrix[s].append(system.final[s])
+    matrix.append([0] * size + [1])
+    return _power_apply(matrix, system.final + [1], n)[system.initial]
+
+
+# ---------------------------------------------------------
+# Выборка и ранжирование слов
+# ---------------------------------------------------------
+
+
+class AcceptedWords:
+    """
+    Допускаемые слова длины n, упорядоченные лексикографически, с доступом по номеру.
+    """
+
+    def __init__(self, fa, n: int) -> None:
+        """
+        Строит таблицу счетчиков суффиксов длины 0..n.
+        """
+        if n < 0:
+            raise ValueError("Word length must be non-negative")
+        self.system = CountingSystem(fa)
+        self.length = n
+        self.counts: list[list[int]] = (
+            self.system.suffix_counts(n) if self.system.initial >= 0 else []
+        )
+        self._symbols: dict[Any, int] | None = None
+
+    @property
+    def total(self) -> int:
+        """
+        Возвращает число допускаемых слов длины n (может превышать sys.maxsize).
+        """
+        if not self.counts:
+            return 0
+        return self.counts[self.length][self.system.initial]
+
+    def unrank(self, index: int) -> list[Any]:
+        """
+        Возвращает слово с номером index в лексикографическом порядке.
+        """
+        if not 0 <= index < self.total:
+            raise IndexError(f"Word index {index} out of range")
+        inputs = self.system.encoded.inputs
+        state = self.system.initial
+        word = []
+        for remaining in range(self.length - 1, -1, -1):
+            for a, d in self.system.edges[state]:
+                count = self.counts[remaining][d]
+                if index < count:
+                    word.append(inputs[a])
+                    state = d
+                    break
+                index -= count
+        return word
+
+    def rank(self, word) -> int:
+        """
+        Возвращает номер допускаемого слова длины n в лексикографическом порядке.
+        """
+        if len(word) != self.length:
+            raise ValueError(f"Word length must be {self.length}")
+        if not self.total:
+            raise ValueError(f"Word {word!r} is not accepted")
+        if self._symbols is None:
+            self._symbols = self.system.symbol_ids()
+        state = self.system.initial
+        index = 0
+        for remaining, symbol in zip(range(self.length - 1, -1, -1), word):
+            a = self._symbols.get(self.system.key(symbol), -1)
+            for b, d in self.system.edges[state]:
+                if b == a:
+                    state = d
+                    break
+                index += self.counts[remaining][d]
+            else:
+                raise ValueError(f"Word {word!r} is not accepted")
+        if not self.counts[0][state]:
+            raise ValueError(f"Word {word!r} is not accepted")
+        return index
+
+    def sample(self, k: int, rng: random.Random | None = None) -> list[list[Any]]:
+        """
+        Выбирает k равномерно распределенных допускаемых слов (с возвращением).
+        """
+        total = self.total
+        if not total:
+            raise ValueError(f"No accepted words of length {self.length}")
+        rng = rng or random.Random()
+        return [self.unrank(rng.randrange(total)) for _ in range(k)]
+
+
+def sample_accepted(fa, n: int, k: int, rng: random.Random | None = None) -> list[list[Any]]:
+    """
+    Выбирает k равномерно распределенных допускаемых слов длины n.
+    """
+    return AcceptedWords(fa, n).sample(k, rng)
+
+
+def rank_accepted(fa, word) -> int:
+    """
+    Возвращает номер допускаемого слова среди допускаемых слов той же длины.
+    """
+    return AcceptedWords(fa, len(word)).rank(word)
+
+
+def unrank_accepted(fa, index: int, n: int) -> list[Any]:
+    """
+    Возвращает допускаемое слово длины n с заданным номером.
+    """
+    return AcceptedWords(fa, n).unrank(index)
@@ -0,0 +1,130 @@
+"""Минимизация автоматов Мили (FSM) и DFA разбиением на классы.
+
+Начальное разбиение строится по выходной сигнатуре состояния: для
+каждого входа - выход перехода или признак того, что переход не
+определен (для DFA дополнительно учитывается принадлежность F).
+Далее классы уточняются по номерам классов преемников, пока число
+классов не перестанет расти (алгоритм Мура).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from src.fa_graph import build_like, encode_automaton
+
+_UNDEFINED = object()
+
+
+def _renumber(keys) -> tuple[list[int], int]:
+    """
+    Нумерует различные ключи в порядке первого появления.
+    """
+    index: dict[Any, int] = {}
+    blocks = []
+    for key in keys:
+        if key not in index:
+            index[key] = len(index)
+        blocks.append(index[key])
+    return blocks, len(index)
+
+
+def refinement_levels(encoded, delta=None, output=None):
+    """
+    Генерирует разбиения всех уровней уточнения, от начального до устойчивого.
+
+    Состояния в разных классах уровня L различаются словом длины L + 1.
+    """
+    if delta is None or output is None:
+        delta, output = encoded.table()
+    n = encoded.number_of_states
+
+    blocks, count = _renumber(
+        (
+            encoded.final[s] if not encoded.is_fsm else 0,
+            tuple(
+                output[s][a] if delta[s][a] >= 0 else _UNDEFINED
+                for a in range(encoded.number_of_inputs)
+            ),
+        )
+        for s in range(n)
+    )
+    yield blocks
+    while True:
+        refined, refined_count = _renumber(
+            (blocks[s],) + tuple(blocks[d] if d >= 0 else -1 for d in delta[s])
+            for s in range(n)
+        )
+        if refined_count == count:
+            return
+        blocks, count = refined, refined_count
+        yield blocks
+
+
+def equivalence_classes(encoded) -> tuple[list[int], int]:
+    """
+    Возвращает номер класса эквивалентности для каждого состояния и число классов.
+    """
+    blocks: list[int] = []
+    for blocks in refinement_levels(encoded):
+        pass
+    return blocks, max(blocks, default=-1) + 1
+
+
+def minimize(fa) -> tuple[Any, dict[Any, int]]:
+    """
+    Строит минимальный автомат, эквивалентный fa, и отображение старых состояний в новые.
+
+    Классы перекодируются целыми числами в порядке обхода в ширину
+    от начального состояния (начальное состояние получает код 0).
+    Классы, недостижимые из начального, в результат не попадают, а их
+    состояния - в отображение. Входные и выходные символы сохраняются
+    без изменений.
+    """
+    encoded = encode_automaton(fa)
+    blocks, count = equivalence_classes(encoded)
+    delta, output = encoded.table()
+
+    representative = [-1] * count
+    for s in range(encoded.number_of_states):
+        if representative[blocks[s]] < 0:
+            representative[blocks[s]] = s
+
+    start = blocks[encoded.initial]
+    code = [-1] * count
+    code[start] = 0
+    order = [start]
+    queue = deque(order)
+    while queue:
+        block = queue.popleft()
+        for d in delta[representative[block]]:
+            if d >= 0 and code[blocks[d]] < 0:
+                code[blocks[d]] = len(order)
+                order.append(blocks[d])
+                queue.append(blocks[d])
+
+    transitions = []
+    for new in order:
+        s = representative[new]
+        for a in range(encoded.number_of_inputs):
+            d = delta[s][a]
+            if d < 0:
+                continue
+            row = (code[new], encoded.inputs[a], code[blocks[d]])
+            if encoded.is_fsm:
+                row += (output[s][a],)
+            transitions.append(row)
+
+    mapping = {
+        state: code[blocks[s]]
+        for s, state in enumerate(encoded.states)
+        if code[blocks[s]] >= 0
+    }
+    final_states = {
+        code[blocks[s]]
+        for s in range(len(blocks))
+        if encoded.final[s] and code[blocks[s]] >= 0
+    }
+    reduced = build_like(fa, transitions, 0, final_states, len(order))
+    return reduced, mapping
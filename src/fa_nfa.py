@@ -0,0 +1,215 @@
+"""Недетерминированный автомат и его детерминизация.
+
+FA_simple.from_efa отбрасывает предикаты, поэтому из одной пары
+(состояние, вход) может выходить несколько переходов, а FA_dict такие
+переходы отвергает. NFA хранит их как множества состояний-преемников,
+представленные битовыми масками (Python int), и строит эквивалентный
+FA_dict построением подмножеств.
+
+Подмножества хэшируются как целые числа и нумеруются при первом
+появлении, исследуются только достижимые подмножества.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Callable
+
+from src.FA_dict import FA_dict
+
+
+def _members(bits: int):
+    """
+    Перечисляет индексы единичных битов маски.
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class NFA:
+    """
+    Недетерминированный конечный автомат без epsilon-переходов.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализирует пустой автомат.
+        """
+        self.states: list[Any] = []
+        self._state_index: dict[Any, int] = {}
+        self.inputs: set[Any] = set()
+        self.successors: list[dict[Any, int]] = []
+        self.initialStates: int = 0
+        self.finalStates: set[Any] = set()
+        self.determinization_stats: dict[str, int] = {}
+
+    # ---------------------------------------------------------
+    # Создание автомата
+    # ---------------------------------------------------------
+
+    def _state_id(self, state) -> int:
+        """
+        Возвращает индекс состояния, регистрируя новое при необходимости.
+        """
+        index = self._state_index.get(state)
+        if index is None:
+            index = len(self.states)
+            self._state_index[state] = index
+            self.states.append(state)
+            self.successors.append({})
+        return index
+
+    def add_state(self, state, initial: bool = False, final: bool = False) -> None:
+        """
+        Добавляет состояние и, при необходимости, помечает его начальным или допускающим.
+        """
+        index = self._state_id(state)
+        if initial:
+            self.initialStates |= 1 << index
+        if final:
+            self.finalStates.add(state)
+
+    def add_transition(self, state, symbol, next_state) -> None:
+        """
+        Добавляет переход; повторные переходы по той же паре не запрещены.
+        """
+        source = self._state_id(state)
+        target = self._state_id(next_state)
+        row = self.successors[source]
+        row[symbol] = row.get(symbol, 0) | (1 << target)
+        self.inputs.add(symbol)
+
+    @classmethod
+    def from_transitions(cls, transitions, initial_states, final_states=()):
+        """
+        Создает NFA из списка переходов (состояние, вход, состояние, ...).
+        """
+        nfa = cls()
+        for state in initial_states:
+            nfa.add_state(state, initial=True)
+        for tr in transitions:
+            nfa.add_transition(tr[0], tr[1], tr[2])
+        for state in final_states:
+            nfa.add_state(state, final=True)
+        return nfa
+
+    @classmethod
+    def from_efa(cls, efa):
+        """
+        Создает NFA из EFA-подобного объекта, отбрасывая предикаты и апдейт функции.
+        """
+        return cls.from_transitions(
+            [(tr.state1, tr.input, tr.state2) for tr in efa.transitionList],
+            [efa.initialState],
+            getattr(efa, "finalStates", set()),
+        )
+
+    # ---------------------------------------------------------
+    # Поведение
+    # ---------------------------------------------------------
+
+    def step(self, subset: int, symbol) -> int:
+        """
+        Возвращает маску преемников множества состояний по символу.
+        """
+        result = 0
+        for index in _members(subset):
+            result |= self.successors[index].get(symbol, 0)
+        return result
+
+    def _final_mask(self) -> int:
+        """
+        Возвращает маску допускающих состояний.
+        """
+        mask = 0
+        for state in self.finalStates:
+            if state in self._state_index:
+                mask |= 1 << self._state_index[state]
+        return mask
+
+    def accept(self, word) -> bool:
+        """
+        Проверяет, существует ли допускающий путь по слову.
+        """
+        subset = self.initialStates
+        for symbol in word:
+            subset = self.step(subset, symbol)
+            if not subset:
+                return False
+        return bool(subset & self._final_mask())
+
+    def subset_states(self, subset: int) -> list[Any]:
+        """
+        Переводит маску в список исходных состояний.
+        """
+        return [self.states[index] for index in _members(subset)]
+
+    # ---------------------------------------------------------
+    # Детерминизация
+    # ---------------------------------------------------------
+
+    def determinize(
+        self,
+        max_states: int | None = None,
+        progress: Callable[[dict[str, int]], Any] | None = None,
+        progress_every: int = 1000,
+    ) -> FA_dict:
+        """
+        Строит эквивалентный partial DFA построением достижимых подмножеств.
+
+        Состояния результата - целые числа в порядке обхода в ширину
+        (начальное - 0); пустое подмножество не добавляется, поэтому
+        отсутствующий переход означает отвержение слова.
+
+        Args:
+            max_states: предел числа состояний DFA; при превышении - ValueError.
+            progress: вызывается каждые progress_every подмножеств со
+                счетчиками explored/discovered/transitions.
+        """
+        final_mask = self._final_mask()
+        index = {self.initialStates: 0}
+        subsets = [self.initialStates]
+        stats = {"explored": 0, "discovered": 1, "transitions": 0}
+        self.determinization_stats = stats
+
+        fa = FA_dict()
+        fa.initialState = 0
+        fa.states.add(0)
+        queue = deque([self.initialStates])
+        while queue:
+            subset = queue.popleft()
+            source = index[subset]
+            if subset & final_mask:
+                fa.finalStates.add(source)
+
+            moves: dict[Any, int] = {}
+            for member in _members(subset):
+                for symbol, targets in self.successors[member].items():
+                    moves[symbol] = moves.get(symbol, 0) | targets
+
+            for symbol, target in moves.items():
+                target_id = index.get(target)
+                if target_id is None:
+                    if max_states is not None and len(subsets) >= max_states:
+                        raise ValueError(
+                            f"Determinization exceeds {max_states} states"
+                        )
+                    target_id = len(subsets)
+                    index[target] = target_id
+                    subsets.append(target)
+                    queue.append(target)
+                    stats["discovered"] += 1
+                fa._add_transition(source, symbol, target_id)
+                stats["transitions"] += 1
+
+            stats["explored"] += 1
+            if progress is not None and stats["explored"] % progress_every == 0:
+                progress(dict(stats))
+
+        fa.inputs.update(self.inputs)
+        fa._sync_declared_sizes()
+        if progress is not None and stats["explored"] % progress_every:
+            progress(dict(stats))
+        return fa
@@ -0,0 +1,163 @@
+"""Параллельный разбор больших FSM-файлов.
+
+Файл делится на куски по границам строк, каждый кусок разбирается в
+отдельном процессе в колонки номеров int32 с собственной таблицей
+символов. Основной процесс переводит колонки обратно в значения через
+таблицы кусков (map по списку, без разбора строк) и передает их
+пакетному построителю FA_dict._load_columns.
+
+Результат совпадает с FA_dict.read_FSM: те же правила разбора строк,
+тот же порядок переходов и коротких строк, те же строки заголовка в
+порядке их появления в файле и та же проверка согласованности.
+Сжатый файл нельзя делить по смещениям байтов, поэтому он читается
+последовательно через FA_dict.read_FSM.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.FA_dict import FA_dict
+from src.fa_compress import detect_codec
+
+DEFAULT_CHUNK_SIZE = 64 * 2 ** 20
+
+
+def split_chunks(filename, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """
+    Делит файл на диапазоны байтов [start, end), заканчивающиеся переводом строки.
+    """
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, "rb") as stream:
+        while bounds[-1] + chunk_size < size:
+            stream.seek(bounds[-1] + chunk_size)
+            stream.readline()
+            position = stream.tell()
+            if position >= size:
+                break
+            bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_chunk(filename, start: int, end: int):
+    """
+    Разбирает кусок файла так же, как FA_dict.read_FSM разбирает строки.
+
+    Возвращает (символы, src, inp, dst, out, короткие строки, строки заголовка);
+    колонки - array("i") номеров в таблице символов куска, выход -1 - нет выхода.
+    """
+    with open(filename, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+
+    symbols: list[Any] = []
+    index: dict[str, int] = {}
+    parse_atom = FA_dict._parse_atom
+
+    def symbol(token):
+        position = index.get(token)
+        if position is None:
+            position = index[token] = len(symbols)
+            symbols.append(parse_atom(token))
+        return position
+
+    src, inp, dst, out = array("i"), array("i"), array("i"), array("i")
+    malformed: list[tuple[Any, ...]] = []
+    header: list[tuple[str, Any]] = []
+    for line in io.TextIOWrapper(io.BytesIO(data)):
+        parts = line.split()
+        if not parts:
+            continue
+        key = parts[0]
+        if key in ("s", "i", "o"):
+            header.append((key, int(parts[1])))
+        elif key == "n0":
+            header.append((key, parse_atom(parts[1])))
+        elif key[0].isdigit() or key[0] == "-":
+            if len(parts) < 3:
+                malformed.append(tuple(map(parse_atom, parts)))
+                continue
+            src.append(symbol(parts[0]))
+            inp.append(symbol(parts[1]))
+            dst.append(symbol(parts[2]))
+            out.append(symbol(parts[3]) if len(parts) >= 4 else -1)
+    return symbols, src, inp, dst, out, malformed, header
+
+
+def _parse_chunk(args):
+    """
+    Распаковывает аргументы для map пула процессов.
+    """
+    return parse_chunk(*args)
+
+
+def read_FSM_parallel(filename, workers: int | None = None, chunk_size: int | None = None):
+    """
+    Читает FSM-файл, разбирая куски в workers процессах; результат как у FA_dict.read_FSM.
+
+    По умолчанию workers = os.cpu_count(), а размер куска выбирается так,
+    чтобы на процесс приходилось около четырех кусков. При workers=1
+    куски разбираются в текущем процессе. Сжатый файл читается последовательно.
+    """
+    if detect_codec(filename) is not None:
+        return FA_dict.read_FSM(filename)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(2 ** 20, os.path.getsize(filename) // (4 * workers) + 1)
+    tasks = [(filename, start, end) for start, end in split_chunks(filename, chunk_size)]
+    if workers == 1 or len(tasks) == 1:
+        results = map(_parse_chunk, tasks)
+        return _assemble(results)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _assemble(pool.map(_parse_chunk, tasks))
+
+
+def _assemble(results):
+    """
+    Собирает автомат из разобранных кусков в порядке файла.
+    """
+    fa = FA_dict()
+    fa.isFSM = 1
+    src: list[Any] = []
+    inp: list[Any] = []
+    dst: list[Any] = []
+    out: list[Any] = []
+    malformed: list[tuple[Any, ...]] = []
+    for symbols, c_src, c_inp, c_dst, c_out, c_malformed, header in results:
+        for key, value in header:
+            if key == "s":
+                fa.numberOfStates = value
+                fa.states.update(range(value))
+            elif key == "i":
+                fa.numberOfInputs = value
+                fa.inputs.update(range(value))
+            elif key == "o":
+                fa.numberOfOutputs = value
+            else:
+                fa.initialState = value
+        decode = symbols.__getitem__
+        src.extend(map(decode, c_src))
+        inp.extend(map(decode, c_inp))
+        dst.extend(map(decode, c_dst))
+        symbols.append(None)  # номер -1 (нет выхода) читается как последний символ
+        out.extend(map(decode, c_out))
+        malformed.extend(c_malformed)
+
+    observed_states = set(src)
+    observed_states.update(dst)
+    observed_outputs = set(out)
+    observed_outputs.discard(None)
+    fa._load_columns(src, inp, dst, out, malformed=malformed)
+    if (
+        len(set(inp)) != fa.numberOfInputs
+        or len(observed_outputs) != fa.numberOfOutputs
+        or len(observed_states) != fa.numberOfStates
+    ):
+        print("Error: fsm file is not consistent")
+    return fa
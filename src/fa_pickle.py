@@ -0,0 +1,299 @@
+"""Компактное состояние pickle для FA_simple и FA_dict.
+
+Вместо отдельных словарей, множеств и миллионов мелких кортежей в
+pickle попадают таблица символов (все различные состояния, входы и
+выходы в порядке появления) и колонки их номеров в array минимальной
+ширины. Такие состояния в несколько раз меньше и быстрее передаются
+в пулы процессов и сохраняются в дисковые кэши.
+
+Служебные кэши (_closures, _list_view, _access_cache и т.п.) не
+сохраняются и строятся заново при первом обращении. Если значения
+нельзя поместить в таблицу символов (например, они не хешируются),
+используется обычный словарь атрибутов.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+FORMAT = "fa-columns/1"
+
+_CACHES = frozenset({"_closures", "_final_memo", "_list_view", "_access_cache"})
+_DICT_FIELDS = frozenset(
+    {
+        "_storage",
+        "_states",
+        "_inputs",
+        "_final_states",
+        "transitions",
+        "outputs",
+        "_order",
+        "_ordinal",
+        "_malformed_transitions",
+        "_revision",
+        "initialState",
+        "isFSM",
+        "numberOfStates",
+        "numberOfInputs",
+        "numberOfOutputs",
+    }
+)
+_SIMPLE_FIELDS = frozenset(
+    {
+        "initialState",
+        "finalStates",
+        "isFSM",
+        "numberOfStates",
+        "numberOfInputs",
+        "numberOfOutputs",
+        "transitionList",
+    }
+)
+
+
+class _SymbolTable:
+    """
+    Нумерует значения в порядке первого появления.
+
+    Значения разных типов, равные друг другу (1, True, 1.0), получают
+    разные номера: основной словарь хранит первое из них, остальные -
+    словарь с ключом (тип, значение).
+    """
+
+    __slots__ = ("values", "_index", "_typed")
+
+    def __init__(self) -> None:
+        """
+        Создает пустую таблицу.
+        """
+        self.values: list[Any] = []
+        self._index: dict[Any, int] = {}
+        self._typed: dict[tuple[type, Any], int] = {}
+
+    def _add(self, value) -> int:
+        """
+        Возвращает номер значения, не совпавшего с основным словарем по типу.
+        """
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+            return index
+        key = (value.__class__, value)
+        index = self._typed.get(key)
+        if index is None:
+            index = self._typed[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def id(self, value) -> int:
+        """
+        Возвращает номер значения, добавляя его при первом появлении.
+        """
+        index = self._index.get(value)
+        if index is None or self.values[index].__class__ is not value.__class__:
+            return self._add(value)
+        return index
+
+    def ids(self, values) -> list[int]:
+        """
+        Возвращает номера последовательности значений.
+        """
+        get, known, add = self._index.get, self.values, self._add
+        result = []
+        append = result.append
+        for value in values:
+            index = get(value)
+            if index is None or known[index].__class__ is not value.__class__:
+                index = add(value)
+            append(index)
+        return result
+
+
+def _column(values: list[int]) -> array:
+    """
+    Упаковывает номера в array наименьшей подходящей ширины (со знаком, для -1).
+    """
+    peak = max(values, default=0)
+    for typecode, limit in (("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31)):
+        if peak < limit:
+            return array(typecode, values)
+    return array("q", values)
+
+
+def _decode(symbols: list[Any], ids) -> list[Any]:
+    """
+    Переводит колонку номеров обратно в значения.
+    """
+    return list(map(symbols.__getitem__, ids))
+
+
+def _encode_rows(table: _SymbolTable, rows) -> tuple[array, array, bytes | None]:
+    """
+    Кодирует строки произвольной длины: общая колонка ячеек, длины и признак list.
+    """
+    cells: list[int] = []
+    lengths: list[int] = []
+    lists = bytearray()
+    any_list = False
+    for row in rows:
+        if type(row) is list:
+            any_list = True
+            lists.append(1)
+        elif type(row) is tuple:
+            lists.append(0)
+        else:
+            raise TypeError(f"Unsupported transition row type: {type(row).__name__}")
+        lengths.append(len(row))
+        cells.extend(table.ids(row))
+    return _column(cells), _column(lengths), bytes(lists) if any_list else None
+
+
+def _decode_rows(symbols: list[Any], encoded) -> list[Any]:
+    """
+    Восстанавливает строки, закодированные _encode_rows.
+    """
+    cells, lengths, lists = encoded
+    values = _decode(symbols, cells)
+    rows: list[Any] = []
+    position = 0
+    for index, length in enumerate(lengths):
+        row = values[position:position + length]
+        rows.append(row if lists is not None and lists[index] else tuple(row))
+        position += length
+    return rows
+
+
+def _plain_state(fa) -> dict[str, Any]:
+    """
+    Возвращает словарь атрибутов без служебных кэшей.
+    """
+    return {name: value for name, value in fa.__dict__.items() if name not in _CACHES}
+
+
+def _extra(fa, fields) -> dict[str, Any]:
+    """
+    Возвращает атрибуты, не входящие в колонки и кэши.
+    """
+    return {
+        name: value
+        for name, value in fa.__dict__.items()
+        if name not in fields and name not in _CACHES
+    }
+
+
+def fa_dict_state(fa) -> tuple[str, dict[str, Any]]:
+    """
+    Кодирует FA_dict таблицей символов и колонками переходов.
+    """
+    try:
+        table = _SymbolTable()
+        keys = fa._order
+        src = table.ids([key[0] for key in keys])
+        inp = table.ids([key[1] for key in keys])
+        transitions, outputs = fa.transitions, fa.outputs
+        dst = table.ids(map(transitions.__getitem__, keys))
+        out = [table.id(outputs[key]) if key in outputs else -1 for key in keys]
+        payload = {
+            "initial": table.id(fa.initialState),
+            "final": _column(table.ids(fa.finalStates)),
+            "states": _column(table.ids(fa.states)),
+            "inputs": _column(table.ids(fa.inputs)),
+            "src": _column(src),
+            "inp": _column(inp),
+            "dst": _column(dst),
+            "out": _column(out),
+            "malformed": _encode_rows(table, fa._malformed_transitions),
+            "scalars": (
+                fa.isFSM,
+                fa.numberOfStates,
+                fa.numberOfInputs,
+                fa.numberOfOutputs,
+                fa._storage,
+                transitions.name,
+            ),
+            "extra": _extra(fa, _DICT_FIELDS),
+        }
+    except TypeError:
+        return FORMAT, {"plain": _plain_state(fa)}
+    payload["symbols"] = table.values
+    return FORMAT, payload
+
+
+def restore_fa_dict(fa, state) -> None:
+    """
+    Восстанавливает FA_dict из состояния fa_dict_state или обычного словаря.
+    """
+    plain = state if isinstance(state, dict) else state[1].get("plain")
+    if plain is not None:
+        fa.__init__(storage=plain.get("_storage", "tuple"))
+        fa.__dict__.update(plain)
+        return
+
+    payload = state[1]
+    symbols = payload["symbols"]
+    is_fsm, n_states, n_inputs, n_outputs, storage, actual = payload["scalars"]
+    fa.__init__(storage=storage)
+    keys = list(zip(_decode(symbols, payload["src"]), _decode(symbols, payload["inp"])))
+    out = [symbols[i] if i >= 0 else None for i in payload["out"]]
+    fa._bulk_load(
+        keys,
+        _decode(symbols, payload["dst"]),
+        out,
+        dict(zip(keys, range(len(keys)))),
+        actual,
+    )
+    fa._malformed_transitions = _decode_rows(symbols, payload["malformed"])
+    fa.states.update(_decode(symbols, payload["states"]))
+    fa.inputs.update(_decode(symbols, payload["inputs"]))
+    fa.initialState = symbols[payload["initial"]]
+    fa.finalStates = set(_decode(symbols, payload["final"]))
+    fa.isFSM = is_fsm
+    fa.numberOfStates = n_states
+    fa.numberOfInputs = n_inputs
+    fa.numberOfOutputs = n_outputs
+    fa.__dict__.update(payload["extra"])
+
+
+def fa_simple_state(fa) -> tuple[str, dict[str, Any]]:
+    """
+    Кодирует FA_simple таблицей символов и общей колонкой ячеек переходов.
+    """
+    try:
+        if type(fa.transitionList) is not list:
+            raise TypeError("transitionList is not a list")
+        table = _SymbolTable()
+        final_states = getattr(fa, "finalStates", None)
+        payload = {
+            "initial": table.id(fa.initialState),
+            "final": None if final_states is None else _column(table.ids(final_states)),
+            "rows": _encode_rows(table, fa.transitionList),
+            "scalars": (fa.isFSM, fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs),
+            "extra": _extra(fa, _SIMPLE_FIELDS),
+        }
+    except TypeError:
+        return FORMAT, {"plain": _plain_state(fa)}
+    payload["symbols"] = table.values
+    return FORMAT, payload
+
+
+def restore_fa_simple(fa, state) -> None:
+    """
+    Восстанавливает FA_simple из состояния fa_simple_state или обычного словаря.
+    """
+    if isinstance(state, dict):
+        fa.__dict__.update(state)
+        return
+    _, payload = state
+    if "plain" in payload:
+        fa.__dict__.update(payload["plain"])
+        return
+
+    symbols = payload["symbols"]
+    fa.initialState = symbols[payload["initial"]]
+    if payload["final"] is not None:
+        fa.finalStates = set(_decode(symbols, payload["final"]))
+    fa.isFSM, fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs = payload["scalars"]
+    fa.transitionList = _decode_rows(symbols, payload["rows"])
+    fa.__dict__.update(payload["extra"])
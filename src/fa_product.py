@@ -0,0 +1,219 @@
+"""Ленивые произведения автоматов FA_dict.
+
+Состояние произведения - пара (p, q) состояний исходных автоматов;
+пары вычисляются по требованию при обработке слова, поэтому
+пространство Q1 x Q2 целиком не строится. Отсутствующий переход
+компонента трактуется как переход в неявный отвергающий sink
+(в паре он обозначается None).
+
+Поддерживаются пересечение, объединение, разность и дополнение.
+Пары, из которых допуск уже невозможен (например, sink в одном из
+компонентов пересечения), считаются мертвыми: слово, попавшее в
+мертвую пару, отвергается без дальнейшего чтения.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from typing import Any
+
+from src.FA_dict import FA_dict
+
+_OPERATIONS = {
+    "intersection": (
+        lambda x, y: x and y,
+        lambda p, q: p is None or q is None,
+    ),
+    "union": (
+        lambda x, y: x or y,
+        lambda p, q: p is None and q is None,
+    ),
+    "difference": (
+        lambda x, y: x and not y,
+        lambda p, q: p is None,
+    ),
+    "complement": (
+        lambda x, y: not x,
+        lambda p, q: False,
+    ),
+}
+
+
+def _as_fa_dict(fa):
+    """
+    Приводит автомат к FA_dict, если это другая реализация.
+    """
+    if fa is None or isinstance(fa, FA_dict):
+        return fa
+    return FA_dict.from_FA(fa)
+
+
+class LazyProduct:
+    """
+    Произведение двух DFA, переходы которого вычисляются по требованию.
+
+    Args:
+        a, b: компоненты (b равен None для дополнения).
+        operation: "intersection" | "union" | "difference" | "complement".
+        memo_size: размер LRU-кэша переходов (None - без кэша).
+    """
+
+    def __init__(self, a, b, operation: str, memo_size: int | None = None) -> None:
+        """
+        Запоминает компоненты и выбирает правило допуска.
+        """
+        if operation not in _OPERATIONS:
+            raise ValueError(f"Unknown product operation: {operation}")
+        self.a = _as_fa_dict(a)
+        self.b = _as_fa_dict(b)
+        self.operation = operation
+        self._accepts, self._dead = _OPERATIONS[operation]
+        self.memo_size = memo_size
+        self._memo: OrderedDict[tuple[Any, Any], Any] = OrderedDict()
+        self.isFSM = 0
+        self.initialState = (
+            self.a.initialState,
+            self.b.initialState if self.b is not None else None,
+        )
+
+    @staticmethod
+    def _component_step(fa, state, symbol):
+        """
+        Делает шаг в компоненте; None обозначает неявный sink.
+        """
+        if fa is None or state is None:
+            return None
+        key = fa._lookup_key(state, symbol)
+        if key is None:
+            return None
+        return fa.transitions[key]
+
+    def inputs(self) -> set[Any]:
+        """
+        Возвращает объединение входных алфавитов компонентов.
+        """
+        inputs = set(self.a._all_inputs())
+        if self.b is not None:
+            inputs |= self.b._all_inputs()
+        return inputs
+
+    def step(self, state, symbol):
+        """
+        Возвращает пару-преемника или None, если она мертвая.
+        """
+        memo_key = (state, symbol)
+        if self.memo_size:
+            if memo_key in self._memo:
+                self._memo.move_to_end(memo_key)
+                return self._memo[memo_key]
+
+        p = self._component_step(self.a, state[0], symbol)
+        q = self._component_step(self.b, state[1], symbol)
+        successor = None if self._dead(p, q) else (p, q)
+
+        if self.memo_size:
+            self._memo[memo_key] = successor
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return successor
+
+    def _is_final(self, state) -> bool:
+        """
+        Проверяет, является ли пара допускающей для выбранной операции.
+        """
+        p, q = state
+        in_a = p is not None and self.a._is_final(p)
+        in_b = q is not None and self.b is not None and self.b._is_final(q)
+        return bool(self._accepts(in_a, in_b))
+
+    def accept_FA(self, word):
+        """
+        Интерпретирует слово на произведении и возвращает (принято, пройденные переходы).
+
+        Пройденные переходы - список ключей (пара, символ). Произведение
+        полностью определено: мертвая пара означает отвержение слова.
+        """
+        state = self.initialState
+        if self._dead(*state):
+            return False, []
+        fired = []
+        for symbol in word:
+            successor = self.step(state, symbol)
+            fired.append((state, symbol))
+            if successor is None:
+                return False, fired
+            state = successor
+        return self._is_final(state), fired
+
+    def run_words(self, words):
+        """
+        Потоково обрабатывает слова и выдает только признак принятия каждого.
+        """
+        for word in words:
+            yield self.accept_FA(word)[0]
+
+    def materialize(self, max_states: int | None = None) -> FA_dict:
+        """
+        Строит FA_dict только из достижимых живых пар (обход в ширину).
+
+        Результат - partial DFA: переходы в мертвые пары не добавляются.
+        """
+        fa = FA_dict()
+        start = self.initialState
+        fa.initialState = start
+        if self._dead(*start):
+            fa.states.add(start)
+            fa._sync_declared_sizes()
+            return fa
+
+        inputs = sorted(self.inputs(), key=repr)
+        fa.inputs.update(inputs)
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            fa.states.add(state)
+            if self._is_final(state):
+                fa.finalStates.add(state)
+            for symbol in inputs:
+                successor = self.step(state, symbol)
+                if successor is None:
+                    continue
+                fa._add_transition(state, symbol, successor)
+                if successor not in seen:
+                    if max_states is not None and len(seen) >= max_states:
+                        raise ValueError(
+                            f"Product exceeds {max_states} reachable states"
+                        )
+                    seen.add(successor)
+                    queue.append(successor)
+        fa._sync_declared_sizes()
+        return fa
+
+
+def intersection(a, b, memo_size: int | None = None) -> LazyProduct:
+    """
+    Возвращает ленивое произведение для L(a) ∩ L(b).
+    """
+    return LazyProduct(a, b, "intersection", memo_size)
+
+
+def union(a, b, memo_size: int | None = None) -> LazyProduct:
+    """
+    Возвращает ленивое произведение для L(a) ∪ L(b).
+    """
+    return LazyProduct(a, b, "union", memo_size)
+
+
+def difference(a, b, memo_size: int | None = None) -> LazyProduct:
+    """
+    Возвращает ленивое произведение для L(a) \\ L(b).
+    """
+    return LazyProduct(a, b, "difference", memo_size)
+
+
+def complement(a, memo_size: int | None = None) -> LazyProduct:
+    """
+    Возвращает ленивое дополнение L(a) относительно слов над алфавитом a.
+    """
+    return LazyProduct(a, None, "complement", memo_size)
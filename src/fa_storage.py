@@ -0,0 +1,594 @@
+"""Хранилища функции переходов FA_dict.
+
+Все хранилища реализуют отображение (состояние, вход) -> значение
+(MutableMapping) и метод lookup(state, symbol), поэтому FA_dict,
+_lookup_key и код, обращающийся к fa.transitions / fa.outputs
+напрямую, работают с любым из них:
+
+- tuple: словарь с ключом-кортежем (поведение по умолчанию);
+- nested: словарь состояний со словарями входов, без создания кортежей
+  при поиске;
+- dense: плоская таблица для состояний и входов - неотрицательных целых
+  чисел, индекс state * width + symbol;
+- csr: отсортированные колонки по строкам состояний с двоичным поиском
+  и буфером изменений, сливаемым в колонки пакетно.
+
+choose_storage выбирает хранилище для режима "auto" только среди tuple
+и nested: поиск в dense и csr выполняется кодом на Python и медленнее
+поиска в словаре, поэтому они подключаются явно, когда важнее память.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, MutableMapping
+from typing import Any
+
+
+class _Missing:
+    """
+    Метка отсутствующего перехода; при копировании остается тем же объектом.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        """
+        Сериализует метку как ссылку на глобальный объект модуля.
+        """
+        return "_MISSING"
+
+    def __repr__(self) -> str:
+        """
+        Возвращает текстовое представление метки.
+        """
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+NESTED_MIN_DEGREE = 8
+
+
+def _pairs(items):
+    """
+    Возвращает пары (ключ, значение) из отображения или итерируемого объекта.
+    """
+    return items.items() if isinstance(items, Mapping) else items
+
+
+class TransitionStorage(MutableMapping):
+    """
+    Отображение (состояние, вход) -> значение с поиском без создания ключа.
+
+    Счетчик version растет при каждой записи и удалении, поэтому кэши
+    FA_dict замечают и прямую перезапись fa.transitions[key] = value.
+    """
+
+    name = "abstract"
+    version = 0
+
+    def lookup(self, state, symbol, default=None):
+        """
+        Возвращает значение перехода или default.
+        """
+        return self.get((state, symbol), default)
+
+
+class TupleKeyStorage(dict):
+    """
+    Словарь с ключом (состояние, вход) - исходное представление FA_dict.
+
+    Чтение идет напрямую через dict; изменяющие методы увеличивают
+    счетчик version, как у TransitionStorage.
+    """
+
+    name = "tuple"
+    version = 0
+
+    def lookup(self, state, symbol, default=None):
+        """
+        Возвращает значение перехода или default.
+        """
+        return self.get((state, symbol), default)
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Записывает значение перехода.
+        """
+        self.version += 1
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        """
+        Удаляет переход.
+        """
+        self.version += 1
+        dict.__delitem__(self, key)
+
+    def __ior__(self, other):
+        """
+        Обновляет словарь из other (оператор |=).
+        """
+        self.version += 1
+        return dict.__ior__(self, other)
+
+    def pop(self, *args):
+        """
+        Удаляет переход и возвращает его значение.
+        """
+        self.version += 1
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        """
+        Удаляет и возвращает последний добавленный переход.
+        """
+        self.version += 1
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        """
+        Возвращает значение перехода, записывая default при его отсутствии.
+        """
+        self.version += 1
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Обновляет словарь из отображения или пар.
+        """
+        self.version += 1
+        dict.update(self, *args, **kwargs)
+
+    def clear(self) -> None:
+        """
+        Удаляет все переходы.
+        """
+        self.version += 1
+        dict.clear(self)
+
+
+TransitionStorage.register(TupleKeyStorage)
+
+
+class NestedStorage(TransitionStorage):
+    """
+    Словарь состояний, значения которого - словари входов.
+    """
+
+    name = "nested"
+
+    def __init__(self, items: Iterable = ()) -> None:
+        """
+        Создает хранилище и загружает пары ((состояние, вход), значение).
+        """
+        self._rows: dict[Any, dict[Any, Any]] = {}
+        self._size = 0
+        for key, value in _pairs(items):
+            self[key] = value
+
+    def lookup(self, state, symbol, default=None):
+        """
+        Возвращает значение перехода или default двумя обращениями к словарям.
+        """
+        row = self._rows.get(state)
+        if row is None:
+            return default
+        return row.get(symbol, default)
+
+    def __getitem__(self, key):
+        """
+        Возвращает значение перехода по ключу (состояние, вход).
+        """
+        state, symbol = key
+        return self._rows[state][symbol]
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Записывает значение перехода, создавая словарь состояния при необходимости.
+        """
+        self.version += 1
+        state, symbol = key
+        row = self._rows.setdefault(state, {})
+        if symbol not in row:
+            self._size += 1
+        row[symbol] = value
+
+    def __delitem__(self, key) -> None:
+        """
+        Удаляет переход; пустой словарь состояния удаляется.
+        """
+        self.version += 1
+        state, symbol = key
+        row = self._rows[state]
+        del row[symbol]
+        self._size -= 1
+        if not row:
+            del self._rows[state]
+
+    def __contains__(self, key) -> bool:
+        """
+        Проверяет наличие перехода; ключ не пары - False.
+        """
+        try:
+            state, symbol = key
+            return symbol in self._rows.get(state, ())
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self):
+        """
+        Выдает ключи (состояние, вход) в порядке добавления состояний.
+        """
+        for state, row in self._rows.items():
+            for symbol in row:
+                yield (state, symbol)
+
+    def __len__(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return self._size
+
+    def __repr__(self) -> str:
+        """
+        Возвращает текстовое представление хранилища.
+        """
+        return f"NestedStorage({dict(self.items())!r})"
+
+
+def _dense_index(value) -> bool:
+    """
+    Проверяет, годится ли значение как индекс плотной таблицы.
+    """
+    return type(value) is int and value >= 0
+
+
+class DenseStorage(TransitionStorage):
+    """
+    Плотная таблица для целочисленных состояний 0..n-1 и входов 0..k-1.
+
+    Отсутствующий переход хранится как служебная метка; таблица растет
+    при появлении новых состояний или входов, по каждому измерению не
+    меньше чем вдвое, поэтому вставка возрастающих ключей линейна.
+    """
+
+    name = "dense"
+
+    def __init__(self, items: Iterable = (), states: int = 0, width: int = 0) -> None:
+        """
+        Создает таблицу states x width и загружает пары.
+        """
+        self._height = states
+        self._width = width
+        self._cells: list[Any] = [_MISSING] * (states * width)
+        self._size = 0
+        for key, value in _pairs(items):
+            self[key] = value
+
+    def _resize(self, height: int, width: int) -> None:
+        """
+        Расширяет таблицу, сохраняя записанные значения.
+        """
+        cells = [_MISSING] * (height * width)
+        old_width = self._width
+        for state in range(self._height):
+            start = state * old_width
+            cells[state * width:state * width + old_width] = self._cells[start:start + old_width]
+        self._height, self._width, self._cells = height, width, cells
+
+    def _position(self, key) -> int:
+        """
+        Возвращает индекс ячейки или -1, если ключ вне таблицы.
+        """
+        try:
+            state, symbol = key
+        except (TypeError, ValueError):
+            return -1
+        if (
+            _dense_index(state)
+            and _dense_index(symbol)
+            and state < self._height
+            and symbol < self._width
+        ):
+            return state * self._width + symbol
+        return -1
+
+    def lookup(self, state, symbol, default=None):
+        """
+        Возвращает значение перехода или default обращением к ячейке таблицы.
+        """
+        if type(state) is int and type(symbol) is int and 0 <= symbol < self._width:
+            index = state * self._width + symbol
+            if 0 <= index < len(self._cells) and state >= 0:
+                value = self._cells[index]
+                if value is not _MISSING:
+                    return value
+        return default
+
+    def __getitem__(self, key):
+        """
+        Возвращает значение ячейки; пустая ячейка или ключ вне таблицы - KeyError.
+        """
+        position = self._position(key)
+        if position < 0 or self._cells[position] is _MISSING:
+            raise KeyError(key)
+        return self._cells[position]
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Записывает значение в ячейку, расширяя таблицу при необходимости.
+        """
+        self.version += 1
+        state, symbol = key
+        if not (_dense_index(state) and _dense_index(symbol)):
+            raise TypeError(f"Dense storage requires non-negative integer keys, got {key!r}")
+        if state >= self._height or symbol >= self._width:
+            height, width = self._height, self._width
+            if state >= height:
+                height = max(state + 1, height * 2)
+            if symbol >= width:
+                width = max(symbol + 1, width * 2)
+            self._resize(height, width)
+        position = state * self._width + symbol
+        if self._cells[position] is _MISSING:
+            self._size += 1
+        self._cells[position] = value
+
+    def __delitem__(self, key) -> None:
+        """
+        Очищает ячейку перехода.
+        """
+        self.version += 1
+        position = self._position(key)
+        if position < 0 or self._cells[position] is _MISSING:
+            raise KeyError(key)
+        self._cells[position] = _MISSING
+        self._size -= 1
+
+    def __contains__(self, key) -> bool:
+        """
+        Проверяет, что ячейка ключа существует и заполнена.
+        """
+        position = self._position(key)
+        return position >= 0 and self._cells[position] is not _MISSING
+
+    def __iter__(self):
+        """
+        Выдает ключи заполненных ячеек по строкам таблицы.
+        """
+        width = self._width
+        for position, value in enumerate(self._cells):
+            if value is not _MISSING:
+                yield divmod(position, width)
+
+    def __len__(self) -> int:
+        """
+        Возвращает число заполненных ячеек.
+        """
+        return self._size
+
+    def __repr__(self) -> str:
+        """
+        Возвращает текстовое представление хранилища.
+        """
+        return f"DenseStorage({dict(self.items())!r})"
+
+
+class CSRStorage(TransitionStorage):
+    """
+    Строки состояний в колонках: отсортированные индексы входов и значения.
+
+    Записи сначала попадают в буфер и сливаются в колонки пакетно
+    (compact), когда буфер превышает долю от размера колонок.
+    """
+
+    name = "csr"
+
+    def __init__(self, items: Iterable = ()) -> None:
+        """
+        Создает хранилище и строит колонки из пар.
+        """
+        self._state_ids: dict[Any, int] = {}
+        self._states: list[Any] = []
+        self._symbol_ids: dict[Any, int] = {}
+        self._symbols: list[Any] = []
+        self._offsets = array("l", [0])
+        self._columns = array("l")
+        self._values: list[Any] = []
+        self._pending: dict[tuple[Any, Any], Any] = {}
+        self._size = 0
+        self._pending.update(_pairs(items))
+        self._size = len(self._pending)
+        self.compact()
+
+    def _find(self, state, symbol) -> int:
+        """
+        Возвращает позицию перехода в колонках или -1.
+        """
+        row = self._state_ids.get(state)
+        column = self._symbol_ids.get(symbol)
+        if row is None or column is None:
+            return -1
+        lo, hi = self._offsets[row], self._offsets[row + 1]
+        position = bisect_left(self._columns, column, lo, hi)
+        if position < hi and self._columns[position] == column:
+            if self._values[position] is not _MISSING:
+                return position
+        return -1
+
+    def compact(self) -> None:
+        """
+        Сливает буфер изменений в колонки за O(T log d).
+        """
+        rows: dict[Any, list[tuple[int, Any]]] = {state: [] for state in self._states}
+        for row, state in enumerate(self._states):
+            for position in range(self._offsets[row], self._offsets[row + 1]):
+                value = self._values[position]
+                if value is not _MISSING:
+                    rows[state].append((self._columns[position], value))
+
+        for (state, symbol), value in self._pending.items():
+            if state not in rows:
+                rows[state] = []
+            column = self._symbol_ids.get(symbol)
+            if column is None:
+                column = self._symbol_ids[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+            entries = rows[state]
+            entries[:] = [entry for entry in entries if entry[0] != column]
+            if value is not _MISSING:
+                entries.append((column, value))
+        self._pending = {}
+
+        self._states = []
+        self._state_ids = {}
+        offsets, columns, values = array("l", [0]), array("l"), []
+        for state, entries in rows.items():
+            if not entries:
+                continue
+            self._state_ids[state] = len(self._states)
+            self._states.append(state)
+            entries.sort(key=lambda entry: entry[0])
+            for column, value in entries:
+                columns.append(column)
+                values.append(value)
+            offsets.append(len(columns))
+        self._offsets, self._columns, self._values = offsets, columns, values
+        self._size = len(values)
+
+    def _maybe_compact(self) -> None:
+        """
+        Сливает буфер, если он стал большим относительно колонок.
+        """
+        if len(self._pending) > max(1024, len(self._values) // 8):
+            self.compact()
+
+    def lookup(self, state, symbol, default=None):
+        """
+        Возвращает значение перехода или default (буфер, затем двоичный поиск).
+        """
+        if self._pending:
+            value = self._pending.get((state, symbol), _MISSING)
+            if value is not _MISSING or (state, symbol) in self._pending:
+                return default if value is _MISSING else value
+        position = self._find(state, symbol)
+        return self._values[position] if position >= 0 else default
+
+    def __getitem__(self, key):
+        """
+        Возвращает значение перехода по ключу (состояние, вход).
+        """
+        state, symbol = key
+        value = self.lookup(state, symbol, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Записывает переход: на место в колонках или в буфер изменений.
+        """
+        self.version += 1
+        state, symbol = key
+        if key not in self:
+            self._size += 1
+        position = self._find(state, symbol)
+        if position >= 0:
+            self._values[position] = value
+            self._pending.pop(key, None)
+            return
+        self._pending[key] = value
+        self._maybe_compact()
+
+    def __delitem__(self, key) -> None:
+        """
+        Удаляет переход из колонок или отмечает удаление в буфере.
+        """
+        self.version += 1
+        if key not in self:
+            raise KeyError(key)
+        state, symbol = key
+        position = self._find(state, symbol)
+        if position >= 0:
+            self._values[position] = _MISSING
+            self._pending.pop(key, None)
+        else:
+            self._pending[key] = _MISSING
+        self._size -= 1
+        self._maybe_compact()
+
+    def __contains__(self, key) -> bool:
+        """
+        Проверяет наличие перехода с учетом буфера изменений.
+        """
+        try:
+            state, symbol = key
+        except (TypeError, ValueError):
+            return False
+        return self.lookup(state, symbol, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        """
+        Выдает ключи из колонок, затем новые ключи из буфера.
+        """
+        pending = self._pending
+        for row, state in enumerate(self._states):
+            for position in range(self._offsets[row], self._offsets[row + 1]):
+                key = (state, self._symbols[self._columns[position]])
+                if self._values[position] is not _MISSING and key not in pending:
+                    yield key
+        for key, value in pending.items():
+            if value is not _MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        """
+        Возвращает число переходов.
+        """
+        return self._size
+
+    def __repr__(self) -> str:
+        """
+        Возвращает текстовое представление хранилища.
+        """
+        return f"CSRStorage({dict(self.items())!r})"
+
+
+STORAGES: dict[str, type] = {
+    TupleKeyStorage.name: TupleKeyStorage,
+    NestedStorage.name: NestedStorage,
+    DenseStorage.name: DenseStorage,
+    CSRStorage.name: CSRStorage,
+}
+
+
+def choose_storage(transitions) -> str:
+    """
+    Выбирает хранилище по средней степени состояний.
+
+    Вложенные словари - при средней степени не меньше NESTED_MIN_DEGREE,
+    иначе словарь с ключом-кортежем. Плотная таблица и CSR экономят
+    память, но поиск в них медленнее словаря, поэтому автоматически
+    они не выбираются.
+    """
+    count = len(transitions)
+    if not count:
+        return TupleKeyStorage.name
+    states = {state for state, _ in transitions}
+    if count >= NESTED_MIN_DEGREE * len(states):
+        return NestedStorage.name
+    return TupleKeyStorage.name
+
+
+def make_storage(name: str, items=()) -> TransitionStorage:
+    """
+    Создает хранилище по имени и загружает в него пары.
+    """
+    try:
+        storage_class = STORAGES[name]
+    except KeyError:
+        raise ValueError(f"Unknown transition storage: {name!r}") from None
+    return storage_class(items)
@@ -0,0 +1,439 @@
+"""Генерация конформных тестовых наборов для FSM (W- и Wp-методы).
+
+Тестовый набор W-метода - это P . Sigma^<=k . W, где P - покрытие
+состояний (кратчайшие слова, достигающие каждого состояния),
+Sigma^<=k - все определенные продолжения длины не больше k, а W -
+характеристическое множество, различающее все пары неэквивалентных
+состояний. Wp-метод после первой фазы P . W заменяет W на
+идентификатор W_s состояния, в которое пришло продолжение.
+
+Слова, являющиеся префиксами других тестов, избыточны. Тесты каждого
+слова покрытия строятся отсортированными, а потоки слов покрытия
+сливаются в лексикографическом порядке: тест выдается, как только
+следующее слово покрытия больше него, и отбрасывается, если следующий
+тест его продолжает. Поэтому в памяти находятся только тесты слов
+покрытия, еще продолжающихся текущим, а не весь набор.
+
+Обход переходов (transition tour) строит слова, срабатывающие каждый
+достижимый переход хотя бы раз, при близкой к минимальной суммарной длине.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from typing import Any
+
+from src.fa_graph import bfs_visit, csr_adjacency, encode_automaton
+from src.fa_minimize import refinement_levels
+
+
+def _prepare(fa):
+    """
+    Кодирует FSM и строит таблицы переходов и выходов.
+    """
+    encoded = encode_automaton(fa)
+    if not encoded.is_fsm:
+        raise ValueError("W-method requires an FSM")
+    delta, output = encoded.table()
+    return encoded, delta, output
+
+
+def _cover_ids(encoded, delta) -> list[tuple[int, tuple[int, ...]]]:
+    """
+    Возвращает пары (состояние, кратчайшее слово доступа) в порядке обхода в ширину.
+    """
+    cover = [(encoded.initial, ())]
+    seen = {encoded.initial}
+    queue = deque(cover)
+    while queue:
+        state, word = queue.popleft()
+        for a, d in enumerate(delta[state]):
+            if d >= 0 and d not in seen:
+                seen.add(d)
+                cover.append((d, word + (a,)))
+                queue.append((d, word + (a,)))
+    return cover
+
+
+def _response(delta, output, state: int, word) -> tuple[Any, ...]:
+    """
+    Возвращает реакцию состояния на слово; обрывается на неопределенном переходе.
+    """
+    reaction = []
+    for a in word:
+        d = delta[state][a]
+        if d < 0:
+            reaction.append(None)
+            break
+        reaction.append(output[state][a])
+        state = d
+    return tuple(reaction)
+
+
+def _first_split(levels, i: int, j: int) -> int:
+    """
+    Возвращает первый уровень разбиения, на котором i и j в разных классах.
+    """
+    for level, blocks in enumerate(levels):
+        if blocks[i] != blocks[j]:
+            return level
+    return -1
+
+
+def _separating_word(levels, delta, output, i: int, j: int) -> tuple[int, ...]:
+    """
+    Строит кратчайшее слово, различающее неэквивалентные состояния i и j.
+    """
+    word = []
+    level = _first_split(levels, i, j)
+    while True:
+        if level == 0:
+            for a in range(len(delta[i])):
+                if (delta[i][a] < 0) != (delta[j][a] < 0) or (
+                    delta[i][a] >= 0 and output[i][a] != output[j][a]
+                ):
+                    word.append(a)
+                    return tuple(word)
+        previous = levels[level - 1]
+        for a in range(len(delta[i])):
+            di, dj = delta[i][a], delta[j][a]
+            if previous[di] != previous[dj]:
+                word.append(a)
+                i, j = di, dj
+                level = _first_split(levels, i, j)
+                break
+
+
+def _characterization_ids(encoded, delta, output) -> list[tuple[int, ...]]:
+    """
+    Строит характеристическое множество в виде слов из индексов входов.
+    """
+    levels = list(refinement_levels(encoded, delta, output))
+    final = levels[-1]
+    n = encoded.number_of_states
+    representatives = sorted({final[s]: s for s in reversed(range(n))}.values())
+
+    words: list[tuple[int, ...]] = []
+    responses: list[list[tuple[Any, ...]]] = []
+    for x, i in enumerate(representatives):
+        for j in representatives[x + 1:]:
+            if any(r[i] != r[j] for r in responses):
+                continue
+            word = _separating_word(levels, delta, output, i, j)
+            words.append(word)
+            responses.append([_response(delta, output, s, word) for s in range(n)])
+    return words
+
+
+def _identifier_ids(encoded, delta, output, words) -> list[list[tuple[int, ...]]]:
+    """
+    Выбирает для каждого состояния подмножество W, отличающее его от остальных.
+    """
+    n = encoded.number_of_states
+    responses = [[_response(delta, output, s, w) for s in range(n)] for w in words]
+    identifiers = []
+    for i in range(n):
+        chosen: list[int] = []
+        for j in range(n):
+            if any(r[i] != r[j] for r in responses) and not any(
+                responses[w][i] != responses[w][j] for w in chosen
+            ):
+                chosen.append(
+                    next(w for w, r in enumerate(responses) if r[i] != r[j])
+                )
+        identifiers.append([words[w] for w in sorted(chosen)])
+    return identifiers
+
+
+def _names(encoded, word) -> list[Any]:
+    """
+    Переводит слово из индексов входов в исходные символы.
+    """
+    return [encoded.inputs[a] for a in word]
+
+
+def state_cover(fa) -> list[list[Any]]:
+    """
+    Возвращает покрытие состояний: кратчайшее слово доступа для каждого достижимого состояния.
+    """
+    encoded, delta, _ = _prepare(fa)
+    return [_names(encoded, word) for _, word in _cover_ids(encoded, delta)]
+
+
+def characterization_set(fa) -> list[list[Any]]:
+    """
+    Возвращает характеристическое множество W для FSM.
+
+    Для каждой пары неэквивалентных состояний, еще не различенной
+    выбранными словами, добавляется кратчайшее различающее слово.
+    """
+    encoded, delta, output = _prepare(fa)
+    return [_names(encoded, w) for w in _characterization_ids(encoded, delta, output)]
+
+
+def state_identifiers(fa) -> dict[Any, list[list[Any]]]:
+    """
+    Возвращает идентификаторы состояний W_s (подмножества W) для Wp-метода.
+    """
+    encoded, delta, output = _prepare(fa)
+    words = _characterization_ids(encoded, delta, output)
+    identifiers = _identifier_ids(encoded, delta, output, words)
+    return {
+        state: [_names(encoded, w) for w in identifiers[s]]
+        for s, state in enumerate(encoded.states)
+    }
+
+
+def _prefix_tests(delta, state: int, prefix, k: int, words, identifiers) -> list[tuple[int, ...]]:
+    """
+    Возвращает отсортированные без повторов тесты одного слова покрытия.
+    """
+    tests = set()
+    stack = [(state, prefix, 0)]
+    while stack:
+        current, word, depth = stack.pop()
+        if identifiers is None or depth == 0:
+            suffixes = words
+        else:
+            suffixes = identifiers[current]
+        for suffix in suffixes or [()]:
+            tests.add(word + suffix)
+        if depth < k:
+            for a, d in enumerate(delta[current]):
+                if d >= 0:
+                    stack.append((d, word + (a,), depth + 1))
+    return sorted(tests)
+
+
+def _merge_runs(runs):
+    """
+    Сливает отсортированные серии (начало, слова) в один отсортированный поток.
+
+    Все слова серии не меньше ее начала, а начала не убывают, поэтому
+    слово, меньшее начала очередной серии, уже не может быть обогнано
+    и выдается сразу; в куче остаются только незавершенные серии.
+    """
+    heap: list[tuple[tuple[int, ...], int, Any]] = []
+    for index, (start, run) in enumerate(runs):
+        while heap and heap[0][0] < start:
+            yield _advance(heap)
+        run = iter(run)
+        first = next(run, None)
+        if first is not None:
+            heappush(heap, (first, index, run))
+    while heap:
+        yield _advance(heap)
+
+
+def _advance(heap) -> tuple[int, ...]:
+    """
+    Снимает наименьшее слово кучи и ставит на его место следующее слово той же серии.
+    """
+    word, index, run = heappop(heap)
+    following = next(run, None)
+    if following is not None:
+        heappush(heap, (following, index, run))
+    return word
+
+
+def _leaves(ordered):
+    """
+    Выдает из отсортированного потока слова, не являющиеся префиксами следующих.
+
+    Продолжения слова в лексикографическом порядке идут сразу за ним,
+    поэтому достаточно сравнить слово со следующим отличным от него.
+    """
+    pending = None
+    for word in ordered:
+        if pending is not None and word[:len(pending)] != pending:
+            yield pending
+        pending = word
+    if pending is not None:
+        yield pending
+
+
+def _suite_runs(delta, cover, k: int, words, identifiers):
+    """
+    Выдает серии тестов для отсортированных слов покрытия.
+    """
+    for state, prefix in cover:
+        yield prefix, _prefix_tests(delta, state, prefix, k, words, identifiers)
+
+
+def _suite_chunk(args) -> list[tuple[int, ...]]:
+    """
+    Строит тесты для непрерывного отрезка отсортированного покрытия без префиксов внутри отрезка.
+    """
+    delta, cover, k, words, identifiers = args
+    return list(_leaves(_merge_runs(_suite_runs(delta, cover, k, words, identifiers))))
+
+
+def conformance_suite(fa, k: int = 1, method: str = "W", processes: int | None = None):
+    """
+    Потоково выдает тестовый набор W- или Wp-метода для FSM.
+
+    Тесты выдаются в лексикографическом порядке номеров входов по мере
+    построения; весь набор в памяти не собирается.
+
+    Args:
+        k: максимальная длина продолжений Sigma^<=k после слов покрытия.
+        method: "W" или "Wp".
+        processes: число процессов для построения частей набора
+            (None или 1 - в текущем процессе). Части - непрерывные
+            отрезки покрытия; их результаты выдаются по мере готовности.
+    """
+    if method not in {"W", "Wp"}:
+        raise ValueError(f"Unknown test generation method: {method}")
+    encoded, delta, output = _prepare(fa)
+    words = _characterization_ids(encoded, delta, output)
+    identifiers = (
+        _identifier_ids(encoded, delta, output, words) if method == "Wp" else None
+    )
+    delta_lists = [list(row) for row in delta]
+    cover = sorted(_cover_ids(encoded, delta), key=lambda entry: entry[1])
+
+    if processes and processes > 1 and len(cover) > 1:
+        size = -(-len(cover) // (4 * processes))
+        chunks = [cover[i:i + size] for i in range(0, len(cover), size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            parts = pool.map(
+                _suite_chunk,
+                [(delta_lists, chunk, k, words, identifiers) for chunk in chunks],
+            )
+            runs = zip((chunk[0][1] for chunk in chunks), parts)
+            for word in _leaves(_merge_runs(runs)):
+                yield _names(encoded, word)
+    else:
+        runs = _suite_runs(delta_lists, cover, k, words, identifiers)
+        for word in _leaves(_merge_runs(runs)):
+            yield _names(encoded, word)
+
+
+# ---------------------------------------------------------
+# Обход переходов (transition tour)
+# ---------------------------------------------------------
+
+
+def _shortest_path(out_edges, dst, source: int, is_target) -> list[int] | None:
+    """
+    Ищет обходом в ширину кратчайший путь (список переходов) до первого подходящего перехода.
+    """
+    parents: dict[int, int] = {source: -1}
+    via: dict[int, int] = {}
+    queue = deque([source])
+    while queue:
+        state = queue.popleft()
+        for t in out_edges[state]:
+            if is_target(t):
+                path = [t]
+                while parents[state] >= 0:
+                    path.append(via[state])
+                    state = parents[state]
+                path.reverse()
+                return path
+            d = dst[t]
+            if d not in parents:
+                parents[d] = state
+                via[d] = t
+                queue.append(d)
+    return None
+
+
+def _euler_tour(out_edges, src, dst, initial: int) -> list[int]:
+    """
+    Строит обход всех переходов сильно связного графа дополнением до эйлерова.
+
+    Вершины с избытком входящих переходов соединяются кратчайшими путями
+    с ближайшими вершинами с избытком исходящих (жадное сопоставление),
+    продублированные переходы добавляются к графу, затем алгоритм
+    Хирхольцера строит эйлеров цикл от начального состояния.
+    """
+    n = len(out_edges)
+    balance = [0] * n
+    for row in out_edges:
+        for t in row:
+            balance[src[t]] -= 1
+            balance[dst[t]] += 1
+
+    edges = [list(row) for row in out_edges]
+    for state in range(n):
+        while balance[state] > 0:
+            path = _shortest_path(out_edges, dst, state, lambda t: balance[dst[t]] < 0)
+            for t in path:
+                edges[src[t]].append(t)
+            balance[state] -= 1
+            balance[dst[path[-1]]] += 1
+
+    walk: list[int] = []
+    stack = [(initial, -1)]
+    position = [0] * n
+    while stack:
+        state, via = stack[-1]
+        if position[state] < len(edges[state]):
+            t = edges[state][position[state]]
+            position[state] += 1
+            stack.append((dst[t], t))
+        else:
+            stack.pop()
+            if via >= 0:
+                walk.append(via)
+    walk.reverse()
+
+    first = {}
+    for index, t in enumerate(walk):
+        first.setdefault(t, index)
+    end = len(walk)
+    while end and first[walk[end - 1]] < end - 1:
+        end -= 1
+    return walk[:end]
+
+
+def transition_tour(fa) -> list[list[Any]]:
+    """
+    Строит входные слова, выполнение которых срабатывает каждый достижимый переход.
+
+    Если достижимая часть автомата сильно связна, возвращается одно
+    слово - эйлеров обход графа, дополненного кратчайшими путями
+    (приближение задачи китайского почтальона). Иначе слова строятся
+    жадно: к текущему слову добавляется путь до ближайшего непокрытого
+    перехода, а когда из текущего состояния непокрытые переходы
+    недостижимы, начинается новое слово из начального состояния.
+    Недостижимые переходы не покрываются.
+    """
+    encoded = encode_automaton(fa)
+    n = encoded.number_of_states
+    src, dst = encoded.src, encoded.dst
+    out_edges: list[list[int]] = [[] for _ in range(n)]
+    for t in range(len(src)):
+        out_edges[src[t]].append(t)
+
+    forward = bfs_visit(*csr_adjacency(n, src, dst), [encoded.initial])
+    backward = bfs_visit(*csr_adjacency(n, dst, src), [encoded.initial])
+    reachable = [t for t in range(len(src)) if forward[src[t]]]
+    if not reachable:
+        return []
+
+    if all(backward[s] for s in range(n) if forward[s]):
+        live = [row if forward[s] else [] for s, row in enumerate(out_edges)]
+        walk = _euler_tour(live, src, dst, encoded.initial)
+        return [[encoded.inputs[encoded.inp[t]] for t in walk]]
+
+    covered = bytearray(len(src))
+    remaining = len(reachable)
+    words: list[list[Any]] = []
+    while remaining:
+        state, word = encoded.initial, []
+        while True:
+            path = _shortest_path(out_edges, dst, state, lambda t: not covered[t])
+            if path is None:
+                break
+            for t in path:
+                if not covered[t]:
+                    covered[t] = 1
+                    remaining -= 1
+                word.append(encoded.inputs[encoded.inp[t]])
+            state = dst[path[-1]]
+        words.append(word)
+    return words
@@ -0,0 +1,99 @@
+"""
+Unit-тесты двоичного формата .fsmb (src/fa_binary.py).
+
+Проверяем:
+- точный round-trip с write_FSM / read_FSM для FA_simple и FA_dict
+- колонки mmap-загрузки как представления файла без копирования
+- сохранение Q, Sigma, F, хранилища и коротких строк FA_dict
+- отказ для данных, которые формат не представляет
+"""
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+from src.fa_binary import MappedAutomaton, load, read_fsmb, write_fsmb
+
+FSM_TEXT = "F 0\ns 3\ni 2\no 2\nn0 0\np 6\n0 0 1 1\n0 1 2 0\n1 0 2 1\n1 1 0 0\n2 0 0 0\n2 1 1 1\n"
+
+
+@pytest.mark.parametrize("cls", [FA_simple, FA_dict])
+def test_fsmb_round_trip_matches_text_format(cls, tmp_path):
+    """
+    read_FSM -> .fsmb -> read_FSMB -> write_FSM дает байт в байт исходный текст.
+    """
+    source = tmp_path / "machine.fsm"
+    source.write_text(FSM_TEXT)
+    fa = cls.read_FSM(source)
+    fa.write_FSM(tmp_path / "expected.fsm")
+
+    fa.write_FSMB(tmp_path / "machine.fsmb")
+    restored = cls.read_FSMB(tmp_path / "machine.fsmb")
+    restored.write_FSM(tmp_path / "actual.fsm")
+
+    assert (tmp_path / "actual.fsm").read_bytes() == (tmp_path / "expected.fsm").read_bytes()
+    assert list(restored.transitionList) == list(fa.transitionList)
+    assert [type(tr) for tr in restored.transitionList] == [type(tr) for tr in fa.transitionList]
+
+
+def test_mmap_load_exposes_file_backed_columns(tmp_path):
+    """
+    Колонки mmap-загрузки - memoryview int32; целочисленные имена хранятся как range.
+    """
+    fa = FA_dict.from_arrays([0, 0, 1], [0, 1, 0], [1, 0, 1], final_states={1})
+    write_fsmb(fa, tmp_path / "dfa.fsmb")
+
+    with load(tmp_path / "dfa.fsmb") as mapped:
+        assert isinstance(mapped, MappedAutomaton)
+        assert isinstance(mapped.dst, memoryview) and mapped.dst.format == "i"
+        assert list(mapped.dst) == [1, 0, 1]
+        assert mapped.states == range(2)
+        assert [mapped.is_final(s) for s in range(2)] == [False, True]
+        assert list(mapped) == list(fa.transitionList)
+        assert mapped.to_fa() == fa
+
+    with load(tmp_path / "dfa.fsmb", mmap=False) as copied:
+        assert copied.transition(1) == (0, 1, 0)
+
+
+def test_fa_dict_components_survive(tmp_path):
+    """
+    Лишние состояния и входы, F вне Q, хранилище и короткие строки FA_dict сохраняются.
+    """
+    fa = FA_dict(storage="nested")
+    fa.initialState = "q0"
+    fa.transitionList = [("q0", "a", "q1", "x"), ("q1", "a", "q0"), ("bad",)]
+    fa.states.add("lonely")
+    fa.inputs.add("b")
+    fa.finalStates = {"q1", 7}
+
+    write_fsmb(fa, tmp_path / "a.fsmb")
+    restored = read_fsmb(tmp_path / "a.fsmb")
+
+    assert type(restored) is FA_dict and restored.storage == "nested"
+    assert list(restored.transitionList) == list(fa.transitionList)
+    assert restored.states == fa.states and restored.inputs == fa.inputs
+    assert restored.finalStates == fa.finalStates
+    assert restored.isFSM == fa.isFSM and restored.numberOfOutputs == fa.numberOfOutputs
+
+
+def test_fsmb_rejects_unrepresentable_automata(tmp_path):
+    """
+    Строки другой длины, смешанные типы строк и составные имена - ValueError.
+    """
+    fa = FA_simple()
+    fa.transitionList = [(0, 0, 1, 0, "extra")]
+    with pytest.raises(ValueError):
+        write_fsmb(fa, tmp_path / "a.fsmb")
+
+    fa.transitionList = [(0, 0, 1), [1, 0, 0]]
+    with pytest.raises(ValueError):
+        write_fsmb(fa, tmp_path / "a.fsmb")
+
+    fa.transitionList = [((0, 1), 0, (1, 1))]
+    with pytest.raises(ValueError):
+        write_fsmb(fa, tmp_path / "a.fsmb")
+
+    (tmp_path / "b.fsmb").write_bytes(b"NOPE" + bytes(64))
+    with pytest.raises(ValueError):
+        load(tmp_path / "b.fsmb")
@@ -0,0 +1,97 @@
+"""
+Unit-тесты прозрачного сжатия файлов (src/fa_compress.py).
+
+Проверяем:
+- round-trip write_FSM / read_FSM / read_FA через gzip, bz2, xz и lzma
+- определение кодека по сигнатуре независимо от имени файла
+- уровень сжатия и потоковое чтение корпуса слов
+"""
+
+import gzip
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+from src.fa_compress import detect_codec, open_text, read_words, write_words
+from src.fa_parallel import read_FSM_parallel
+
+FSM_TEXT = "F 0\ns 3\ni 2\no 2\nn0 0\np 6\n0 0 1 1\n0 1 2 0\n1 0 2 1\n1 1 0 0\n2 0 0 0\n2 1 1 1\n"
+FA_TEXT = "states_number 2\nactions_number 2\nstart_state 0\nfinal_state 1\n0 0 1\n0 1 0\n1 0 1\n1 1 0\n"
+
+
+@pytest.mark.parametrize(
+    "suffix, codec", [(".gz", "gzip"), (".bz2", "bz2"), (".xz", "lzma"), (".lzma", "lzma")]
+)
+@pytest.mark.parametrize("cls", [FA_simple, FA_dict])
+def test_compressed_fsm_round_trip(cls, suffix, codec, tmp_path):
+    """
+    Сжатый write_FSM распаковывается в тот же текст, read_FSM читает его как несжатый.
+    """
+    source = tmp_path / "machine.fsm"
+    source.write_text(FSM_TEXT)
+    fa = cls.read_FSM(source)
+    fa.write_FSM(tmp_path / "plain.fsm")
+
+    packed = tmp_path / f"machine.fsm{suffix}"
+    fa.write_FSM(packed)
+
+    assert detect_codec(packed) == codec
+    assert packed.read_bytes() != (tmp_path / "plain.fsm").read_bytes()
+    with open_text(packed) as lines:
+        assert lines.read() == (tmp_path / "plain.fsm").read_text()
+    assert list(cls.read_FSM(packed).transitionList) == list(fa.transitionList)
+
+
+@pytest.mark.parametrize("cls", [FA_simple, FA_dict])
+def test_compressed_fa_is_detected_by_magic_bytes(cls, tmp_path):
+    """
+    gzip-файл без расширения .gz распознается по сигнатуре.
+    """
+    packed = tmp_path / "machine.fa"
+    packed.write_bytes(gzip.compress(FA_TEXT.encode()))
+    (tmp_path / "plain.fa").write_text(FA_TEXT)
+
+    fa = cls.read_FA(packed)
+    expected = cls.read_FA(tmp_path / "plain.fa")
+
+    assert list(fa.transitionList) == list(expected.transitionList)
+    assert fa.finalStates == expected.finalStates
+    assert detect_codec(tmp_path / "plain.fa") is None
+
+
+def test_compresslevel_and_parallel_reader(tmp_path):
+    """
+    compresslevel передается кодеку; параллельный разбор читает сжатый файл последовательно.
+    """
+    fa = FA_dict.from_arrays(
+        [s for s in range(2000) for a in range(2)],
+        [a for s in range(2000) for a in range(2)],
+        [(3 * s + a) % 2000 for s in range(2000) for a in range(2)],
+        [a for s in range(2000) for a in range(2)],
+    )
+    fa.write_FSM(tmp_path / "fast.fsm.gz", compresslevel=1)
+    fa.write_FSM(tmp_path / "small.fsm.gz", compresslevel=9)
+    fa.write_FSM(tmp_path / "stored.fsm.gz", compresslevel=0)
+
+    names = ("stored.fsm.gz", "fast.fsm.gz", "small.fsm.gz")
+    sizes = [(tmp_path / name).stat().st_size for name in names]
+    assert sizes[0] > sizes[1] >= sizes[2]
+    assert list(read_FSM_parallel(tmp_path / "small.fsm.gz", workers=2).transitionList) == list(
+        fa.transitionList
+    )
+
+
+def test_word_corpus_round_trip(tmp_path):
+    """
+    Корпус слов сжимается по расширению и читается потоково, пустое слово сохраняется.
+    """
+    words = [[0, 1, 1], [], ["a", "b"]]
+
+    write_words(tmp_path / "words.txt.bz2", words)
+    corpus = read_words(tmp_path / "words.txt.bz2")
+
+    assert next(corpus) == ["0", "1", "1"]
+    assert list(corpus) == [[], ["a", "b"]]
+    with pytest.raises(ValueError):
+        open_text(tmp_path / "words.txt.bz2", "rb")
@@ -0,0 +1,86 @@
+"""
+Unit-тесты CSR-представления автомата (src/fa_csr.py).
+
+Проверяем:
+- группировку переходов по состояниям и сортировку входов
+- поиск переходов и допуск слов как у accept_FA
+- графовые алгоритмы и минимизацию поверх CSR
+"""
+
+import itertools
+
+from src.fa_factory import FA as FA_simple
+
+TRANSITIONS = [
+    (1, "b", 2, 0), (0, "b", 0, 1), (2, "a", 0, 1),
+    (0, "a", 1, 0), (1, "a", 2, 0), (2, "b", 1, 1),
+]
+
+
+def _fsm():
+    """
+    Создает FSM с начальным состоянием 0.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = TRANSITIONS
+    return fa
+
+
+def test_rows_are_grouped_and_sorted_by_input():
+    """
+    Переходы каждого состояния лежат подряд, входы внутри строки возрастают.
+    """
+    csr = _fsm().to_csr()
+
+    assert csr.number_of_transitions == len(TRANSITIONS)
+    for s in range(csr.number_of_states):
+        row = list(csr.inp[csr.offsets[s]:csr.offsets[s + 1]])
+        assert row == sorted(row) and len(row) == 2
+
+
+def test_lookup_matches_transition_list():
+    """
+    lookup возвращает преемника и выход исходного перехода.
+    """
+    csr = _fsm().to_csr()
+
+    for state, symbol, next_state, output in TRANSITIONS:
+        assert csr.lookup(state, symbol) == (next_state, output)
+    assert csr.lookup(0, "c") is None
+    assert csr.lookup(7, "a") is None
+
+
+def test_accept_matches_accept_fa():
+    """
+    Допуск слов по CSR совпадает с accept_FA.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.transitionList = [(0, "a", 1), (1, "a", 0), (1, "b", 2)]
+    fa.finalStates = {2}
+    csr = fa.to_csr()
+
+    for length in range(5):
+        for word in itertools.product("ab", repeat=length):
+            result = fa.accept_FA(list(word))
+            expected = result[0] if result else None
+            assert csr.accept(list(word)) == expected
+
+
+def test_graph_algorithms_run_on_csr():
+    """
+    Достижимость, компоненты и классы эквивалентности вычисляются по CSR.
+    """
+    fa = _fsm()
+    fa.transitionList = TRANSITIONS + [(3, "a", 1, 0), (3, "b", 0, 1)]
+    csr = fa.to_csr()
+
+    labels, count = csr.scc()
+    blocks, classes = csr.equivalence_classes()
+
+    assert list(csr.reachable()) == [1, 1, 1, 0]
+    assert count == 2
+    assert classes == 3
+    assert blocks[csr.state_id(3)] == blocks[csr.state_id(0)]
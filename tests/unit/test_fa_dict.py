@@ -0,0 +1,228 @@
+"""
+Unit-тесты служебных структур FA_dict (src/FA_dict.py).
+
+Проверяем:
+- кэшируемое представление transitionList и его сброс после изменений
+- потоковый обход переходов iter_transitions
+- независимость автомата от записи в представление
+- пакетную загрузку from_arrays и ее совпадение с сеттером transitionList
+- построчное чтение read_FSM / read_FA с проверкой заголовка по ходу чтения
+- преобразование в FA_simple с последующим изменением переходов
+"""
+
+import random
+from array import array
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+
+
+def _fa():
+    """
+    Создает DFA с тремя переходами.
+    """
+    fa = FA_dict()
+    fa.initialState = 0
+    fa.finalStates = {1}
+    fa.transitionList = [(0, "a", 1), (1, "a", 0), (1, "b", 1)]
+    return fa
+
+
+def test_transition_list_view_is_reused_until_mutation():
+    """
+    Повторное обращение возвращает тот же объект; изменение автомата создает новый.
+    """
+    fa = _fa()
+    view = fa.transitionList
+
+    assert fa.transitionList is view
+    assert len(view) == 3 and view[1] == (1, "a", 0)
+    assert view == [(0, "a", 1), (1, "a", 0), (1, "b", 1)]
+
+    fa._add_transition(0, "b", 0)
+
+    assert fa.transitionList is not view
+    assert len(fa.transitionList) == 4 and len(view) == 3
+
+    view = fa.transitionList
+    fa.transitions[(0, "a")] = 0
+
+    assert fa.transitionList is not view
+    assert fa.transitionList[0] == (0, "a", 0) and view[0] == (0, "a", 1)
+
+
+def test_transition_list_view_follows_sort_and_fsm_flag():
+    """
+    Сортировка и переключение isFSM сбрасывают представление.
+    """
+    fa = _fa()
+    fa.transitionList = [(1, "b", 1), (0, "a", 1)]
+    view = fa.transitionList
+
+    fa.sort_trans_table()
+    assert fa.transitionList[0] == (0, "a", 1)
+
+    fa.isFSM = 1
+    assert fa.transitionList[0] == (0, "a", 1, 0)
+    assert view[0] == (1, "b", 1)
+
+
+def test_shuffle_does_not_change_automaton():
+    """
+    Перемешивание представления, как и прежнего списка-копии, не меняет автомат.
+    """
+    fa = _fa()
+    view = fa.transitionList
+
+    random.Random(3).shuffle(view)
+
+    assert fa.transitionList == [(0, "a", 1), (1, "a", 0), (1, "b", 1)]
+    assert sorted(view) == sorted(fa.transitionList)
+
+
+def test_iter_transitions_streams_legacy_tuples():
+    """
+    iter_transitions выдает те же кортежи, что и transitionList.
+    """
+    fa = _fa()
+    fa.transitionList = [(0,)] + list(fa.transitionList)
+
+    assert list(fa.iter_transitions()) == list(fa.transitionList)
+    assert next(fa.iter_transitions()) == (0,)
+
+
+def test_from_arrays_matches_transition_list_setter():
+    """
+    Колонки array и list дают тот же автомат, что и legacy-список.
+    """
+    rows = [(s, a, (2 * s + a) % 5, a % 2) for s in range(5) for a in range(3)]
+    reference = FA_dict()
+    reference.finalStates = {1}
+    reference.transitionList = rows + rows[:2]
+
+    src, inp, dst, out = (array("l", column) for column in zip(*(rows + rows[:2])))
+    fa = FA_dict.from_arrays(src, inp, dst, out, final_states={1})
+
+    assert fa == reference
+    assert list(fa.transitionList) == list(reference.transitionList)
+    assert fa.accept_FA([2, 0, 1]) == reference.accept_FA([2, 0, 1])
+    assert fa.isFSM == 1 and fa.numberOfOutputs == 2
+
+
+def test_from_arrays_rejects_nondeterminism_and_ragged_columns():
+    """
+    Повтор пары с другим переходом и колонки разной длины - ValueError.
+    """
+    with pytest.raises(ValueError, match="Nondeterministic transition for \\(0, 'a'\\)"):
+        FA_dict.from_arrays([0, 1, 0], ["a", "a", "a"], [1, 0, 0])
+    with pytest.raises(ValueError):
+        FA_dict.from_arrays([0, 1], ["a"], [1, 0])
+
+    fa = FA_dict.from_arrays([0, 1], ["a", "a"], [1, 0], storage="auto")
+    assert fa.isFSM == 0 and not fa.outputs and fa.storage == "tuple"
+
+
+def test_read_fsm_streams_rows_into_bulk_builder(capsys, tmp_path):
+    """
+    read_FSM дает тот же автомат, что и сеттер transitionList, и проверяет заголовок.
+    """
+    file = tmp_path / "machine.fsm"
+    file.write_text(
+        "F 0\ns 2\ni 2\no 2\nn0 0\np 5\n"
+        "0 0 1 1\n0 1 0 0\n\n1 0 0 0\n1 1 1 1\n0 0 1 1\n"
+    )
+
+    fa = FA_dict.read_FSM(file)
+
+    reference = FA_dict()
+    reference.isFSM = 1
+    reference.transitionList = [(0, 0, 1, 1), (0, 1, 0, 0), (1, 0, 0, 0), (1, 1, 1, 1)]
+    assert list(fa.transitionList) == list(reference.transitionList)
+    assert fa.move_seq_FSM([0, 0, 1]) == reference.move_seq_FSM([0, 0, 1])
+    assert (fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs) == (2, 2, 2)
+    assert "not consistent" not in capsys.readouterr().out
+
+    file.write_text("F 0\ns 3\ni 2\no 2\nn0 0\np 1\n0 0 1 1\n")
+    FA_dict.read_FSM(file)
+    assert "not consistent" in capsys.readouterr().out
+
+
+def test_read_fa_keeps_short_rows_and_rejects_nondeterminism(tmp_path):
+    """
+    Короткие строки сохраняются как есть, противоречивый повтор перехода - ValueError.
+    """
+    file = tmp_path / "automaton.fa"
+    file.write_text(
+        "states_number 2\nactions_number 1\nstart_state 0\nfinal_state 1\n"
+        "0 a 1\n7\n1 a 0\n"
+    )
+
+    fa = FA_dict.read_FA(file)
+
+    assert list(fa.transitionList) == [(7,), (0, "a", 1), (1, "a", 0)]
+    assert fa.finalStates == {1} and fa.states == {0, 1}
+    assert fa.accept_FA(["a", "a", "a"]) == (True, [0, 1, 0])
+
+    file.write_text(file.read_text() + "0 a 0\n")
+    with pytest.raises(ValueError, match="Nondeterministic"):
+        FA_dict.read_FA(file)
+
+
+def test_write_fsm_writes_rows_in_chunks(tmp_path, monkeypatch):
+    """
+    Запись пакетами дает тот же текст, что и строки transitionList через перевод строки.
+    """
+    monkeypatch.setattr("src.FA_dict._WRITE_CHUNK", 2)
+    fa = _fa()
+    fa.transitionList = [(0,)] + list(fa.transitionList)
+
+    fa.write_FSM(tmp_path / "all.fsm")
+    fa.write_FSM_init(tmp_path / "init.fsm", states_excluded=[1])
+
+    rows = ["0", "0 a 1", "1 a 0", "1 b 1"]
+    header = "F 0\ns 2\ni 2\no 0\nn0 0\n"
+    assert (tmp_path / "all.fsm").read_text() == header + "p 4\n" + "\n".join(rows) + "\n"
+    assert (tmp_path / "init.fsm").read_text() == header + "p 2\n0\n0 a 1\n"
+
+
+def test_output_set_is_cached_until_transitions_change(tmp_path):
+    """
+    Заголовок FSM берет множество выходов из кэша; изменение выходов его сбрасывает.
+    """
+    fa = FA_dict()
+    fa.transitionList = [(0, 0, 1, "x"), (1, 0, 0, "y")]
+    outputs = fa._all_outputs()
+
+    fa.write_FSM(tmp_path / "a.fsm")
+
+    assert fa._all_outputs() is outputs == {"x", "y"}
+    fa._add_transition(1, 1, 1, "z")
+    assert fa._all_outputs() == {"x", "y", "z"}
+    fa.write_FSM(tmp_path / "b.fsm")
+    assert "o 3\n" in (tmp_path / "b.fsm").read_text()
+    fa.outputs[(1, 1)] = "w"
+    assert fa._all_outputs() == {"x", "y", "w"}
+
+
+def test_from_FA_copies_rows_into_mutable_list():
+    """
+    FA_simple.from_FA получает list переходов: сортировка и доопределение работают,
+    а исходный FA_dict не меняется.
+    """
+    fa = FA_dict()
+    fa.isFSM = 1
+    fa.transitionList = [(1, 0, 0, 1), (0, 1, 0, 0), (0, 0, 1, 0)]
+
+    simple = FA_simple.from_FA(fa)
+    simple.sort_trans_table()
+
+    assert type(simple.transitionList) is list
+    assert simple.transitionList == [(0, 0, 1, 0), (0, 1, 0, 0), (1, 0, 0, 1)]
+
+    simple = FA_simple.from_FA(fa)
+    simple.complete()
+
+    assert len(simple.transitionList) == 4
+    assert list(fa.transitionList) == [(1, 0, 0, 1), (0, 1, 0, 0), (0, 0, 1, 0)]
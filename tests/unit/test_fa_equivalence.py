@@ -0,0 +1,219 @@
+"""
+Unit-тесты проверки эквивалентности автоматов (src/fa_equivalence.py).
+
+Проверяем:
+- эквивалентность DFA и FSM с разным числом состояний
+- кратчайшее различающее слово
+- частичные автоматы и сравнение разных реализаций
+"""
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.fa_equivalence import distinguishing_sequences, equivalent
+from src.fa_factory import FA as FA_simple
+
+
+def _dfa(transitions, final_states, initial=0):
+    """
+    Создает DFA с заданными переходами и допускающими состояниями.
+    """
+    fa = FA_simple()
+    fa.initialState = initial
+    fa.finalStates = set(final_states)
+    fa.transitionList = transitions
+    return fa
+
+
+def _fsm(transitions, initial=0):
+    """
+    Создает FSM с заданными переходами.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = initial
+    fa.transitionList = transitions
+    return fa
+
+
+# =========================================================
+# DFA
+# =========================================================
+
+def test_equivalent_dfa_with_redundant_states():
+    """
+    Автомат "четное число a" с лишним состоянием эквивалентен минимальному.
+    """
+    small = _dfa([(0, "a", 1), (1, "a", 0)], {0})
+    big = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 1)], {0, 2})
+
+    assert equivalent(small, big) == (True, None)
+
+
+def test_different_dfa_shortest_counterexample():
+    """
+    Различающее слово минимально по длине.
+    """
+    a = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 3), (3, "a", 3)], {3})
+    b = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 2)], {2})
+
+    result, word = equivalent(a, b)
+
+    assert result is False
+    assert word == ["a", "a"]
+    assert a.accept_FA(word)[0] != b.accept_FA(word)[0]
+
+
+def test_empty_word_distinguishes():
+    """
+    Разная принадлежность начальных состояний F различается пустым словом.
+    """
+    a = _dfa([(0, "a", 0)], {0})
+    b = _dfa([(0, "a", 0)], set())
+
+    assert equivalent(a, b) == (False, [])
+
+
+def test_partial_dfa_missing_transition_rejects():
+    """
+    Неопределенный переход эквивалентен переходу в недопускающий sink.
+    """
+    partial = _dfa([(0, "a", 1), (1, "b", 1)], {1})
+    complete = _dfa(
+        [(0, "a", 1), (0, "b", 2), (1, "a", 2), (1, "b", 1), (2, "a", 2), (2, "b", 2)],
+        {1},
+    )
+
+    assert equivalent(partial, complete) == (True, None)
+
+
+# =========================================================
+# FSM
+# =========================================================
+
+def test_equivalent_fsm_after_minimization():
+    """
+    FSM эквивалентен своему минимизированному варианту.
+    """
+    fa = _fsm([
+        (0, 0, 1, 0), (0, 1, 2, 1),
+        (1, 0, 0, 1), (1, 1, 2, 0),
+        (2, 0, 0, 1), (2, 1, 1, 0),
+    ])
+    reduced, _ = fa.minimize()
+
+    assert equivalent(fa, reduced) == (True, None)
+
+
+def test_fsm_output_difference():
+    """
+    Различие реакций обнаруживается на кратчайшем слове.
+    """
+    a = _fsm([(0, 0, 1, 0), (1, 0, 0, 1)])
+    b = _fsm([(0, 0, 1, 0), (1, 0, 0, 0)])
+
+    result, word = equivalent(a, b)
+
+    assert result is False
+    assert word == [0, 0]
+    assert a.move_seq_FSM(word)[0] != b.move_seq_FSM(word)[0]
+
+
+def test_fsm_undefined_input_differs():
+    """
+    Определенный и неопределенный переход различаются.
+    """
+    a = _fsm([(0, 0, 0, 0), (0, 1, 0, 0)])
+    b = _fsm([(0, 0, 0, 0)])
+
+    assert equivalent(a, b) == (False, [1])
+
+
+def test_fsm_missing_output_reads_as_zero():
+    """
+    Переход FSM без выхода выдает 0, как в move_seq_FSM.
+    """
+    a = _fsm([(0, 0, 1, 1), (1, 0, 0)])
+    b = _fsm([(0, 0, 1, 1), (1, 0, 0, 0)])
+
+    assert FA_dict.from_FA(a).move_seq_FSM([0, 0]) == b.move_seq_FSM([0, 0])
+    assert equivalent(a, b) == (True, None)
+    assert list(distinguishing_sequences(a, b)) == []
+
+
+def test_fsm_and_acceptor_are_not_comparable():
+    """
+    Сравнение FSM с полуавтоматом не определено.
+    """
+    with pytest.raises(ValueError):
+        equivalent(_fsm([(0, 0, 0, 0)]), _dfa([(0, 0, 0)], {0}))
+
+
+def test_equivalent_across_implementations():
+    """
+    FA_dict и выбранная реализация сравниваются по общему алфавиту.
+    """
+    a = _dfa([(0, "a", 1), (1, "a", 0)], {1})
+    b = FA_dict()
+    b.initialState = 0
+    b.finalStates = {1, 2}
+    b.transitionList = [(0, "a", 1), (1, "a", 2), (2, "a", 1)]
+
+    result, word = equivalent(a, b)
+
+    assert result is False
+    assert word == ["a", "a"]
+
+
+# =========================================================
+# Различающие последовательности
+# =========================================================
+
+def test_distinguishing_sequences_are_shortest_first():
+    """
+    Слова выдаются в порядке неубывания длины и действительно различают автоматы.
+    """
+    a = _dfa([(0, "a", 1), (0, "b", 0), (1, "a", 0), (1, "b", 1)], {1})
+    b = _dfa([(0, "a", 1), (0, "b", 1), (1, "a", 0), (1, "b", 0)], {1})
+
+    words = list(distinguishing_sequences(a, b, k=3))
+
+    assert words[0] == ["b"]
+    assert [len(w) for w in words] == sorted(len(w) for w in words)
+    for word in words:
+        assert a.accept_FA(word)[0] != b.accept_FA(word)[0]
+
+
+def test_distinguishing_sequences_equivalent_automata_yield_nothing():
+    """
+    Для эквивалентных автоматов генератор пуст.
+    """
+    small = _dfa([(0, "a", 1), (1, "a", 0)], {0})
+    big = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 1)], {0, 2})
+
+    assert list(distinguishing_sequences(small, big)) == []
+
+
+def test_distinguishing_sequences_fsm_outputs():
+    """
+    Для FSM слово обрывается на первом различии реакций.
+    """
+    a = _fsm([(0, 0, 1, 0), (0, 1, 0, 0), (1, 0, 0, 1), (1, 1, 1, 0)])
+    b = _fsm([(0, 0, 1, 0), (0, 1, 0, 0), (1, 0, 0, 0), (1, 1, 1, 1)])
+
+    words = list(distinguishing_sequences(a, b))
+
+    assert words == [[0, 0], [0, 1]]
+    for word in words:
+        assert a.move_seq_FSM(word)[0] != b.move_seq_FSM(word)[0]
+
+
+def test_distinguishing_sequences_respects_max_length():
+    """
+    Слова длиннее max_length не выдаются.
+    """
+    a = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 3), (3, "a", 3)], {3})
+    b = _dfa([(0, "a", 1), (1, "a", 2), (2, "a", 3), (3, "a", 3)], set())
+
+    assert list(distinguishing_sequences(a, b, max_length=2)) == []
+    assert list(distinguishing_sequences(a, b, max_length=3)) == [["a", "a", "a"]]
@@ -0,0 +1,130 @@
+"""
+Unit-тесты неизменяемых снимков автоматов (src/fa_frozen.py).
+
+Проверяем:
+- неизменяемость снимка и совпадение хеша у равных снимков
+- восстановление изменяемого автомата thaw() для FA_simple и FA_dict
+- тип строк transitionList у FA_simple
+- компактную передачу через pickle
+- использование снимка как ключа кэша
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+from src.fa_frozen import FrozenAutomaton, freeze
+
+
+def _fsm(cls):
+    """
+    Создает небольшой FSM заданного класса.
+    """
+    fa = cls()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.finalStates = set()
+    fa.transitionList = [(0, 0, 1, 1), (0, 1, 0, 0), (1, 0, 0, 0), (1, 1, 1, 1)]
+    fa.numberOfStates = fa.numberOfInputs = fa.numberOfOutputs = 2
+    return fa
+
+
+@pytest.mark.parametrize("cls", [FA_simple, FA_dict])
+def test_freeze_thaw_round_trip(cls):
+    """
+    thaw() возвращает новый автомат, равный исходному, а снимок от него - равный снимок.
+    """
+    fa = _fsm(cls)
+    frozen = fa.freeze()
+    restored = frozen.thaw()
+
+    assert type(restored) is cls and restored is not fa
+    assert list(restored.transitionList) == list(fa.transitionList)
+    assert restored.move_seq_FSM([0, 1, 0]) == fa.move_seq_FSM([0, 1, 0])
+    assert restored.freeze() == frozen and hash(restored.freeze()) == hash(frozen)
+
+
+def test_thaw_restores_fa_simple_row_types():
+    """
+    Строки-списки (как после read_FSM) и смешанные строки сохраняют свой тип.
+    """
+    fa = _fsm(FA_simple)
+    fa.transitionList = [list(tr) for tr in fa.transitionList]
+
+    restored = pickle.loads(pickle.dumps(fa.freeze())).thaw()
+
+    assert restored.transitionList == fa.transitionList
+    assert all(type(tr) is list for tr in restored.transitionList)
+
+    fa.transitionList.append((2, 0, 2, 0))
+    restored = fa.freeze().thaw()
+
+    assert [type(tr) for tr in restored.transitionList] == [list] * 4 + [tuple]
+    assert fa.freeze() != _fsm(FA_simple).freeze()
+
+
+def test_frozen_automaton_is_immutable_and_shared_by_copy():
+    """
+    Атрибуты снимка нельзя изменить, copy и deepcopy возвращают тот же объект.
+    """
+    frozen = _fsm(FA_dict).freeze()
+
+    with pytest.raises(AttributeError):
+        frozen.initialState = 1
+    with pytest.raises(AttributeError):
+        del frozen.transitionList
+    assert copy.copy(frozen) is frozen and copy.deepcopy(frozen) is frozen
+    assert freeze(frozen) is frozen
+
+
+def test_snapshot_does_not_follow_later_changes():
+    """
+    Изменение автомата после freeze() не затрагивает снимок.
+    """
+    fa = _fsm(FA_dict)
+    frozen = fa.freeze()
+
+    fa.transitionList = [(0, 0, 0, 0)]
+    fa.finalStates.add(1)
+
+    assert len(frozen.transitionList) == 4 and frozen.finalStates == frozenset()
+    assert fa.freeze() != frozen
+
+
+@pytest.mark.parametrize("cls", [FA_simple, FA_dict])
+def test_pickle_round_trip(cls):
+    """
+    Снимок переживает pickle без потерь и с тем же равенством.
+    """
+    frozen = _fsm(cls).freeze()
+
+    restored = pickle.loads(pickle.dumps(frozen))
+
+    assert restored == frozen and hash(restored) == hash(frozen)
+    assert type(restored.thaw()) is cls
+
+
+def test_snapshot_as_memo_key():
+    """
+    Равные автоматы разных объектов попадают в одну запись кэша, разные классы - в разные.
+    """
+    cache = {}
+    for fa in (_fsm(FA_dict), _fsm(FA_dict), _fsm(FA_simple)):
+        key = fa.freeze()
+        if key not in cache:
+            cache[key] = key.thaw().minimize()
+
+    assert len(cache) == 2
+
+
+def test_freeze_rejects_foreign_objects():
+    """
+    Снимок можно снять только с FA_simple или FA_dict.
+    """
+    with pytest.raises(TypeError):
+        FrozenAutomaton.from_fa(object())
+    with pytest.raises(ValueError):
+        FrozenAutomaton("EFA", 0, (), 0, 0, 0, 0, ())
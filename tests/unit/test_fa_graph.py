@@ -0,0 +1,247 @@
+"""
+Unit-тесты графовых алгоритмов (src/fa_graph.py).
+
+Проверяем:
+- CSR-смежность и обход в ширину
+- trim: достижимость и кодостижимость
+- trim после complete()
+- слова доступа: кратчайшие пути, кэш FA_dict и его сброс
+- компоненты сильной связности и граф конденсации
+"""
+
+from array import array
+
+from src.FA_dict import FA_dict
+from src.fa_factory import FA as FA_simple
+from src.fa_graph import bfs_visit, csr_adjacency, scc_labels
+
+
+# =========================================================
+# CSR и BFS
+# =========================================================
+
+def test_csr_adjacency_groups_successors_by_source():
+    """
+    Преемники каждой вершины лежат в своем отрезке targets.
+    """
+    offsets, targets = csr_adjacency(
+        3, array("l", [2, 0, 0, 1]), array("l", [0, 1, 2, 1])
+    )
+
+    assert list(offsets) == [0, 2, 3, 4]
+    assert sorted(targets[offsets[0]:offsets[1]]) == [1, 2]
+    assert list(targets[offsets[2]:offsets[3]]) == [0]
+
+
+def test_bfs_visit_marks_reachable_only():
+    """
+    Обход не выходит за пределы компоненты достижимости.
+    """
+    offsets, targets = csr_adjacency(4, array("l", [0, 1, 3]), array("l", [1, 0, 2]))
+
+    assert list(bfs_visit(offsets, targets, [0])) == [1, 1, 0, 0]
+
+
+# =========================================================
+# TRIM
+# =========================================================
+
+def test_trim_removes_unreachable_states():
+    """
+    Состояние без входящих путей от initialState удаляется вместе с переходами.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {1}
+    fa.transitionList = [(0, "a", 1), (1, "a", 0), (2, "a", 1)]
+    fa.numberOfStates = 3
+    fa.numberOfInputs = 1
+
+    removed = fa.trim()
+
+    assert removed == [2]
+    assert fa.numberOfStates == 2
+    assert all(tr[0] != 2 for tr in fa.transitionList)
+    assert fa.accept_FA(["a"])[0] is True
+
+
+def test_trim_removes_non_coreachable_states():
+    """
+    Состояние, из которого недостижимо F, удаляется.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {1}
+    fa.transitionList = [(0, "a", 1), (0, "b", 2), (2, "a", 2), (2, "b", 2)]
+
+    removed = fa.trim()
+
+    assert removed == [2]
+    assert fa.accept_FA(["a"])[0] is True
+    assert fa.accept_FA(["b"]) is None
+
+
+def test_trim_fsm_keeps_reachable_states():
+    """
+    Для FSM удаляются только недостижимые состояния.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = [(0, 0, 1, 0), (1, 0, 1, 1), (2, 0, 0, 0)]
+
+    removed = fa.trim()
+
+    assert removed == [2]
+    assert fa.move_seq_FSM([0, 0])[0] == [0, 1]
+
+
+def test_trim_keeps_initial_state_for_empty_language():
+    """
+    Начальное состояние остается даже при пустом языке.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = set()
+    fa.transitionList = [(0, "a", 1), (1, "a", 0)]
+
+    fa.trim()
+
+    assert fa.numberOfStates == 1
+    assert fa.accept_FA([])[0] is False
+
+
+def test_trim_drops_completion_in_unreachable_region():
+    """
+    Переходы, добавленные complete() в недостижимые состояния, удаляются.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = [(0, 0, 0, 0), (2, 0, 2, 0)]
+    fa.numberOfStates = 3
+    fa.numberOfInputs = 2
+
+    fa.complete(comptype="DCS", reaction=1)
+    before = len(fa.transitionList)
+    fa.trim()
+
+    assert len(fa.transitionList) < before
+    assert {tr[0] for tr in fa.transitionList} == {0, 3}
+    assert fa.move_seq_FSM([0, 1, 0])[0] == [0, 1, 1]
+
+
+# =========================================================
+# Слова доступа
+# =========================================================
+
+def _chain():
+    """
+    Автомат 0 -a-> 1 -b-> 2, переход 0 -c-> 2 и недостижимое состояние 3.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.transitionList = [(0, "a", 1), (1, "b", 2), (0, "c", 2), (3, "a", 0)]
+    fa.finalStates = {2}
+    return fa
+
+
+def test_access_sequences_are_shortest_words():
+    """
+    Слова доступа кратчайшие, недостижимые состояния слов не имеют.
+    """
+    tree = _chain().access_sequences()
+
+    assert list(tree) == [0, 1, 2]
+    assert tree.word(0) == []
+    assert tree[1] == ["a"]
+    assert tree[2] == ["c"]
+    assert tree.word(3) is None and 3 not in tree
+    assert tree.distance(2) == 1
+
+
+def test_access_sequences_cached_and_invalidated():
+    """
+    FA_dict возвращает кэш при повторном вызове; изменение автомата сбрасывает его.
+    """
+    fa = FA_dict.from_FA(_chain())
+    tree = fa.access_sequences()
+
+    assert fa.access_sequences() is tree
+
+    fa.transitionList = [(0, "a", 1), (1, "b", 2)]
+    rebuilt = fa.access_sequences()
+
+    assert rebuilt is not tree
+    assert rebuilt[2] == ["a", "b"]
+
+    fa.transitions[(1, "b")] = 1
+    assert 2 not in fa.access_sequences()
+
+
+def test_access_sequences_see_in_place_row_edit():
+    """
+    Замена строки transitionList на месте без изменения длины сбрасывает кэш.
+    """
+    fa = _chain()
+    fa.access_sequences()
+
+    fa.transitionList[2] = (0, "c", 3)
+    expected = FA_simple()
+    expected.initialState = 0
+    expected.transitionList = list(fa.transitionList)
+
+    assert dict(fa.access_sequences().items()) == dict(expected.access_sequences().items())
+
+
+# =========================================================
+# Компоненты сильной связности
+# =========================================================
+
+def test_scc_labels_reverse_topological_order():
+    """
+    Переходы между компонентами ведут от больших номеров к меньшим.
+    """
+    src = array("l", [0, 1, 1, 2, 3])
+    dst = array("l", [1, 0, 2, 3, 2])
+
+    labels, count = scc_labels(*csr_adjacency(4, src, dst))
+
+    assert count == 2
+    assert labels[0] == labels[1] and labels[2] == labels[3]
+    assert labels[0] > labels[2]
+
+
+def test_scc_labels_long_chain_without_recursion():
+    """
+    Длинная цепочка обрабатывается без переполнения стека вызовов.
+    """
+    n = 50000
+    src = array("l", range(n - 1))
+    dst = array("l", range(1, n))
+
+    labels, count = scc_labels(*csr_adjacency(n, src, dst))
+
+    assert count == n
+    assert labels[0] == n - 1 and labels[n - 1] == 0
+
+
+def test_condensation_finds_sink_region():
+    """
+    Sink-состояние с петлями (как после доопределения) - отдельная компонента-ловушка.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.transitionList = [
+        (0, "a", 1), (1, "a", 0), (0, "b", 2), (1, "b", 2), (2, "a", 2), (2, "b", 2),
+    ]
+    fa.finalStates = {0}
+
+    components = fa.scc()
+    dag = fa.condensation()
+
+    assert components.count == 2
+    assert components.component(0) == components.component(1)
+    assert [len(group) for group in components.members()] == [1, 2]
+    assert dag.terminal() == [0]
+    assert list(dag.successors(components.component(0))) == [0]
@@ -15,6 +15,9 @@ Impl-level тесты для FA_simple
 """
 
 import pytest
+
+import src.FA_dict as dict_module
+import src.FA_simple as simple_module
 from src.fa_factory import FA as FA_simple
 
 
@@ -200,6 +203,25 @@ def test_write_fsm_init(tmp_path):
     assert "n0" in content
 
 
+def test_write_fsm_streams_rows_in_chunks(tmp_path, monkeypatch):
+    """
+    Переходы пишутся пакетами; заголовок и строки не зависят от размера пакета
+    """
+    monkeypatch.setattr(simple_module, "_WRITE_CHUNK", 2)
+    monkeypatch.setattr(dict_module, "_WRITE_CHUNK", 2)
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.transitionList = [(1, 0, 0, 0), (0, 1, 0, 1), (0, 0, 1, 1)]
+
+    file = tmp_path / "chunks.fsm"
+    fa.write_FSM(file)
+
+    lines = file.read_text().splitlines()
+    assert lines[:6] == ["F 0", "s 2", "i 2", "o 2", "n0 0", "p 3"]
+    assert sorted(lines[6:]) == ["0 0 1 1", "0 1 0 1", "1 0 0 0"]
+    assert fa.transitionList[0] == (1, 0, 0, 0)
+
+
 # =========================================================
 # ENCODE
 # =========================================================
@@ -793,3 +815,63 @@ def test_encode_states_initial_not_digit():
 
     assert changed is True
     assert 0 in mapping
+
+
+# ---------------------------------------------------------
+# 19. accept_FA: номера переходов и изменение finalStates
+# ---------------------------------------------------------
+def test_accept_fired_indices_after_sort():
+    """
+    После сортировки номера сработавших переходов указывают на позиции в transitionList.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {0}
+    fa.transitionList = [(1, "b", 0), (1, "a", 1), (0, "a", 1)]
+
+    fa.sort_trans_table()
+    accepted, fired = fa.accept_FA(["a", "a", "b"])
+
+    assert accepted is True
+    assert [tuple(fa.transitionList[i][:3]) for i in sorted(fired)] == [
+        (0, "a", 1), (1, "a", 1), (1, "b", 0),
+    ]
+
+
+def test_accept_sees_in_place_final_state_changes():
+    """
+    Изменение finalStates на месте сразу влияет на результат accept_FA.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {0}
+    fa.transitionList = [(0, "a", 1), (1, "a", 0)]
+
+    assert fa.accept_FA(["a"])[0] is False
+    fa.finalStates.add(1)
+    assert fa.accept_FA(["a"])[0] is True
+    fa.finalStates.discard(1)
+    assert fa.accept_FA(["a"])[0] is False
+
+
+# ---------------------------------------------------------
+# 20. Q и Sigma после изменения состояний и размеров
+# ---------------------------------------------------------
+def test_completeness_follows_state_and_size_changes():
+    """
+    is_complete учитывает изменения numberOfStates и добавленные состояния.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {0}
+    fa.transitionList = [(0, 0, 1), (0, 1, 1), (1, 0, 0), (1, 1, 0)]
+    fa.numberOfStates = 2
+    fa.numberOfInputs = 2
+
+    assert fa.is_complete() is True
+
+    fa.numberOfStates = 3
+    assert fa.is_complete() is False
+
+    fa.numberOfStates = 2
+    assert fa.is_complete() is True
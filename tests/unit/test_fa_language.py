@@ -0,0 +1,177 @@
+"""
+Unit-тесты подсчета слов языка (src/fa_language.py).
+
+Проверяем:
+- совпадение с перебором слов через accept_FA
+- возведение матрицы в степень против динамики
+- слова длины не больше n и пустой язык
+- ранжирование, восстановление по номеру и равномерная выборка
+"""
+
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+import src.fa_language as fa_language
+from src.FA_dict import FA_dict
+from src.fa_language import AcceptedWords
+
+
+def _even_a():
+    """
+    Частичный DFA над {a, b}: четное число a, после b символ a запрещен.
+    """
+    fa = FA_dict()
+    fa.initialState = 0
+    fa.transitionList = [(0, "a", 1), (1, "a", 0), (0, "b", 2), (2, "b", 2)]
+    fa.finalStates = {0, 2}
+    return fa
+
+
+def _brute_force(fa, n):
+    """
+    Считает допускаемые слова длины n перебором.
+    """
+    count = 0
+    for word in itertools.product("ab", repeat=n):
+        result = fa.accept_FA(list(word))
+        if result and result[0]:
+            count += 1
+    return count
+
+
+def test_count_accepted_matches_enumeration():
+    """
+    Число допускаемых слов совпадает с перебором.
+    """
+    fa = _even_a()
+
+    for n in range(8):
+        assert fa.count_accepted(n) == _brute_force(fa, n)
+
+
+def test_matrix_power_matches_dynamic(monkeypatch):
+    """
+    Возведение в степень дает тот же результат, что и динамика.
+    """
+    fa = _even_a()
+    expected = [fa.count_accepted(n) for n in range(40)]
+    expected_upto = [fa.count_accepted_upto(n) for n in range(40)]
+
+    monkeypatch.setattr(fa_language, "_prefer_dynamic", lambda system, n: False)
+
+    assert [fa.count_accepted(n) for n in range(40)] == expected
+    assert [fa.count_accepted_upto(n) for n in range(40)] == expected_upto
+
+
+def test_count_accepted_upto_sums_lengths():
+    """
+    count_accepted_upto(n) равно сумме count_accepted(k) для k <= n.
+    """
+    fa = _even_a()
+
+    assert fa.count_accepted_upto(6) == sum(fa.count_accepted(k) for k in range(7))
+
+
+def test_count_large_length_is_exact():
+    """
+    Для полного автомата над двумя символами все 2^n слов допускаются.
+    """
+    fa = FA_dict()
+    fa.initialState = 0
+    fa.transitionList = [(0, "a", 0), (0, "b", 0)]
+    fa.finalStates = {0}
+
+    assert fa.count_accepted(1000) == 2 ** 1000
+    assert fa.count_accepted_upto(1000) == 2 ** 1001 - 1
+
+
+def test_empty_language_and_negative_length():
+    """
+    Пустой язык дает нули; отрицательная длина - ошибка.
+    """
+    fa = FA_dict()
+    fa.initialState = 0
+    fa.transitionList = [(0, "a", 1)]
+
+    assert fa.count_accepted(1) == 0
+    assert fa.count_accepted_upto(5) == 0
+    with pytest.raises(ValueError):
+        fa.count_accepted(-1)
+
+
+# =========================================================
+# Ранжирование и выборка
+# =========================================================
+
+
+def _accepted(fa, n):
+    """
+    Перечисляет допускаемые слова длины n в лексикографическом порядке.
+    """
+    words = []
+    for word in itertools.product("ab", repeat=n):
+        result = fa.accept_FA(list(word))
+        if result and result[0]:
+            words.append(list(word))
+    return words
+
+
+def test_unrank_enumerates_language_in_order():
+    """
+    unrank перечисляет допускаемые слова лексикографически, rank - обратная функция.
+    """
+    fa = _even_a()
+    words = _accepted(fa, 6)
+
+    assert [fa.unrank(i, 6) for i in range(len(words))] == words
+    assert [fa.rank(word) for word in words] == list(range(len(words)))
+
+
+def test_rank_rejects_words_outside_language():
+    """
+    Недопускаемое слово и номер вне диапазона - ошибки.
+    """
+    fa = _even_a()
+
+    with pytest.raises(ValueError):
+        fa.rank(["a"])
+    with pytest.raises(ValueError):
+        fa.rank(["b", "a"])
+    with pytest.raises(IndexError):
+        fa.unrank(fa.count_accepted(4), 4)
+
+
+def test_sample_accepted_is_uniform_and_reproducible():
+    """
+    Выборка состоит из допускаемых слов, покрывает язык и воспроизводима по rng.
+    """
+    fa = _even_a()
+    words = _accepted(fa, 4)
+
+    sample = fa.sample_accepted(4, 2000, random.Random(1))
+
+    assert sample == fa.sample_accepted(4, 2000, random.Random(1))
+    counts = Counter(tuple(word) for word in sample)
+    assert set(counts) == {tuple(word) for word in words}
+    assert max(counts.values()) < 3 * min(counts.values())
+
+
+def test_sample_from_sparse_language():
+    """
+    Выборка из разреженного языка не требует отбраковки.
+    """
+    fa = FA_dict()
+    fa.initialState = 0
+    fa.transitionList = [(i, s, i + 1) for i in range(30) for s in "ab"] + [
+        (i, "a", i + 1) for i in range(30, 60)
+    ]
+    fa.finalStates = {60}
+
+    words = AcceptedWords(fa, 60)
+
+    assert words.total == 2 ** 30
+    for word in words.sample(5, random.Random(0)):
+        assert fa.accept_FA(word)[0] is True and word[30:] == ["a"] * 30
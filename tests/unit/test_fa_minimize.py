@@ -0,0 +1,171 @@
+"""
+Unit-тесты минимизации автоматов (src/fa_minimize.py).
+
+Проверяем:
+- слияние эквивалентных состояний FSM с учетом выходов
+- сохранение выходных последовательностей
+- минимизацию DFA по F
+- частичные автоматы и отображение состояний
+- отбрасывание недостижимых классов
+"""
+
+import itertools
+
+from src.fa_factory import FA as FA_simple
+
+
+def _fsm(transitions, initial=0):
+    """
+    Создает FSM с заданными переходами.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = initial
+    fa.transitionList = transitions
+    fa.numberOfStates = len({t[0] for t in transitions} | {t[2] for t in transitions})
+    fa.numberOfInputs = len({t[1] for t in transitions})
+    fa.numberOfOutputs = len({t[3] for t in transitions})
+    return fa
+
+
+def test_minimize_merges_equivalent_fsm_states():
+    """
+    Состояния 1 и 2 неразличимы по выходам и должны слиться.
+    """
+    fa = _fsm([
+        (0, 0, 1, 0), (0, 1, 2, 1),
+        (1, 0, 0, 1), (1, 1, 2, 0),
+        (2, 0, 0, 1), (2, 1, 1, 0),
+    ])
+
+    reduced, mapping = fa.minimize()
+
+    assert reduced.numberOfStates == 2
+    assert mapping[1] == mapping[2]
+    assert mapping[0] == 0
+    assert reduced.initialState == 0
+
+
+def test_minimize_preserves_output_sequences():
+    """
+    Приведенный автомат выдает те же реакции на все слова длины <= 4.
+    """
+    fa = _fsm([
+        (0, 0, 1, 0), (0, 1, 3, 1),
+        (1, 0, 2, 1), (1, 1, 0, 0),
+        (2, 0, 1, 1), (2, 1, 0, 0),
+        (3, 0, 2, 0), (3, 1, 3, 1),
+    ])
+
+    reduced, _ = fa.minimize()
+
+    assert reduced.numberOfStates < fa.numberOfStates
+    for length in range(5):
+        for word in itertools.product([0, 1], repeat=length):
+            assert reduced.move_seq_FSM(list(word))[0] == fa.move_seq_FSM(list(word))[0]
+
+
+def test_minimize_keeps_distinguishable_states():
+    """
+    Попарно различимые состояния не сливаются.
+    """
+    fa = _fsm([(0, 0, 1, 0), (1, 0, 2, 0), (2, 0, 0, 1)])
+
+    reduced, mapping = fa.minimize()
+
+    assert reduced.numberOfStates == 3
+    assert sorted(mapping.values()) == [0, 1, 2]
+
+
+def test_minimize_does_not_change_original():
+    """
+    Исходный автомат не изменяется.
+    """
+    transitions = [(0, 0, 1, 0), (1, 0, 0, 0)]
+    fa = _fsm(list(transitions))
+
+    reduced, _ = fa.minimize()
+
+    assert reduced.numberOfStates == 1
+    assert list(map(tuple, fa.transitionList)) == transitions
+
+
+def test_minimize_dfa_uses_final_states():
+    """
+    Для DFA начальное разбиение учитывает принадлежность F.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {1, 2}
+    fa.transitionList = [
+        (0, "a", 1), (0, "b", 2),
+        (1, "a", 1), (1, "b", 2),
+        (2, "a", 1), (2, "b", 2),
+    ]
+
+    reduced, mapping = fa.minimize()
+
+    assert reduced.numberOfStates == 2
+    assert mapping[1] == mapping[2]
+    assert reduced.finalStates == {mapping[1]}
+    assert reduced.accept_FA(["a", "b"])[0] is True
+    assert reduced.accept_FA([])[0] is False
+
+
+def test_minimize_partial_fsm_separates_undefined_inputs():
+    """
+    Состояние с неопределенным входом отличается от полностью определенного.
+    """
+    fa = _fsm([
+        (0, 0, 1, 0), (0, 1, 0, 0),
+        (1, 0, 1, 0),
+    ])
+
+    reduced, mapping = fa.minimize()
+
+    assert mapping[0] != mapping[1]
+    assert reduced.move_seq_FSM([0, 1]) == (None, None)
+
+
+def test_minimize_drops_unreachable_classes():
+    """
+    Классы, недостижимые из начального состояния, в результат не попадают.
+    """
+    fa = _fsm([
+        (0, 0, 1, 0), (1, 0, 0, 1),
+        (2, 0, 3, 1), (3, 0, 2, 1),
+        (4, 0, 0, 1),
+    ])
+
+    reduced, mapping = fa.minimize()
+
+    assert reduced.numberOfStates == 2
+    assert mapping == {0: 0, 1: 1, 4: 1}
+    assert {t[0] for t in reduced.transitionList} == {0, 1}
+
+
+def test_minimize_fsm_read_from_file(tmp_path):
+    """
+    FSM, прочитанный из файла "fsm", минимизируется с сохранением реакций.
+    """
+    file = tmp_path / "redundant.fsm"
+    file.write_text(
+        "F 0\n"
+        "s 3\n"
+        "i 2\n"
+        "o 2\n"
+        "n0 0\n"
+        "p 6\n"
+        "0 0 1 0\n"
+        "0 1 2 1\n"
+        "1 0 0 1\n"
+        "1 1 2 0\n"
+        "2 0 0 1\n"
+        "2 1 1 0\n"
+    )
+    fa = FA_simple.read_FSM(file)
+
+    reduced, _ = fa.minimize()
+
+    assert reduced.numberOfStates == 2
+    assert reduced.move_seq_FSM([0, 1, 1])[0] == fa.move_seq_FSM([0, 1, 1])[0]
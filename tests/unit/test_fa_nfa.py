@@ -0,0 +1,109 @@
+"""
+Unit-тесты NFA и детерминизации (src/fa_nfa.py).
+
+Проверяем:
+- конвертацию EFA с недетерминированными переходами
+- сохранение языка при построении подмножеств
+- счетчики прогресса и ограничение числа состояний
+"""
+
+import itertools
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.fa_nfa import NFA
+
+
+class DummyEFA:
+    """
+    EFA-подобный объект, у которого после отбрасывания предикатов переходы недетерминированы.
+    """
+    def __init__(self):
+        """
+        Инициализирует переходы, начальное и финальные состояния.
+        """
+        T = lambda s1, i, s2: type("T", (), {"state1": s1, "input": i, "state2": s2})
+        self.transitionList = [
+            T(0, "a", 0), T(0, "b", 0), T(0, "a", 1),
+            T(1, "a", 2), T(1, "b", 2),
+        ]
+        self.initialState = 0
+        self.finalStates = {2}
+
+
+def _second_to_last_is_a(word):
+    """
+    Эталонный язык: предпоследний символ равен a.
+    """
+    return len(word) >= 2 and word[-2] == "a"
+
+
+def test_fa_dict_rejects_nondeterministic_efa():
+    """
+    Исходная проблема: FA_dict не принимает недетерминированные переходы.
+    """
+    with pytest.raises(ValueError):
+        FA_dict.from_efa(DummyEFA())
+
+
+def test_determinize_preserves_language():
+    """
+    DFA принимает те же слова, что и NFA.
+    """
+    nfa = NFA.from_efa(DummyEFA())
+
+    dfa = nfa.determinize()
+
+    for length in range(6):
+        for word in itertools.product("ab", repeat=length):
+            word = list(word)
+            assert nfa.accept(word) == _second_to_last_is_a(word)
+            result = dfa.accept_FA(word)
+            assert bool(result and result[0]) == nfa.accept(word)
+
+
+def test_determinize_explores_reachable_subsets_only():
+    """
+    Для языка "предпоследний символ a" достаточно 4 подмножеств из 8.
+    """
+    dfa = NFA.from_efa(DummyEFA()).determinize()
+
+    assert dfa.initialState == 0
+    assert len(dfa.states) == 4
+    assert dfa.is_complete()
+
+
+def test_determinize_progress_counters():
+    """
+    Счетчики прогресса передаются в callback и сохраняются в NFA.
+    """
+    nfa = NFA.from_efa(DummyEFA())
+    reports = []
+
+    nfa.determinize(progress=reports.append, progress_every=2)
+
+    assert reports[-1]["explored"] == 4
+    assert nfa.determinization_stats["discovered"] == 4
+    assert nfa.determinization_stats["transitions"] == 8
+
+
+def test_determinize_state_cap():
+    """
+    Превышение max_states прерывает построение.
+    """
+    with pytest.raises(ValueError):
+        NFA.from_efa(DummyEFA()).determinize(max_states=2)
+
+
+def test_subset_states_and_multiple_initial_states():
+    """
+    Несколько начальных состояний объединяются в начальное подмножество.
+    """
+    nfa = NFA.from_transitions([("p", "x", "r"), ("q", "y", "r")], ["p", "q"], ["r"])
+
+    dfa = nfa.determinize()
+
+    assert nfa.subset_states(nfa.initialStates) == ["p", "q"]
+    assert dfa.accept_FA(["x"])[0] is True
+    assert dfa.accept_FA(["y"])[0] is True
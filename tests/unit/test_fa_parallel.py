@@ -0,0 +1,78 @@
+"""
+Unit-тесты параллельного разбора FSM-файлов (src/fa_parallel.py).
+
+Проверяем:
+- границы кусков приходятся на концы строк и покрывают весь файл
+- совпадение результата с FA_dict.read_FSM в одном и нескольких процессах
+- заголовок, короткие строки и проверку согласованности
+"""
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.fa_parallel import read_FSM_parallel, split_chunks
+
+FSM_TEXT = "F 0\ns 4\ni 2\no 2\nn0 0\np 8\n" + "".join(
+    f"{s} {a} {(s + a + 1) % 4} {(s * a) % 2}\n" for s in range(4) for a in range(2)
+)
+
+
+def _same(a, b):
+    """
+    Сравнивает автоматы по переходам, Q, Sigma и заголовку.
+    """
+    assert list(a.transitionList) == list(b.transitionList)
+    assert a.states == b.states and a.inputs == b.inputs
+    assert a.initialState == b.initialState and a.isFSM == b.isFSM
+    assert (a.numberOfStates, a.numberOfInputs, a.numberOfOutputs) == (
+        b.numberOfStates,
+        b.numberOfInputs,
+        b.numberOfOutputs,
+    )
+
+
+def test_split_chunks_ends_on_line_boundaries(tmp_path):
+    """
+    Куски идут подряд, покрывают файл и заканчиваются переводом строки.
+    """
+    path = tmp_path / "machine.fsm"
+    path.write_text(FSM_TEXT)
+    data = path.read_bytes()
+
+    chunks = split_chunks(path, 10)
+
+    assert len(chunks) > 1
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in chunks)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_read_matches_read_FSM(workers, tmp_path):
+    """
+    Результат совпадает с последовательным read_FSM при любом числе кусков.
+    """
+    path = tmp_path / "machine.fsm"
+    path.write_text(FSM_TEXT)
+
+    fa = read_FSM_parallel(path, workers=workers, chunk_size=16)
+
+    _same(fa, FA_dict.read_FSM(path))
+    assert fa.move_seq_FSM([0, 1, 1]) == FA_dict.read_FSM(path).move_seq_FSM([0, 1, 1])
+
+
+def test_parallel_read_keeps_malformed_rows_and_partial_outputs(tmp_path, capsys):
+    """
+    Короткие строки и переходы без выхода сохраняются; несогласованный заголовок сообщается.
+    """
+    path = tmp_path / "odd.fsm"
+    path.write_text("s 5\ni 2\no 1\nn0 q\n0 a 1 x\n1 a 0\n\n7\n1 b q x\n")
+
+    fa = read_FSM_parallel(path, workers=1, chunk_size=8)
+    parallel_out = capsys.readouterr().out
+    expected = FA_dict.read_FSM(path)
+    sequential_out = capsys.readouterr().out
+
+    _same(fa, expected)
+    assert fa._malformed_transitions == expected._malformed_transitions == [(7,)]
+    assert parallel_out == sequential_out == "Error: fsm file is not consistent\n"
@@ -0,0 +1,137 @@
+"""
+Unit-тесты компактного состояния pickle (src/fa_pickle.py).
+
+Проверяем:
+- точный round-trip FA_dict и FA_simple через pickle и deepcopy
+- сохранение типов значений, строк-списков, некорректных переходов и хранилища
+- запасной вариант для значений, которые нельзя поместить в таблицу символов
+- размер состояния по сравнению с прежним словарем атрибутов
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.FA_simple import FA_simple
+from src.fa_pickle import _plain_state
+
+
+def _dict_fa(storage="tuple"):
+    """
+    Создает FA_dict с выходами, частичными переходами и лишними состояниями.
+    """
+    fa = FA_dict(storage=storage)
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = [(s, a, (s + a + 1) % 6, (s * a) % 3) for s in range(6) for a in range(2)]
+    fa.states.update({6, 7})
+    fa.numberOfStates = 8
+    return fa
+
+
+def _same_dict_fa(a, b):
+    """
+    Сравнивает FA_dict по всем компонентам, которые видит пользователь.
+    """
+    assert list(a.transitionList) == list(b.transitionList)
+    assert a.states == b.states and a.inputs == b.inputs
+    assert a.finalStates == b.finalStates and a.initialState == b.initialState
+    assert (a.isFSM, a.numberOfStates, a.numberOfInputs, a.numberOfOutputs) == (
+        b.isFSM,
+        b.numberOfStates,
+        b.numberOfInputs,
+        b.numberOfOutputs,
+    )
+    assert a.storage == b.storage and a._ordinal == b._ordinal
+
+
+@pytest.mark.parametrize("storage", ["tuple", "nested", "dense", "csr"])
+def test_fa_dict_pickle_round_trip(storage):
+    """
+    FA_dict восстанавливается без потерь на любом хранилище и остается рабочим.
+    """
+    fa = _dict_fa(storage)
+
+    restored = pickle.loads(pickle.dumps(fa))
+
+    _same_dict_fa(restored, fa)
+    assert restored.move_seq_FSM([0, 1, 1]) == fa.move_seq_FSM([0, 1, 1])
+    restored.complete()
+    assert restored.is_complete() and not fa.is_complete()
+
+
+def test_fa_dict_keeps_value_types_and_malformed_rows():
+    """
+    1, True и "1" остаются разными символами; переходы без выхода и короткие строки сохраняются.
+    """
+    fa = FA_dict()
+    fa.initialState = "1"
+    fa.finalStates = {True}
+    fa.transitionList = [("1", 1, True), (True, 1, 1.0), (1.0, "a", "1", "x"), (0,)]
+    fa.note = "extra attribute"
+
+    restored = copy.deepcopy(fa)
+
+    _same_dict_fa(restored, fa)
+    assert [type(part) for tr in restored.transitionList for part in tr] == [
+        type(part) for tr in fa.transitionList for part in tr
+    ]
+    assert restored.note == "extra attribute"
+
+
+def test_fa_simple_pickle_round_trip():
+    """
+    Строки-списки из read_FSM и кортежи разной длины восстанавливаются как есть.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = [["0", "0", "1", "1"], ("1", "0", "0"), ["1", "1", "1", "0"]]
+    fa.numberOfStates, fa.numberOfInputs, fa.numberOfOutputs = 2, 2, 2
+
+    restored = pickle.loads(pickle.dumps(fa))
+
+    assert restored.transitionList == fa.transitionList
+    assert [type(tr) for tr in restored.transitionList] == [list, tuple, list]
+    assert not hasattr(restored, "finalStates")
+    assert restored.move_seq_FSM(["0", "1"]) == fa.move_seq_FSM(["0", "1"])
+
+
+def test_unhashable_values_fall_back_to_plain_state():
+    """
+    Нехешируемые значения переходов передаются обычным словарем атрибутов.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.finalStates = {1}
+    fa.transitionList = [(0, "a", 1, ["not", "hashable"])]
+
+    restored = pickle.loads(pickle.dumps(fa))
+
+    assert restored.transitionList == fa.transitionList
+    assert restored.finalStates == {1}
+
+    fa = FA_dict()
+    fa.transitionList = [(0, "a", 1), (["not", "hashable"],)]
+    fa.accept_FA(["a"])
+
+    restored = pickle.loads(pickle.dumps(fa))
+
+    _same_dict_fa(restored, fa)
+    assert restored.accept_FA(["a"]) == fa.accept_FA(["a"])
+
+
+def test_pickle_is_smaller_than_attribute_dict():
+    """
+    Колонки занимают в pickle заметно меньше, чем прежний словарь атрибутов.
+    """
+    fa = FA_dict()
+    fa.transitionList = [(s, a, (7 * s + a) % 2000) for s in range(2000) for a in range(4)]
+    fa.access_sequences()
+
+    compact = len(pickle.dumps(fa))
+    plain = len(pickle.dumps(_plain_state(fa)))
+
+    assert compact * 2 < plain
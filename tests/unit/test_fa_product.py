@@ -0,0 +1,142 @@
+"""
+Unit-тесты ленивых произведений автоматов (src/fa_product.py).
+
+Проверяем:
+- пересечение, объединение, разность и дополнение на словах
+- LRU-кэш переходов
+- материализацию только достижимых пар
+"""
+
+import itertools
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.fa_product import LazyProduct, complement, difference, intersection, union
+
+
+def _dfa(transitions, final_states, initial=0):
+    """
+    Создает FA_dict с заданными переходами и допускающими состояниями.
+    """
+    fa = FA_dict()
+    fa.initialState = initial
+    fa.finalStates = set(final_states)
+    fa.transitionList = transitions
+    return fa
+
+
+def _even_a():
+    """
+    Слова с четным числом символов a.
+    """
+    return _dfa([(0, "a", 1), (0, "b", 0), (1, "a", 0), (1, "b", 1)], {0})
+
+
+def _ends_with_b():
+    """
+    Слова, оканчивающиеся на b (частичный автомат: из 1 нет перехода по a).
+    """
+    return _dfa([(0, "a", 0), (0, "b", 1), (1, "b", 1)], {1})
+
+
+def _accepts(fa, word):
+    """
+    Возвращает принятие слова, считая отсутствующий переход отвержением.
+    """
+    result = fa.accept_FA(word)
+    return bool(result and result[0])
+
+
+WORDS = [
+    list(word)
+    for length in range(5)
+    for word in itertools.product("ab", repeat=length)
+]
+
+
+@pytest.mark.parametrize(
+    "build, expected",
+    [
+        (intersection, lambda x, y: x and y),
+        (union, lambda x, y: x or y),
+        (difference, lambda x, y: x and not y),
+    ],
+)
+def test_binary_products_match_componentwise_semantics(build, expected, capsys):
+    """
+    Принятие произведением совпадает с булевой комбинацией принятий компонентов.
+    """
+    a, b = _even_a(), _ends_with_b()
+    product = build(a, b)
+
+    for word in WORDS:
+        assert product.accept_FA(word)[0] == expected(_accepts(a, word), _accepts(b, word))
+    capsys.readouterr()
+
+
+def test_complement_accepts_rejected_words(capsys):
+    """
+    Дополнение принимает ровно отвергнутые слова, включая попавшие в sink.
+    """
+    b = _ends_with_b()
+    product = complement(b)
+
+    for word in WORDS:
+        assert product.accept_FA(word)[0] == (not _accepts(b, word))
+    capsys.readouterr()
+
+
+def test_run_words_streams_results():
+    """
+    run_words выдает признаки принятия по одному на слово.
+    """
+    product = intersection(_even_a(), _ends_with_b())
+
+    assert list(product.run_words([["b"], ["a", "b"], ["a", "a", "b"]])) == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_memo_is_bounded_lru():
+    """
+    Кэш переходов не превышает memo_size.
+    """
+    product = union(_even_a(), _ends_with_b(), memo_size=2)
+
+    for word in WORDS:
+        product.accept_FA(word)
+
+    assert len(product._memo) <= 2
+
+
+def test_materialize_contains_only_reachable_live_pairs():
+    """
+    Материализованное пересечение эквивалентно ленивому и не содержит мертвых пар.
+    """
+    product = intersection(_even_a(), _ends_with_b())
+
+    fa = product.materialize()
+
+    assert all(None not in state for state in fa.states)
+    assert len(fa.states) <= 4
+    for word in WORDS:
+        assert _accepts(fa, word) == product.accept_FA(word)[0]
+
+
+def test_materialize_respects_state_cap():
+    """
+    Превышение max_states приводит к ValueError.
+    """
+    with pytest.raises(ValueError):
+        union(_even_a(), _ends_with_b()).materialize(max_states=1)
+
+
+def test_unknown_operation():
+    """
+    Неизвестная операция отклоняется.
+    """
+    with pytest.raises(ValueError):
+        LazyProduct(_even_a(), _ends_with_b(), "xor")
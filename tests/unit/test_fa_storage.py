@@ -0,0 +1,144 @@
+"""
+Unit-тесты хранилищ функции переходов (src/fa_storage.py).
+
+Проверяем:
+- одинаковое поведение всех хранилищ как отображения (состояние, вход) -> значение
+- рост плотной таблицы и слияние буфера CSR
+- счетчик изменений version
+- автоматический выбор между tuple и nested по средней степени состояний
+- совпадение поведения FA_dict на любом хранилище
+"""
+
+import random
+
+import pytest
+
+from src.FA_dict import FA_dict
+from src.fa_storage import STORAGES, CSRStorage, DenseStorage, choose_storage, make_storage
+
+
+@pytest.mark.parametrize("name", sorted(STORAGES))
+def test_storage_behaves_like_dict(name):
+    """
+    Случайная последовательность записей, удалений и поисков совпадает со словарем.
+    """
+    rng = random.Random(name)
+    storage = make_storage(name)
+    expected = {}
+
+    for _ in range(3000):
+        key = (rng.randrange(40), rng.randrange(6))
+        if rng.random() < 0.3:
+            assert storage.pop(key, None) == expected.pop(key, None)
+        else:
+            value = rng.randrange(40)
+            storage[key] = value
+            expected[key] = value
+        probe = (rng.randrange(40), rng.randrange(6))
+        assert (probe in storage) == (probe in expected)
+        assert storage.lookup(*probe) == expected.get(probe)
+
+    assert len(storage) == len(expected)
+    assert dict(storage.items()) == expected
+    assert storage == expected
+
+
+@pytest.mark.parametrize("name", sorted(STORAGES))
+def test_storage_version_counts_every_change(name):
+    """
+    Запись, перезапись и удаление увеличивают version; чтение его не меняет.
+    """
+    storage = make_storage(name, {(0, 0): 1})
+    versions = [storage.version]
+
+    storage[(0, 1)] = 2
+    versions.append(storage.version)
+    storage[(0, 1)] = 3
+    versions.append(storage.version)
+    del storage[(0, 0)]
+    versions.append(storage.version)
+    storage.pop((0, 1))
+    versions.append(storage.version)
+
+    assert versions == sorted(set(versions))
+    assert storage.get((0, 1)) is None and storage.lookup(0, 1) is None
+    assert storage.version == versions[-1]
+
+
+def test_dense_storage_grows_and_rejects_foreign_keys():
+    """
+    Плотная таблица расширяется под новые индексы и не принимает нецелые ключи.
+    """
+    storage = DenseStorage({(0, 0): 1}, states=1, width=1)
+
+    storage[(5, 3)] = 0
+
+    assert storage[(0, 0)] == 1 and storage[(5, 3)] == 0
+    assert (storage._height, storage._width) == (6, 4)
+    storage[(0, 4)] = 2
+    assert storage._width == 8 and storage[(0, 4)] == 2 and storage[(5, 3)] == 0
+    assert ("a", 0) not in storage and (-1, 0) not in storage
+    with pytest.raises(TypeError):
+        storage[("a", 0)] = 1
+
+
+def test_csr_storage_compacts_pending_writes():
+    """
+    Записи из буфера CSR после compact переходят в колонки без потерь.
+    """
+    storage = CSRStorage({(s, a): s for s in range(10) for a in "ab"})
+    storage[(3, "c")] = 7
+    del storage[(4, "a")]
+
+    storage.compact()
+
+    assert not storage._pending
+    assert storage[(3, "c")] == 7 and (4, "a") not in storage
+    assert len(storage) == 20
+
+
+def test_choose_storage_by_degree():
+    """
+    Большие степени идут во вложенные словари; dense и csr автоматически не выбираются.
+    """
+    dense = {(s, a): 0 for s in range(10) for a in range(3)}
+    wide = {(f"q{s}", f"x{a}"): 0 for s in range(4) for a in range(10)}
+    sparse = {(f"q{s}", "x"): 0 for s in range(10)}
+
+    assert choose_storage(dense) == "tuple"
+    assert choose_storage(wide) == "nested"
+    assert choose_storage(sparse) == "tuple"
+    assert choose_storage({}) == "tuple"
+
+
+@pytest.mark.parametrize("name", sorted(STORAGES) + ["auto"])
+def test_fa_dict_on_every_storage(name):
+    """
+    FA_dict дает одинаковые результаты при любом хранилище.
+    """
+    transitions = [(s, a, (s * 3 + a) % 7, a) for s in range(7) for a in range(3)]
+    reference = FA_dict()
+    reference.transitionList = transitions
+    reference.finalStates = {0, 5}
+    fa = FA_dict(storage=name)
+    fa.transitionList = transitions
+    fa.finalStates = {0, 5}
+
+    word = [2, 1, 0, 2, 2, 1]
+    assert fa.accept_FA(word) == reference.accept_FA(word)
+    assert fa.is_complete() and fa == reference
+    assert list(fa.transitionList) == list(reference.transitionList)
+    assert fa.storage == (choose_storage(fa.transitions) if name == "auto" else name)
+
+    fa.use_storage("tuple")
+    assert fa.storage == "tuple" and fa == reference
+
+
+def test_unknown_storage_is_rejected():
+    """
+    Неизвестное имя хранилища - ошибка.
+    """
+    with pytest.raises(ValueError):
+        FA_dict(storage="btree")
+    with pytest.raises(ValueError):
+        FA_dict().use_storage("btree")
@@ -0,0 +1,244 @@
+"""
+Unit-тесты генерации конформных тестов (src/fa_testgen.py).
+
+Проверяем:
+- покрытие состояний и характеристическое множество
+- W- и Wp-наборы: отсутствие префиксов, обнаружение мутантов
+- параллельное построение набора
+- потоковую выдачу: тест выдается до построения тестов всех слов покрытия
+- обход переходов: покрытие всех достижимых переходов
+"""
+
+import pytest
+
+from src.fa_factory import FA as FA_simple
+from src.fa_testgen import (
+    _leaves,
+    _merge_runs,
+    characterization_set,
+    conformance_suite,
+    state_cover,
+    state_identifiers,
+    transition_tour,
+)
+
+TRANSITIONS = [
+    (0, "a", 1, 0), (0, "b", 0, 1),
+    (1, "a", 2, 0), (1, "b", 0, 0),
+    (2, "a", 0, 1), (2, "b", 1, 1),
+]
+
+
+def _fsm(transitions):
+    """
+    Создает FSM с начальным состоянием 0.
+    """
+    fa = FA_simple()
+    fa.isFSM = 1
+    fa.initialState = 0
+    fa.transitionList = transitions
+    return fa
+
+
+def _outputs(fa, word):
+    """
+    Возвращает выходную последовательность автомата на слове.
+    """
+    return fa.move_seq_FSM(word)[0]
+
+
+def test_state_cover_reaches_every_state():
+    """
+    Покрытие состояний содержит кратчайшее слово для каждого состояния.
+    """
+    cover = state_cover(_fsm(TRANSITIONS))
+
+    assert cover == [[], ["a"], ["a", "a"]]
+
+
+def test_characterization_set_distinguishes_all_states():
+    """
+    Любые два состояния имеют различную реакцию на некоторое слово из W.
+    """
+    w = characterization_set(_fsm(TRANSITIONS))
+
+    reactions = []
+    for start in range(3):
+        fa = _fsm(TRANSITIONS)
+        fa.initialState = start
+        reactions.append(tuple(tuple(_outputs(fa, word)) for word in w))
+
+    assert len(set(reactions)) == 3
+
+
+def test_state_identifiers_are_subsets_of_w():
+    """
+    Идентификаторы состояний состоят из слов W.
+    """
+    fa = _fsm(TRANSITIONS)
+    w = characterization_set(fa)
+
+    identifiers = state_identifiers(fa)
+
+    assert set(identifiers) == {0, 1, 2}
+    for words in identifiers.values():
+        assert words and all(word in w for word in words)
+
+
+def test_suite_has_no_prefix_redundancy():
+    """
+    Ни один тест не является префиксом другого теста.
+    """
+    suite = [tuple(word) for word in conformance_suite(_fsm(TRANSITIONS), k=2)]
+
+    assert len(suite) == len(set(suite))
+    for x in suite:
+        for y in suite:
+            assert x == y or x != y[:len(x)]
+
+
+@pytest.mark.parametrize("method", ["W", "Wp"])
+def test_suite_kills_output_and_transfer_mutants(method):
+    """
+    Набор обнаруживает мутанты выхода и перехода.
+    """
+    fa = _fsm(TRANSITIONS)
+    suite = list(conformance_suite(fa, k=1, method=method))
+
+    for index in range(len(TRANSITIONS)):
+        s, a, d, o = TRANSITIONS[index]
+        output_mutant = list(TRANSITIONS)
+        output_mutant[index] = (s, a, d, 1 - o)
+        transfer_mutant = list(TRANSITIONS)
+        transfer_mutant[index] = (s, a, (d + 1) % 3, o)
+        for mutant in (output_mutant, transfer_mutant):
+            mutant_fa = _fsm(mutant)
+            assert any(_outputs(fa, w) != _outputs(mutant_fa, w) for w in suite)
+
+
+def test_wp_suite_is_not_larger_than_w_suite():
+    """
+    Wp-набор не длиннее W-набора.
+    """
+    fa = _fsm(TRANSITIONS)
+
+    w_total = sum(len(w) for w in conformance_suite(fa, k=2, method="W"))
+    wp_total = sum(len(w) for w in conformance_suite(fa, k=2, method="Wp"))
+
+    assert wp_total <= w_total
+
+
+def test_parallel_suite_matches_sequential():
+    """
+    Параллельное построение дает тот же набор тестов.
+    """
+    fa = _fsm(TRANSITIONS)
+
+    sequential = sorted(map(tuple, conformance_suite(fa, k=2)))
+    parallel = sorted(map(tuple, conformance_suite(fa, k=2, processes=2)))
+
+    assert parallel == sequential
+
+
+def test_suite_streams_sorted_leaves_lazily():
+    """
+    Слово выдается до чтения серий с большими началами; префиксы следующих слов отбрасываются.
+    """
+    consumed = []
+
+    def runs():
+        for start, run in [
+            ((0,), [(0,), (0, 0), (0, 1)]),
+            ((0, 1), [(0, 1, 0)]),
+            ((1,), [(1, 0)]),
+            ((2,), [(2, 0)]),
+        ]:
+            consumed.append(start)
+            yield start, run
+
+    stream = _leaves(_merge_runs(runs()))
+
+    assert next(stream) == (0, 0)
+    assert consumed == [(0,), (0, 1), (1,)]
+    assert list(stream) == [(0, 1, 0), (1, 0), (2, 0)]
+
+
+def test_suite_requires_fsm():
+    """
+    Для полуавтомата W-метод не определен.
+    """
+    fa = FA_simple()
+    fa.transitionList = [(0, "a", 0)]
+    fa.finalStates = {0}
+
+    with pytest.raises(ValueError):
+        list(conformance_suite(fa))
+
+
+# =========================================================
+# Обход переходов
+# =========================================================
+
+
+def _acceptor(transitions):
+    """
+    Создает полуавтомат с начальным состоянием 0 и финальным состоянием 0.
+    """
+    fa = FA_simple()
+    fa.initialState = 0
+    fa.transitionList = transitions
+    fa.finalStates = {0}
+    return fa
+
+
+def _fired(fa, words):
+    """
+    Возвращает номера переходов, сработавших на словах.
+    """
+    fired = set()
+    for word in words:
+        fired.update(fa.accept_FA(word)[1])
+    return fired
+
+
+def test_transition_tour_is_single_word_for_strongly_connected():
+    """
+    Для сильно связного автомата обход - одно слово, покрывающее все переходы.
+    """
+    fa = _fsm(TRANSITIONS)
+    fa.finalStates = {0}
+
+    tour = transition_tour(fa)
+
+    assert len(tour) == 1
+    assert _fired(fa, tour) == set(range(len(TRANSITIONS)))
+    assert len(tour[0]) < 2 * len(TRANSITIONS)
+
+
+def test_transition_tour_is_eulerian_when_balanced():
+    """
+    Для эйлерова графа длина обхода равна числу переходов.
+    """
+    fa = _acceptor([(0, "a", 1), (1, "a", 2), (2, "a", 0), (0, "b", 0)])
+
+    tour = transition_tour(fa)
+
+    assert [len(word) for word in tour] == [4]
+
+
+def test_transition_tour_restarts_and_skips_unreachable():
+    """
+    Несвязный граф покрывается несколькими словами; недостижимые переходы пропускаются.
+    """
+    transitions = [
+        (0, "a", 1), (0, "b", 2),
+        (1, "a", 1),
+        (2, "a", 2),
+        (3, "a", 0),
+    ]
+    fa = _acceptor(transitions)
+
+    tour = transition_tour(fa)
+
+    assert len(tour) == 2
+    assert _fired(fa, tour) == {0, 1, 2, 3}